@@ -0,0 +1,39 @@
+# api_server.py
+"""
+퀴즈·채점 HTTP API 서버
+
+Streamlit 없이 같은 질문 은행과 채점 엔진으로 퀴즈를 진행한다 (엔드포인트는 src/api.py 참고).
+외부 패키지 없이 내장 ASGI 서버로 실행하며, uvicorn 등이 있으면 `uvicorn src.api:app`도 된다.
+
+사용 예:
+    python api_server.py --port 8000
+    curl -s -X POST localhost:8000/quiz -d '{"audience": "general"}'
+"""
+
+import argparse
+import sys
+
+from src.api import create_app
+from src.asgi_server import run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quick-MBTI 퀴즈·채점 API 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="포트 (0이면 빈 포트)")
+    args = parser.parse_args(argv)
+
+    def ready(server):
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"✅ http://{host}:{port} 에서 대기 중 (Ctrl+C로 종료)", flush=True)
+
+    try:
+        run(create_app(), args.host, args.port, ready)
+    except (OSError, RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,16 @@
-import json, random
 import streamlit as st
 
+from src.question_bank import watch_shared_bank
+from src.bank_shards import get_shared_shards, get_audience_bank
+from src.session import QuizSession
+from src.session_store import new_session_token
+from src.session_registry import get_session_registry
+from src.event_log import get_event_logger
+from src.resume_token import encode_resume_token, decode_resume_token
+from src.quiz_plan import new_plan_seed, build_quiz_plan, start_quiz, next_reserve
+from src.result_pages import get_result_pages
+from src.config import AppConfig
+
 # ----------------------- 기본 셋업 -----------------------
 st.set_page_config(page_title="Quick-MBTI : 빠르게 MBTI를 알려줍니다", layout="centered")
 
@@ -12,88 +22,60 @@ POLES = {
     "JP": ("J", "P"),
 }
 
-COMMON_TIPS = [
-    "생활: 에너지 패턴을 이해하고 휴식 규칙을 마련하세요.",
-    "일: 강점 역할을 명확히 하고 협업 방식을 합의하세요.",
-    "인간관계: 기대·경계를 공유하고 피드백을 정례화하세요.",
-    "학습: 목표를 단계로 나눠 진행률을 가시화하세요.",
-]
-
-MEANINGS = [
-    ("E (Extraversion, 외향)", "사람들과의 교류·활동에서 에너지를 얻고, 외부 자극에 적극적으로 반응함"),
-    ("I (Introversion, 내향)", "고요한 시간과 혼자만의 몰입에서 에너지를 회복하고, 신중한 내적 성찰을 선호함"),
-    ("S (Sensing, 감각)", "현재의 구체적 사실·경험을 중시하고, 실용적이고 현실적인 정보에 신뢰를 둠"),
-    ("N (Intuition, 직관)", "패턴·가능성과 같은 추상적 연결을 중시하고, 미래지향적 아이디어를 선호함"),
-    ("T (Thinking, 사고)", "논리·일관성·원칙에 따라 판단하고, 공정한 기준을 우선함"),
-    ("F (Feeling, 감정)", "사람·가치·관계의 조화를 중시하고, 공감과 배려를 판단에 반영함"),
-    ("J (Judging, 판단)", "계획적·체계적으로 일을 정리하고, 마감과 규칙을 선호함"),
-    ("P (Perceiving, 인식)", "상황에 맞춰 유연하게 적응하며, 열린 선택지를 유지하는 것을 선호함"),
-]
-
-# ----------------------- 유틸 -----------------------
-def filter_by_audience(bank, aud):
-    out = {ax: [] for ax in AXES}
-    for ax in AXES:
-        for q in bank.get(ax, []):
-            tag = q.get("audience")
-            if not tag or tag == "both" or tag == aud:
-                out[ax].append(q)
-    return out
-
-def sample_two(lst):
-    idx = list(range(len(lst)))
-    random.shuffle(idx)
-    if len(idx) >= 2:
-        return [lst[idx[0]], lst[idx[1]]]
-    elif len(idx) == 1:
-        return [lst[idx[0]], lst[idx[0]]]
-    return []
-
-def compute_counts(answer_list):
-    counts = dict(E=0,I=0,S=0,N=0,T=0,F=0,J=0,P=0)
-    totals = dict(EI=0,SN=0,TF=0,JP=0)
-    for a in answer_list:
-        v = a["value"]
-        if v in counts: counts[v]+=1
-        totals[a["axis"]] += 1
-    return counts, totals
-
-def format_type(tokens_by_axis):
-    return "".join(tokens_by_axis[ax] for ax in AXES)
-
-def percent(a, b):
-    tot = a + b
-    if tot == 0: return (0, 0)
-    pa = int(round(a * 100.0 / tot))
-    pb = 100 - pa
-    return (pa, pb)
-
 # ----------------------- 상태 초기화 -----------------------
+# 퀴즈 세션은 st.session_state가 아니라 프로세스 레지스트리에 토큰으로 보관
+# (오래 쉬거나 메모리 예산을 넘으면 저장소로 내보내고, 다음 요청 때 복원)
+REGISTRY = get_session_registry()
+
+# 사용자 이벤트는 공유 대기열에 넣기만 하고 백그라운드 스레드가 모아서 기록
+EVENTS = get_event_logger()
+
+# 결과 페이지 캐시 (처음 불릴 때 도달 가능한 결과를 모두 렌더링해 둠)
+RESULT_PAGES = get_result_pages()
+
 def reset_state():
-    st.session_state.base = []
-    st.session_state.base_ids = []
-    st.session_state.used = {ax:set() for ax in AXES}
-    st.session_state.answers = {}
-    st.session_state.extra = []
+    # 문항은 은행의 (축, qid)만, 답변은 축별 비트필드만 보관 (문구/라벨은 렌더링 때 은행에서 조회)
+    quiz = QuizSession(st.session_state.mode)
+    REGISTRY.put(st.session_state.token, quiz)
+    st.session_state.pop("bank", None)
     st.session_state.result_ready = False
     st.session_state.submitted = False
+    return quiz
 
 if "mode" not in st.session_state:
     st.session_state.mode = "general"
-if "base" not in st.session_state:
-    reset_state()
 
-# ----------------------- 데이터 로드 -----------------------
-try:
-    with open("questions_bank.json","r",encoding="utf-8") as f:
-        DATA = json.load(f)
-except Exception as e:
-    st.error(f"questions_bank.json 파일을 열 수 없습니다: {e}")
-    st.stop()
+def resume_from_query():
+    # 재개 토큰에 담긴 상태로 세션 재구성 (손상됐거나 은행이 바뀌었으면 None)
+    code = st.query_params.get(AppConfig.RESUME_QUERY_PARAM)
+    if not code:
+        return None
+    try:
+        return decode_resume_token(code, get_audience_bank)
+    except Exception:
+        return None
+
+# URL의 세션 토큰으로 워커 재시작·재접속 후에도 진행 중인 퀴즈를 이어서 풂
+# 이 워커에 없는 토큰이면(다른 레플리카·저장소 유실) URL의 재개 토큰으로 복원
+if "token" not in st.session_state:
+    token = st.query_params.get(AppConfig.SESSION_QUERY_PARAM)
+    if not (token and REGISTRY.get(token) is not None):
+        token = new_session_token()
+        resumed = resume_from_query()
+        if resumed is not None:
+            REGISTRY.put(token, resumed)
+    st.session_state.token = token
+    st.query_params[AppConfig.SESSION_QUERY_PARAM] = token
+
+quiz = REGISTRY.get(st.session_state.token)
+if quiz is None:  # 빈 세션도 len()이 0이라 거짓이므로 None과 비교
+    quiz = reset_state()
+st.session_state.mode = quiz.mode
 
 # === 모드 라디오 ===
 def on_mode_change():
     st.session_state.mode = "general" if st.session_state._aud.startswith("일반") else "senior"
+    EVENTS.log("mode", st.session_state.token, st.session_state.mode)
     reset_state()
 
 st.title("Quick-MBTI : 빠르게 MBTI를 알려줍니다")
@@ -107,36 +89,52 @@ st.radio(
     on_change=on_mode_change
 )
 
-bank = filter_by_audience(DATA, st.session_state.mode)
+# ----------------------- 데이터 로드 -----------------------
+# 프로세스 공유 은행: 최초 1회만 파싱·인덱싱, 이후 rerun은 참조만 가져감
+# 샤드 매니페스트가 있으면 선택한 대상의 샤드만 처음 고를 때 읽음 (LRU 보관)
+# 단일 파일은 감시 스레드가 검증 후 통째로 교체 (rerun에서는 파싱/검증 없음)
+try:
+    DATA = get_audience_bank(st.session_state.mode)
+    if get_shared_shards() is None:
+        watch_shared_bank()
+except Exception as e:
+    st.error(f"질문 은행을 열 수 없습니다: {e}")
+    st.stop()
+
+# 새 퀴즈는 최신 은행으로 시작, 진행 중인 세션은 시작 당시 버전을 계속 사용
+# (저장소에서 복원한 세션의 은행이 그 사이 바뀌었으면 qid가 다른 문항을 가리키므로 새로 시작)
+if "bank" not in st.session_state and quiz.bank_version not in ("", DATA.version):
+    quiz = reset_state()
+if not len(quiz) or "bank" not in st.session_state:
+    st.session_state.bank = DATA
+    quiz.bank_version = DATA.version
+bank = st.session_state.bank.pool(st.session_state.mode)
 
 # ----------------------- 기본 8문항 선정 -----------------------
-if not st.session_state.base:
-    base, base_ids, used = [], [], {ax:set() for ax in AXES}
-    for ax in AXES:
-        qs = bank.get(ax, [])
-        if len(qs) < 2:
-            st.error(f"{ax} 축 문항이 2개 미만입니다. JSON을 보강하세요.")
-            st.stop()
-        qA, qB = sample_two(qs)
-        q1 = dict(id=f"base_{ax}_1", axis=ax, **qA)
-        q2 = dict(id=f"base_{ax}_2", axis=ax, **qB)
-        base += [q1, q2]; base_ids += [q1["id"], q2["id"]]
-        used[ax].add(qA["prompt"]); used[ax].add(qB["prompt"])
-    random.shuffle(base)
-    st.session_state.base = base
-    st.session_state.base_ids = base_ids
-    st.session_state.used = used
+# 세션 시드 + 은행 버전 → 기본 문항·순서·축별 예비 문항 (전역 random 미사용, 어디서든 재현)
+if not len(quiz):
+    try:
+        plan = build_quiz_plan(bank, new_plan_seed(), DATA.version)
+    except ValueError as e:
+        st.error(f"{e} JSON을 보강하세요.")
+        st.stop()
+    quiz = start_quiz(plan, st.session_state.mode)
+    REGISTRY.put(st.session_state.token, quiz)
+    EVENTS.log("start", st.session_state.token, {"mode": quiz.mode, "seed": quiz.seed})
 
 # ----------------------- 문항 렌더 -----------------------
-def render_question(q, number):
-    key = f"sel_{q['id']}"
+def render_question(quiz, bank, pos):
+    ax, qid, _ = quiz.item(pos)
+    q = quiz.question(bank, pos)
+    key = f"sel_{ax}_{qid}"
     options = [q["A"]["label"], q["B"]["label"]]
 
-    prev_val = st.session_state.answers[q["id"]]["value"] if q["id"] in st.session_state.answers else None
+    prev = quiz.answer(pos)
+    prev_val = POLES[ax][prev] if prev is not None else None
     default_idx = 0 if prev_val == q["A"]["value"] else 1 if prev_val == q["B"]["value"] else None
 
     # 번호 + 질문 출력
-    st.markdown(f"**{number}) {q['prompt']}**")
+    st.markdown(f"**{pos + 1}) {q['prompt']}**")
 
     choice = st.radio(
         " ",
@@ -154,97 +152,126 @@ def render_question(q, number):
         picked = q["B"]
 
     if picked:
-        st.session_state.answers[q["id"]] = {
-            "axis": q["axis"],
-            "value": picked["value"],
-            "label": picked["label"],
-            "prompt": q["prompt"],
-            "is_extra": q.get("is_extra", False)
-        }
-    elif q["id"] in st.session_state.answers:
-        del st.session_state.answers[q["id"]]
+        if quiz.set_answer(pos, POLES[ax].index(picked["value"])):
+            EVENTS.log("answer", st.session_state.token, (pos, picked["value"]))
+    else:
+        quiz.clear_answer(pos)
 
 # ----------------------- 동률 검사 -----------------------
-def add_tiebreaker_if_needed(ax):
-    a, b = POLES[ax]
-    answers = [v for v in st.session_state.answers.values() if v["axis"]==ax]
-    if len(answers) == 2:  # 기본 2개 다 풀린 경우
-        ca = sum(1 for v in answers if v["value"]==a)
-        cb = sum(1 for v in answers if v["value"]==b)
-        if ca == cb:
-            if not any(q.get("is_extra") and q["axis"]==ax for q in st.session_state.extra):
-                pool = bank.get(ax, [])
-                remain = [q for q in pool if q["prompt"] not in st.session_state.used[ax]]
-                if not remain:
+def add_tiebreaker_if_needed(quiz, bank, ax):
+    # 추가 문항을 넣었으면 True
+    if quiz.total(ax) == 2:  # 기본 2개 다 풀린 경우
+        if quiz.diff(ax) == 0:
+            if not quiz.has_extra(ax):
+                if quiz.seed is not None:
+                    qid = next_reserve(build_quiz_plan(bank, quiz.seed, quiz.bank_version), quiz, ax)
+                else:  # 시드 없이 저장된 이전 세션
+                    drawn = quiz.sampler.draw(bank.get(ax, ()), ax, quiz.used_masks(), 1)
+                    qid = drawn[0]["qid"] if drawn else None
+                if qid is None:
                     st.warning(f"{ax} 축에 추가 문항이 없습니다. JSON을 보강하세요.")
-                    return
-                it = random.choice(remain)
-                qid = f"ex_{ax}_{random.randint(1,10**9)}"
-                st.session_state.extra.append({**it, "id":qid, "axis":ax, "is_extra":True})
-                st.session_state.used[ax].add(it["prompt"])
+                    return False
+                quiz.add_item(ax, qid, is_extra=True)
+                EVENTS.log("tiebreaker", st.session_state.token, ax)
+                return True
+    return False
+
+# ----------------------- 진행 상태 저장 -----------------------
+def save_progress(quiz):
+    # 최종 상태 기록 (저장소 대기열에만 넣고 바로 반환) + 유휴 세션 정리 + 재개 토큰 갱신
+    REGISTRY.touch(st.session_state.token, quiz)
+    resume_code = encode_resume_token(quiz)
+    if st.query_params.get(AppConfig.RESUME_QUERY_PARAM) != resume_code:
+        st.query_params[AppConfig.RESUME_QUERY_PARAM] = resume_code
+
+def progress_text(quiz):
+    return f"남은 미응답 문항: {len(quiz) - quiz.answered_count}개"
+
+# ----------------------- 문항 프래그먼트 -----------------------
+# 문항 하나를 고르면 그 문항만 다시 실행 (페이지 설정·제목·모드 라디오·다른 문항은 그대로)
+# 동률로 추가 문항이 생기거나 제출 가능 여부가 바뀔 때만 전체 재실행
+@st.fragment
+def question_fragment(pos, progress):
+    # 선언 당시 전역을 붙잡지 않도록 세션·은행은 매번 조회 (진행 상태 자리는 인자로 받음)
+    quiz = REGISTRY.get(st.session_state.token)
+    if quiz is None or pos >= len(quiz):
+        return
+    bank = st.session_state.bank.pool(st.session_state.mode)
+    was_complete = quiz.is_complete()
+    render_question(quiz, bank, pos)
+    if st.session_state.get("_full_run", True):
+        return
+
+    ax = quiz.item(pos)[0]
+    if add_tiebreaker_if_needed(quiz, bank, ax) or quiz.is_complete() != was_complete:
+        st.rerun()
+    save_progress(quiz)
+    progress.info(progress_text(quiz))
 
 # ----------------------- 문항 출력 -----------------------
-st.header("문항")
-all_qs = st.session_state.base + st.session_state.extra
-for idx, q in enumerate(all_qs, start=1):
-    render_question(q, idx)
+# 폼 모드(저대역폭 키오스크 등): 라디오를 골라도 서버에 가지 않고 폼 제출 때 한 번에 전송
+FORM_MODE = st.query_params.get(AppConfig.FORM_QUERY_PARAM, "1" if AppConfig.FORM_MODE else "0") == "1"
 
-# 축별로 tie 여부 확인 → 즉시 추가문항 생성
-for ax in AXES:
-    add_tiebreaker_if_needed(ax)
+st.header("문항")
+# 문항 영역 아래의 진행 상태 자리를 문항보다 먼저 만들어 둠 (프래그먼트 재실행이 이 자리를 갱신)
+questions_area = st.container()
+PROGRESS = st.empty()
+
+form_submitted = False
+if FORM_MODE:
+    # 1차 폼: 기본 문항 → 동률 축의 추가 문항을 한 번에 생성 → 2차 폼: 추가 문항
+    for stage, extra in enumerate([False, True], start=1):
+        positions = [pos for pos, _, _, is_extra in quiz.items() if is_extra == extra]
+        if not positions:
+            continue
+        with questions_area, st.form(f"quiz_form_{stage}"):
+            for pos in positions:
+                render_question(quiz, bank, pos)
+            form_submitted |= st.form_submit_button("답변 제출", type="primary")
+        if not extra:
+            for ax in AXES:
+                add_tiebreaker_if_needed(quiz, bank, ax)
+else:
+    # 전체 실행 중 표시 (렌더링 도중 예외·st.rerun()이 나도 다음 프래그먼트 실행이 전체 실행으로 오인하지 않게)
+    st.session_state._full_run = True
+    try:
+        with questions_area:
+            for pos in range(len(quiz)):
+                question_fragment(pos, PROGRESS)
+    finally:
+        st.session_state._full_run = False
+
+    # 축별로 tie 여부 확인 → 추가문항 생성 후 바로 보이도록 다시 실행
+    if any([add_tiebreaker_if_needed(quiz, bank, ax) for ax in AXES]):
+        st.rerun()
+
+save_progress(quiz)
 
 # ----------------------- 제출 버튼 -----------------------
-def all_present_answered():
-    ids = [q["id"] for q in (st.session_state.base + st.session_state.extra)]
-    return all(i in st.session_state.answers for i in ids)
-
-total_qs = len(st.session_state.base + st.session_state.extra)
-answered_qs = len(st.session_state.answers)
-unanswered_count = total_qs - answered_qs
-st.info(f"남은 미응답 문항: {unanswered_count}개")
+PROGRESS.info(progress_text(quiz))
 
-ready_for_submit = all_present_answered()
-submit = st.button("제출", type="primary", disabled=not ready_for_submit)
+ready_for_submit = quiz.is_complete()
+if FORM_MODE:
+    # 마지막 폼 제출로 모든 문항이 채워지면 결과까지 같은 실행에서 보여줌
+    submit = form_submitted and ready_for_submit
+else:
+    submit = st.button("제출", type="primary", disabled=not ready_for_submit)
 
 # ----------------------- 제출 처리 -----------------------
 if submit:
-    cur = [st.session_state.answers[q["id"]] for q in (st.session_state.base + st.session_state.extra)]
-    counts, totals = compute_counts(cur)
-    tokens, per_axis_percent = {}, {}
-
-    for ax in AXES:
-        a, b = POLES[ax]
-        if counts[a] == counts[b]:
-            tokens[ax] = f"({a}{b})"
-        else:
-            tokens[ax] = a if counts[a] > counts[b] else b
-        pa, pb = percent(counts[a], counts[b])
-        per_axis_percent[ax] = (pa, pb, totals[ax])
-
-    disp_type = format_type(tokens)
-
-    st.subheader("결과")
-    st.markdown(f"<h2>{disp_type}</h2>", unsafe_allow_html=True)
-
-    st.markdown("### 축별 선택 비율")
-    for ax in AXES:
-        a, b = POLES[ax]
-        pa, pb, tot = per_axis_percent[ax]
-        st.write(f"- {ax}: {a} {pa}% / {b} {pb}%  (총 {tot}문항)")
-
-    st.subheader("팁")
-    for t in COMMON_TIPS:
-        st.write(t)
-
-    st.subheader("MBTI 의미")
-    for k,v in MEANINGS:
-        st.write(f"- **{k}**: {v}")
-
-    st.subheader("응답 로그")
-    for i,a in enumerate(cur, start=1):
-        tag="추가 " if a.get("is_extra") else ""
-        st.write(f"{i}) [{a['axis']}] {tag}{a['prompt']}")
-        st.write(f"   → 선택: {a['label']} ({a['value']})")
+    # 유형 헤더·축별 비율·팁·의미는 (유형, 응답 수, 로케일)별로 미리 만든 페이지를 그대로 출력
+    page = RESULT_PAGES.page_for({ax: quiz.counts(ax) for ax in AXES}, AppConfig.LOCALE)
+    st.markdown(page.markdown, unsafe_allow_html=True)
+    EVENTS.log("submit", st.session_state.token, page.display_type)
+
+    # 응답 로그만 사용자별로 조립
+    for pos, ax, _, is_extra in quiz.items():
+        q = quiz.question(bank, pos)
+        value = POLES[ax][quiz.answer(pos)]
+        label = q["A"]["label"] if q["A"]["value"] == value else q["B"]["label"]
+        tag="추가 " if is_extra else ""
+        st.write(f"{pos + 1}) [{ax}] {tag}{q['prompt']}")
+        st.write(f"   → 선택: {label} ({value})")
 
     st.session_state.result_ready = True
     st.session_state.submitted = True
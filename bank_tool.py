@@ -0,0 +1,96 @@
+# bank_tool.py
+"""
+질문 은행 관리 도구
+
+사용 예:
+    python bank_tool.py compile questions_bank.json -o questions_bank.qbank
+    python bank_tool.py validate questions_bank.json --json > report.json
+    python bank_tool.py shard questions_bank.json -o question_shards --locale ko
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from src.bank_format import compile_bank_file, CompiledQuestionBank
+from src.bank_validator import StreamingBankValidator
+from src.bank_shards import write_shards
+
+
+def cmd_compile(args):
+    t0 = time.perf_counter()
+    output = args.output or args.source.rsplit(".", 1)[0] + ".qbank"
+    # 검증에 실패하면 ValueError로 끝나고 출력 파일은 쓰지 않음
+    size, version = compile_bank_file(args.source, output)
+    elapsed = time.perf_counter() - t0
+
+    bank = CompiledQuestionBank.open(output)
+    counts = ", ".join(f"{ax} {len(bank[ax])}" for ax in bank)
+    bank.close()
+    print(f"✅ {args.source} → {output} ({size:,} bytes, {elapsed * 1000:.1f} ms, version={version})")
+    print(f"- 문항 수: {counts}")
+
+
+def cmd_validate(args):
+    report = StreamingBankValidator(max_errors=args.max_errors).validate_file(args.source)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    elif report["ok"]:
+        print(f"✅ JSON 검증 통과! ({report['questions']}문항)")
+        for audience, counts in report["counts"].items():
+            print(f"- {audience}: " + ", ".join(f"{ax} {n}" for ax, n in counts.items()))
+    else:
+        for error in report["errors"]:
+            where = f"{args.source}:{error['line']}: " if error["line"] else f"{args.source}: "
+            print(f"❌ {where}[{error['code']}] {error['message']}", file=sys.stderr)
+        if report["truncated"]:
+            print(f"... 오류가 {args.max_errors}건을 넘어 생략되었습니다.", file=sys.stderr)
+    return 0 if report["ok"] else 1
+
+
+def cmd_shard(args):
+    report = StreamingBankValidator().validate_file(args.source)
+    if not report["ok"]:
+        raise ValueError(StreamingBankValidator.summarize(report))
+    with open(args.source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    manifest = write_shards(data, args.output, args.locale)
+
+    written = [s for s in manifest["shards"] if s["locale"] == args.locale]
+    print(f"✅ {args.source} → {args.output} ({len(written)}개 샤드, locale={args.locale})")
+    for shard in written:
+        print(f"- {shard['path']}: {shard['count']}문항")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quick-MBTI 질문 은행 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("compile", help="JSON 질문 은행을 .qbank 바이너리로 컴파일")
+    p.add_argument("source", nargs="?", default="questions_bank.json")
+    p.add_argument("-o", "--output", help="출력 경로 (기본: 원본과 같은 이름의 .qbank)")
+    p.set_defaults(func=cmd_compile)
+
+    p = sub.add_parser("validate", help="질문 은행을 스트리밍으로 검증")
+    p.add_argument("source", nargs="?", default="questions_bank.json")
+    p.add_argument("--json", action="store_true", help="기계 판독용 JSON 리포트 출력")
+    p.add_argument("--max-errors", type=int, default=1000)
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("shard", help="질문 은행을 (대상, 로케일, 축) 샤드로 분할")
+    p.add_argument("source", nargs="?", default="questions_bank.json")
+    p.add_argument("-o", "--output", default="question_shards", help="샤드 디렉터리")
+    p.add_argument("--locale", default="ko")
+    p.set_defaults(func=cmd_shard)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args) or 0
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# benchmarks/bench_adaptive.py
+"""
+적응형 문항 선택 시뮬레이션: 고정 2/4/6 규칙 vs 정보량 기반 선택
+
+축마다 문항 통계(endorse)가 다른 합성 은행을 만들고, 통계대로 답하는 가상 응답자로
+세션당 평균 문항 수·정답률·미해결 비율을 비교한다.
+
+    python benchmarks/bench_adaptive.py --sessions 5000 --items 40
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.adaptive import AdaptiveSelector
+from src.config import AppConfig
+from src.question_manager import QuestionManager
+from src.sampler import QuestionSampler
+
+
+def make_bank(items, rnd, with_stats=True):
+    bank = {}
+    for axis, (a, b) in AppConfig.POLES.items():
+        bank[axis] = []
+        for i in range(items):
+            question = {"prompt": f"{axis} {i}", "A": {"label": a, "value": a}, "B": {"label": b, "value": b}}
+            if with_stats:
+                question["endorse"] = [rnd.uniform(0.55, 0.9), rnd.uniform(0.1, 0.45)]
+            bank[axis].append(question)
+    return bank
+
+
+def answer(question, axis, truth, rnd):
+    """응답자 모형: 문항 통계(없으면 기본값)대로 첫 번째 극을 고름"""
+    a, b = AppConfig.POLES[axis]
+    p_a, p_b = question.get("endorse") or AppConfig.DEFAULT_ITEM_ENDORSEMENT
+    return a if rnd.random() < (p_a if truth[axis] == a else p_b) else b
+
+
+def fixed_session(manager, bank, truth, rnd):
+    """기존 규칙: 기본 2문항, 동점이면 2문항씩 최대 6문항"""
+    config = manager.config
+    sampler = QuestionSampler(rnd)
+    used = {axis: 0 for axis in config.AXES}
+    asked, correct, unresolved = 0, 0, 0
+    for axis in config.AXES:
+        a, b = config.POLES[axis]
+        count = {a: 0, b: 0}
+        step = config.BASE_QUESTIONS_PER_AXIS
+        while True:
+            for question in sampler.draw(bank[axis], axis, used, step):
+                count[answer(question, axis, truth, rnd)] += 1
+                asked += 1
+            if count[a] != count[b] or count[a] + count[b] >= config.MAX_QUESTIONS_PER_AXIS:
+                break
+            step = config.ADDITIONAL_QUESTIONS_PER_AXIS
+        if count[a] == count[b]:
+            unresolved += 1
+        else:
+            correct += (a if count[a] > count[b] else b) == truth[axis]
+    return asked, correct, unresolved
+
+
+def adaptive_session(manager, bank, truth, rnd, selector):
+    config = manager.config
+    state = selector.new_state()
+    used = {axis: 0 for axis in config.AXES}
+    asked = 0
+    while True:
+        question = manager.generate_adaptive_question(bank, state, used, selector)
+        if question is None:
+            break
+        selector.update(state, question["axis"], question, answer(question, question["axis"], truth, rnd))
+        asked += 1
+    correct = unresolved = 0
+    for axis in config.AXES:
+        p = selector.probability(state, axis)
+        if p == 0.5:
+            unresolved += 1
+        else:
+            correct += config.POLES[axis][0 if p > 0.5 else 1] == truth[axis]
+    return asked, correct, unresolved
+
+
+def run(name, fn, sessions, rnd):
+    asked = correct = unresolved = 0
+    t0 = time.perf_counter()
+    for _ in range(sessions):
+        truth = {axis: rnd.choice(poles) for axis, poles in AppConfig.POLES.items()}
+        n, c, u = fn(truth)
+        asked += n
+        correct += c
+        unresolved += u
+    per_session_us = (time.perf_counter() - t0) / sessions * 1e6
+    axes = sessions * len(AppConfig.AXES)
+    print(f"{name:<22} | {asked / sessions:>9.2f} | {correct / axes:>8.1%} | {unresolved / axes:>8.1%} | "
+          f"{per_session_us:>9.0f}")
+    return asked / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--items", type=int, default=40, help="축당 문항 수")
+    parser.add_argument("--confidence", type=float, default=AppConfig.ADAPTIVE_CONFIDENCE)
+    args = parser.parse_args()
+
+    manager = QuestionManager()
+    for label, with_stats in [("문항 통계 있음", True), ("문항 통계 없음(기본값)", False)]:
+        rnd = random.Random(1)
+        bank = {axis: manager._as_pool(qs) for axis, qs in make_bank(args.items, rnd, with_stats).items()}
+        selector = AdaptiveSelector(args.confidence, rng=rnd)
+
+        print(f"\n[{label}] 세션 {args.sessions:,}개, 축당 {args.items}문항, 신뢰도 기준 {args.confidence}")
+        print(f"{'정책':<22} | {'평균 문항':>9} | {'정답률':>8} | {'미해결':>8} | {'세션(us)':>9}")
+        print("-" * 70)
+        fixed = run("고정 2/4/6", lambda t: fixed_session(manager, bank, t, rnd), args.sessions, rnd)
+        adaptive = run("정보량 기반", lambda t: adaptive_session(manager, bank, t, rnd, selector),
+                       args.sessions, rnd)
+        print(f"평균 문항 수 변화: {fixed:.2f} → {adaptive:.2f} ({(adaptive - fixed) / fixed:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
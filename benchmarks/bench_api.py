@@ -0,0 +1,207 @@
+# benchmarks/bench_api.py
+"""
+퀴즈·채점 HTTP API 부하 생성기
+
+api_server.py를 내장 서버로 띄워 서버 프로세스를 CPU 하나에 고정(리눅스)한 뒤,
+keep-alive 연결 여러 개로 시나리오별 요청을 정해진 시간 동안 보내고
+요청 지연 p50/p99와 초당 요청 수, 요청당 서버 CPU 시간을 출력한다.
+
+시나리오:
+    health  GET /health
+    quiz    POST /quiz → POST /quiz/answers (기본 문항) → 추가 문항이 있으면 한 번 더
+    score   POST /score (답변 10개)
+    batch   POST /score/batch (세션 100개)
+
+    python benchmarks/bench_api.py --connections 16 --duration 5
+    python benchmarks/bench_api.py --scenario quiz --url http://127.0.0.1:8000   # 떠 있는 서버 측정
+
+부하 생성기도 같은 머신에서 돌므로 CPU가 하나뿐이면 서버와 CPU를 나눠 쓴다.
+
+측정 예 (CPU 1개 리눅스 샌드박스, 부하 생성기와 CPU 공유, 연결 16개, 시나리오당 5초):
+    health   9,425 req/s, p50  1.66ms, p99   3.82ms, 요청당 서버 CPU 0.06ms
+    score    6,269 req/s, p50  2.42ms, p99   4.54ms, 요청당 서버 CPU 0.08ms
+    quiz     1,964 req/s, p50  7.60ms, p99  13.71ms, 요청당 서버 CPU 0.39ms
+    batch      213 req/s, p50 70.68ms, p99 116.64ms, 요청당 서버 CPU 2.51ms (요청당 세션 100개)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AXES = ["EI", "SN", "TF", "JP"]  # 축 이름의 두 글자가 곧 두 극
+
+
+def cpu_seconds(pid: int) -> float:
+    """프로세스의 누적 user+system CPU 시간 (리눅스 /proc, 없으면 0)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except OSError:
+        return 0.0
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    proc = subprocess.Popen([sys.executable, "api_server.py", "--port", str(port)],
+                            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(proc.pid, {min(os.sched_getaffinity(0))})
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("API 서버가 뜨지 않았습니다.")
+
+
+class Connection:
+    """keep-alive HTTP/1.1 클라이언트 연결 하나"""
+
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, payload=None):
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nhost: {self.host}\r\n"
+            f"content-type: application/json\r\ncontent-length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        data = await self.reader.readexactly(length)
+        if status != 200:
+            raise RuntimeError(f"{method} {path}: {status} {data[:200]!r}")
+        return json.loads(data)
+
+    def close(self):
+        self.writer.close()
+
+
+def random_answers(rnd, count):
+    answers = []
+    for _ in range(count):
+        axis = rnd.choice(AXES)
+        answers.append({"axis": axis, "value": rnd.choice(axis)})
+    return answers
+
+
+async def scenario_health(conn, rnd, timed):
+    await timed(conn.request("GET", "/health"))
+
+
+async def scenario_quiz(conn, rnd, timed):
+    quiz = await timed(conn.request("POST", "/quiz", {"audience": rnd.choice(["general", "senior"])}))
+    questions, token = quiz["questions"], quiz["token"]
+    while questions:
+        answers = [{"position": q["position"], "choice": rnd.choice("AB")} for q in questions]
+        reply = await timed(conn.request("POST", "/quiz/answers", {"token": token, "answers": answers}))
+        questions, token = reply["questions"], reply["token"]
+
+
+async def scenario_score(conn, rnd, timed):
+    await timed(conn.request("POST", "/score", {"answers": random_answers(rnd, 10)}))
+
+
+async def scenario_batch(conn, rnd, timed):
+    sessions = [random_answers(rnd, rnd.randint(8, 12)) for _ in range(100)]
+    await timed(conn.request("POST", "/score/batch", {"sessions": sessions}))
+
+
+SCENARIOS = {"health": scenario_health, "quiz": scenario_quiz, "score": scenario_score, "batch": scenario_batch}
+
+
+async def load(host, port, scenario, connections, duration, seed):
+    latencies = []
+
+    async def timed(awaitable):
+        started = time.perf_counter()
+        result = await awaitable
+        latencies.append(time.perf_counter() - started)
+        return result
+
+    async def worker(index):
+        rnd = random.Random(seed * 1000 + index)
+        conn = Connection(host, port)
+        await conn.open()
+        try:
+            while time.perf_counter() < deadline:
+                await SCENARIOS[scenario](conn, rnd, timed)
+        finally:
+            conn.close()
+
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(worker(i) for i in range(connections)))
+    return latencies, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="측정할 시나리오 (여러 번 지정 가능, 기본: 전부)")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0, help="시나리오당 측정 시간(초)")
+    parser.add_argument("--url", help="이미 떠 있는 서버 주소 (생략하면 내장 서버를 띄움)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        proc = start_server(port)
+    try:
+        print(f"연결 {args.connections}개, 시나리오당 {args.duration:g}초")
+        for scenario in args.scenario or ["health", "score", "quiz", "batch"]:
+            cpu_started = cpu_seconds(proc.pid) if proc else 0.0
+            latencies, elapsed = asyncio.run(load(host, port, scenario, args.connections,
+                                                  args.duration, args.seed))
+            cpu = cpu_seconds(proc.pid) - cpu_started if proc else 0.0
+            latencies.sort()
+            line = (f"- {scenario:6s}: {len(latencies) / elapsed:8,.0f} req/s, "
+                    f"p50 {statistics.median(latencies) * 1e3:6.2f}ms, "
+                    f"p99 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3:6.2f}ms")
+            if proc:
+                line += f", 요청당 서버 CPU {cpu / len(latencies) * 1e3:.3f}ms"
+            print(line)
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
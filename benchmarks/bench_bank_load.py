@@ -0,0 +1,105 @@
+# benchmarks/bench_bank_load.py
+"""
+질문 은행 로드 벤치마크: JSON vs 컴파일된 .qbank(mmap)
+
+합성 은행(축당 N문항, 대상 3종)을 만들어 각 방식으로 로드하는 시간과
+로드 전후 RSS 증가량을 별도 프로세스에서 측정한다.
+
+    python benchmarks/bench_bank_load.py --sizes 24 10000 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+POLES = {"EI": ("E", "I"), "SN": ("S", "N"), "TF": ("T", "F"), "JP": ("J", "P")}
+AUDIENCES = ["general", "senior", "both"]
+
+CHILD = r"""
+import os, sys, time, random
+sys.path.insert(0, {root!r})
+
+def rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+from src.question_bank import QuestionBank
+from src.bank_format import CompiledQuestionBank
+
+path, mode = {path!r}, {mode!r}
+before = rss_kb()
+t0 = time.perf_counter()
+bank = CompiledQuestionBank.open(path) if mode == "qbank" else QuestionBank.from_file(path)
+load_ms = (time.perf_counter() - t0) * 1000
+
+# 세션 하나가 실제로 보는 만큼(축당 2~3문항)만 접근
+t0 = time.perf_counter()
+for axis in ["EI", "SN", "TF", "JP"]:
+    pool = bank.questions("general", axis)
+    for _ in range(3):
+        q = pool[random.randrange(len(pool))]
+        q["prompt"], q["A"]["label"], q["B"]["label"]
+access_us = (time.perf_counter() - t0) * 1e6
+print(load_ms, access_us, rss_kb() - before)
+"""
+
+
+def make_bank(per_axis: int):
+    rnd = random.Random(per_axis)
+    data = {}
+    for axis, (a, b) in POLES.items():
+        data[axis] = [
+            {
+                "audience": rnd.choice(AUDIENCES),
+                "prompt": f"{axis} 상황 {i}번: 주말에 어떤 계획을 세우시나요? ({rnd.random():.6f})",
+                "A": {"label": f"선택지 A-{i % 500}: 사람들과 함께 움직인다.", "value": a},
+                "B": {"label": f"선택지 B-{i % 500}: 혼자 조용히 쉰다.", "value": b},
+            }
+            for i in range(per_axis)
+        ]
+    return data
+
+
+def run_child(path: str, mode: str):
+    code = CHILD.format(root=ROOT, path=path, mode=mode)
+    out = subprocess.run([sys.executable, "-c", code], check=True,
+                         capture_output=True, text=True).stdout.split()
+    return float(out[0]), float(out[1]), int(out[2])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 2500, 25000, 250000],
+                        help="축당 문항 수 목록")
+    args = parser.parse_args()
+
+    from src.bank_format import write_compiled_bank
+
+    print(f"{'문항 수':>9} | {'형식':>5} | {'파일(KB)':>9} | {'로드(ms)':>9} | {'접근(us)':>9} | {'RSS 증가(KB)':>12}")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        for per_axis in args.sizes:
+            data = make_bank(per_axis)
+            json_path = os.path.join(tmp, f"bank_{per_axis}.json")
+            qbank_path = os.path.join(tmp, f"bank_{per_axis}.qbank")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            write_compiled_bank(data, qbank_path)
+            del data
+
+            for mode, path in [("json", json_path), ("qbank", qbank_path)]:
+                load_ms, access_us, rss = run_child(path, mode)
+                size_kb = os.path.getsize(path) // 1024
+                print(f"{per_axis * 4:>9,} | {mode:>5} | {size_kb:>9,} | {load_ms:>9.2f} | "
+                      f"{access_us:>9.1f} | {rss:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_batch_scoring.py
+"""
+일괄 채점 벤치마크: 세션별 compute_mbti 반복 vs compute_mbti_batch
+
+무작위 세션(축당 2~6문항)을 만들어 초당 처리 세션 수를 비교한다.
+pack_answers 변환 시간은 따로 표시한다.
+
+    python benchmarks/bench_batch_scoring.py --sessions 10000 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.mbti_analyzer import MBTIAnalyzer
+
+
+def make_sessions(analyzer, count, rnd):
+    sessions = []
+    for _ in range(count):
+        answers = []
+        for axis in analyzer.config.AXES:
+            for _ in range(rnd.choice([2, 4, 6])):
+                answers.append({"axis": axis, "value": rnd.choice(analyzer.config.POLES[axis])})
+        sessions.append(answers)
+    return sessions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+
+    analyzer = MBTIAnalyzer()
+    rnd = random.Random(0)
+    sample = make_sessions(analyzer, 2000, rnd)
+    sample_packed = analyzer.pack_answers(sample)
+
+    print(f"{'세션 수':>10} | {'반복(세션/s)':>13} | {'pack(ms)':>9} | {'batch(ms)':>10} | {'batch(세션/s)':>14}")
+    print("-" * 70)
+    for count in args.sessions:
+        # 변환/반복 채점은 2000세션 표본으로 측정해 환산
+        t0 = time.perf_counter()
+        for answers in sample:
+            analyzer.compute_mbti(answers)
+        loop_rate = len(sample) / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        analyzer.pack_answers(sample)
+        pack_ms = (time.perf_counter() - t0) * 1000 * count / len(sample)
+
+        packed = np.resize(sample_packed, (count,) + sample_packed.shape[1:])
+        t0 = time.perf_counter()
+        analyzer.compute_mbti_batch(packed)
+        batch_s = time.perf_counter() - t0
+        print(f"{count:>10,} | {loop_rate:>13,.0f} | {pack_ms:>9,.1f} | {batch_s * 1000:>10,.1f} | "
+              f"{count / batch_s:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
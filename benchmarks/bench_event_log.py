@@ -0,0 +1,97 @@
+# benchmarks/bench_event_log.py
+"""
+이벤트 로깅 비용 벤치마크: 세션 상태 목록에 쌓기 vs 공유 대기열 + 백그라운드 기록
+
+기존 LoggingUtils 방식(세션마다 action_log 목록에 딕셔너리 추가, 100개를 넘으면 슬라이싱)과
+EventLogger.log()의 호출당 시간을 잰다. EventLogger는 기록 스레드가 실제로 파일에 쓰는
+상태에서 측정하며, 기존 방식이 세션 상태에 남기는 메모리도 함께 출력한다.
+
+    python benchmarks/bench_event_log.py --events 200000 --sessions 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.event_log import EventLogger
+
+
+def old_log(session_state, action_type, details):
+    """기존 LoggingUtils.log_user_action (st.session_state 대신 딕셔너리)"""
+    if "action_log" not in session_state:
+        session_state["action_log"] = []
+    session_state["action_log"].append({
+        "action_type": action_type,
+        "timestamp": "unknown",
+        "details": details or {},
+    })
+    if len(session_state["action_log"]) > 100:
+        session_state["action_log"] = session_state["action_log"][-50:]
+
+
+def percentile(samples, q):
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+
+def time_calls(call, events, tokens, rnd):
+    samples = []
+    for i in range(events):
+        token = tokens[rnd.randrange(len(tokens))]
+        started = time.perf_counter_ns()
+        call(token, "answer", (i % 12, "E"))
+        samples.append(time.perf_counter_ns() - started)
+    samples.sort()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tokens = [f"session-{i}" for i in range(args.sessions)]
+
+    states = {token: {} for token in tokens}
+    old = time_calls(lambda token, action, details: old_log(states[token], action, details),
+                     args.events, tokens, random.Random(args.seed))
+
+    # 메모리는 시간 측정과 따로 (tracemalloc이 호출 시간을 부풀리므로)
+    states = {token: {} for token in tokens}
+    tracemalloc.start()
+    rnd = random.Random(args.seed)
+    for i in range(args.events):
+        old_log(states[tokens[rnd.randrange(len(tokens))]], "answer", (i % 12, "E"))
+    old_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "events.jsonl")
+        events = EventLogger(path, flush_interval=0.05, max_queue=args.events)
+        new = time_calls(lambda token, action, details: events.log(action, token, details),
+                         args.events, tokens, random.Random(args.seed))
+        started = time.perf_counter()
+        events.close()
+        drain = time.perf_counter() - started
+        stats = events.stats()
+        size = os.path.getsize(path)
+
+    for name, samples in [("세션 목록", old), ("EventLogger", new)]:
+        print(f"{name:12s}: 호출당 평균 {statistics.fmean(samples) / 1e3:.2f}µs, "
+              f"p50 {percentile(samples, 0.5) / 1e3:.2f}µs, p99 {percentile(samples, 0.99) / 1e3:.2f}µs")
+    print(f"- 세션 목록 방식이 세션 상태에 남긴 메모리: {old_bytes / 1e6:.1f} MB (세션 {args.sessions}개)")
+    print(f"- EventLogger: 기록 {stats['written']:,}건, {stats['flushes']}회 일괄 기록, "
+          f"버림 {stats['dropped']}건, 종료 시 남은 기록 {drain * 1e3:.1f}ms, 파일 {size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/bench_fragment_rerun.py
+"""
+문항 클릭당 재실행 지연과 웹소켓 전송량 벤치마크
+
+실제 Streamlit 서버를 띄우고 브라우저 대신 웹소켓 프로토콜로 접속해, 세션마다
+문항 라디오를 차례로 선택한다. 클릭마다 rerun 요청을 보낸 시점부터 스크립트 종료
+메시지까지의 시간, 그 사이 받은 ForwardMsg 바이트 합, 서버 프로세스 CPU 시간(/proc)을 잰다.
+위젯이 프래그먼트 안에 있으면 브라우저와 같이 fragment_id를 붙여 보낸다.
+
+종단 지연에는 Streamlit 런타임이 10ms 간격으로 메시지를 내보내는 대기 시간이 포함되므로
+스크립트가 하는 일의 차이는 서버 CPU 시간에서 더 잘 드러난다.
+
+    python benchmarks/bench_fragment_rerun.py --sessions 20
+    python benchmarks/bench_fragment_rerun.py --app old_app.py   # 변경 전 스크립트와 비교
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from tornado.websocket import websocket_connect
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+DONE = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+
+def cpu_seconds(pid: int) -> float:
+    """프로세스의 누적 user+system CPU 시간 (리눅스 /proc, 없으면 0)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except OSError:
+        return 0.0
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(app: str, port: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Streamlit 서버가 뜨지 않았습니다.")
+
+
+async def rerun(ws, widgets, states, fragment_id="", pid=0):
+    """rerun 요청 후 스크립트 종료까지 (경과 시간, 받은 바이트, 서버 CPU 시간) 반환
+    
+    새로 그려진 문항 라디오는 widgets에 추가한다.
+    """
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.fragment_id = fragment_id
+    for widget_id, index in states.items():
+        state = msg.rerun_script.widget_states.widgets.add()
+        state.id = widget_id
+        state.int_value = index
+    cpu_started = cpu_seconds(pid)
+    started = time.perf_counter()
+    await ws.write_message(msg.SerializeToString(), binary=True)
+
+    received = 0
+    while True:
+        raw = await ws.read_message()
+        if raw is None:
+            raise RuntimeError("서버 연결이 끊어졌습니다.")
+        received += len(raw)
+        fwd = ForwardMsg()
+        fwd.ParseFromString(raw)
+        kind = fwd.WhichOneof("type")
+        if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+            element = fwd.delta.new_element
+            if element.WhichOneof("type") == "radio" and element.radio.label.strip() == "":
+                # 기본 선택이 바뀌면 위젯 id도 바뀌므로 사용자 키(sel_축_qid)로 문항을 구분
+                key = element.radio.id.rsplit("-", 1)[-1]
+                widgets[key] = (element.radio.id, fwd.delta.fragment_id)
+        elif kind == "script_finished" and fwd.script_finished in DONE:
+            return time.perf_counter() - started, received, cpu_seconds(pid) - cpu_started
+
+
+async def run_session(url, pid):
+    ws = await websocket_connect(url)
+    widgets = {}
+    await rerun(ws, widgets, {})
+    samples = []
+    answered = set()
+    while True:
+        pending = [key for key in widgets if key not in answered]
+        if not pending:
+            break
+        key = pending[0]
+        answered.add(key)
+        states = {widgets[k][0]: 0 for k in answered}
+        samples.append(await rerun(ws, widgets, states, widgets[key][1], pid))
+    ws.close()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    port = free_port()
+    proc = start_server(args.app, port)
+    try:
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        samples = []
+        for _ in range(args.sessions):
+            samples += asyncio.run(run_session(url, proc.pid))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencies = sorted(s[0] for s in samples)
+    sizes = [s[1] for s in samples]
+    print(f"{args.app}: 클릭 {len(samples):,}회 (세션 {args.sessions}개)")
+    print(f"- 재실행 지연: p50 {latencies[len(latencies) // 2] * 1e3:.1f}ms, "
+          f"p90 {latencies[int(len(latencies) * 0.9)] * 1e3:.1f}ms")
+    print(f"- 클릭당 서버 CPU: 평균 {statistics.fmean(s[2] for s in samples) * 1e3:.1f}ms")
+    print(f"- 클릭당 전송량: 평균 {statistics.fmean(sizes):,.0f} bytes, "
+          f"중앙값 {statistics.median(sizes):,.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
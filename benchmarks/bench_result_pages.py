@@ -0,0 +1,64 @@
+# benchmarks/bench_result_pages.py
+"""
+제출(결과 화면) 재실행 벤치마크: 매번 조립 vs 미리 렌더링한 결과 페이지
+
+AppTest로 앱을 띄워 모든 문항에 답한 뒤 제출 버튼을 누르는 재실행만 시간을 잰다.
+함께 결과 화면 요소 수와 캐시 예열 비용(페이지 수, 시간)을 출력한다.
+
+    python benchmarks/bench_result_pages.py --sessions 30
+    python benchmarks/bench_result_pages.py --app old_app.py   # 변경 전 스크립트와 비교
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from streamlit.testing.v1 import AppTest
+from src.result_pages import ResultPageCache
+
+
+def submit_once(app, rnd):
+    at = AppTest.from_file(app, default_timeout=30).run()
+    for _ in range(4):
+        for radio in at.radio[1:]:
+            if radio.value is None:
+                radio.set_value(radio.options[rnd.randrange(2)])
+        at.run()
+    started = time.perf_counter()
+    at.button[0].click().run()
+    elapsed = time.perf_counter() - started
+    assert not at.exception, at.exception
+    return elapsed, len(at.markdown)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--sessions", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    pages = ResultPageCache()
+    created = pages.warm()
+    print(f"캐시 예열: 페이지 {created}개, {(time.perf_counter() - started) * 1e3:.1f}ms")
+
+    rnd = random.Random(args.seed)
+    submit_once(args.app, rnd)  # 모듈 import·캐시 예열은 측정에서 제외
+    samples = [submit_once(args.app, rnd) for _ in range(args.sessions)]
+    latencies = sorted(s[0] for s in samples)
+    print(f"{args.app}: 제출 {len(samples)}회")
+    print(f"- 제출 재실행: p50 {latencies[len(latencies) // 2] * 1e3:.1f}ms, "
+          f"p90 {latencies[int(len(latencies) * 0.9)] * 1e3:.1f}ms")
+    print(f"- 결과 화면 마크다운 요소: 평균 {statistics.fmean(s[1] for s in samples):.1f}개")
+
+
+if __name__ == "__main__":
+    main()
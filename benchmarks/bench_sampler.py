@@ -0,0 +1,70 @@
+# benchmarks/bench_sampler.py
+"""
+문항 샘플링 벤치마크: 전체 인덱스 셔플/잔여 풀 생성 vs 지연 순열 커서
+
+한 세션이 한 축에서 하는 일(기본 2문항 + 추가 1문항)을 풀 크기별로 측정한다.
+
+    python benchmarks/bench_sampler.py --sizes 10 1000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.question_bank import QuestionPool
+from src.sampler import QuestionSampler
+
+
+def old_session(pool):
+    """기존 app.py 방식: sample_two + 잔여 풀 리스트에서 random.choice"""
+    idx = list(range(len(pool)))
+    random.shuffle(idx)
+    base = [pool[idx[0]], pool[idx[1]]]
+    used = {q["prompt"] for q in base}
+    remain = [q for q in pool if q["prompt"] not in used]
+    return base + [random.choice(remain)]
+
+
+def new_session(pool):
+    """지연 순열 커서: 기본 2문항과 추가 1문항을 같은 커서에서"""
+    sampler = QuestionSampler()
+    used = {"EI": 0}
+    return sampler.draw(pool, "EI", used, 2) + sampler.draw(pool, "EI", used, 1)
+
+
+def measure(fn, pool, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(pool)
+    per_call_us = (time.perf_counter() - t0) / repeat * 1e6
+
+    tracemalloc.start()
+    fn(pool)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return per_call_us, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10, 100, 1000, 10000, 100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'풀 크기':>9} | {'기존(us)':>11} | {'기존 peak':>10} | {'커서(us)':>9} | {'커서 peak':>9}")
+    print("-" * 62)
+    for size in args.sizes:
+        pool = QuestionPool({"qid": i, "prompt": f"질문 {i}"} for i in range(size))
+        repeat = max(3, min(2000, 2_000_000 // size))
+        old_us, old_peak = measure(old_session, pool, repeat)
+        new_us, new_peak = measure(new_session, pool, max(repeat, 2000))
+        print(f"{size:>9,} | {old_us:>11,.1f} | {old_peak:>10,} | {new_us:>9.1f} | {new_peak:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_session_memory.py
+"""
+세션당 메모리 벤치마크: 질문/답변 딕셔너리 복사 vs 압축 QuizSession
+
+실제 질문 은행으로 세션 N개를 만들어(기본 8문항 + 동점 축마다 1문항, 모두 응답)
+tracemalloc으로 세션당 할당량을 측정한다. 공유 은행 자체는 측정에서 제외한다.
+
+    python benchmarks/bench_session_memory.py --sessions 10000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.config import AppConfig
+from src.question_bank import QuestionBank
+from src.quiz_plan import build_quiz_plan, next_reserve, start_quiz
+from src.sampler import QuestionSampler
+
+
+def old_session(pools, rnd):
+    """기존 app.py 방식: base/extra에 질문 딕셔너리 복사, answers에 문구·라벨 복사"""
+    state = {"used": {ax: 0 for ax in AppConfig.AXES}, "sampler": QuestionSampler(rnd),
+             "base": [], "base_ids": [], "extra": [], "answers": {}}
+    for ax in AppConfig.AXES:
+        for i, q in enumerate(state["sampler"].draw(pools[ax], ax, state["used"], 2), start=1):
+            state["base"].append(dict(id=f"base_{ax}_{i}", axis=ax, **q))
+            state["base_ids"].append(f"base_{ax}_{i}")
+    for q in state["base"]:
+        picked = q[rnd.choice("AB")]
+        state["answers"][q["id"]] = {"axis": q["axis"], "value": picked["value"], "label": picked["label"],
+                                     "prompt": q["prompt"], "is_extra": False}
+    for ax in AppConfig.AXES:
+        values = [a["value"] for a in state["answers"].values() if a["axis"] == ax]
+        if values[0] != values[1]:
+            it = state["sampler"].draw(pools[ax], ax, state["used"], 1)[0]
+            q = {**it, "id": f"ex_{ax}_{rnd.randint(1, 10**9)}", "axis": ax, "is_extra": True}
+            state["extra"].append(q)
+            picked = q["A"]
+            state["answers"][q["id"]] = {"axis": ax, "value": picked["value"], "label": picked["label"],
+                                         "prompt": q["prompt"], "is_extra": True}
+    return state
+
+
+def new_session(pools, rnd):
+    """app.py와 같은 경로: 시드 계획으로 세션을 만들고 동점 축은 계획의 예비 문항 사용"""
+    plan = build_quiz_plan(pools, rnd.getrandbits(32), "v1")
+    quiz = start_quiz(plan, "general")
+    for position in range(len(quiz)):
+        quiz.set_answer(position, rnd.randrange(2))
+    for ax in AppConfig.AXES:
+        if quiz.diff(ax) == 0:
+            quiz.set_answer(quiz.add_item(ax, next_reserve(plan, quiz, ax), is_extra=True), 0)
+    return quiz
+
+
+def measure(fn, pools, count):
+    rnd = random.Random(0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [fn(pools, rnd) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count, sessions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=10000)
+    args = parser.parse_args()
+
+    bank = QuestionBank.from_file(os.path.join(ROOT, AppConfig.QUESTIONS_FILE))
+    pools = bank.pool("general")
+
+    old_bytes, _ = measure(old_session, pools, args.sessions)
+    new_bytes, sessions = measure(new_session, pools, args.sessions)
+    print(f"세션 {args.sessions:,}개 (공유 은행 제외)")
+    print(f"- 기존 딕셔너리 복사: 세션당 {old_bytes:,.0f} bytes")
+    print(f"- QuizSession:        세션당 {new_bytes:,.0f} bytes "
+          f"(nbytes 추정 {sum(s.nbytes() for s in sessions) / len(sessions):,.0f} bytes)")
+    print(f"- 감소: {1 - new_bytes / old_bytes:.0%}, 같은 메모리로 {old_bytes / new_bytes:.1f}배 세션 보관")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/bench_session_registry.py
+"""
+캠페인 피크 시뮬레이션: 버려진 세션이 차지하는 메모리 (레지스트리 정리 전/후)
+
+초당 --rate명이 들어오고 그중 --abandon 비율은 몇 문항만 답하고 떠난다.
+Streamlit 세션은 탭을 닫아도 한동안 남으므로 정리가 없으면 떠난 세션도 계속 메모리를 차지한다.
+가짜 시계로 --minutes분을 돌려, 매 초 활동 중인 사용자가 재실행(touch)할 때마다
+레지스트리가 TTL/예산으로 정리한 결과와 정리하지 않았을 때를 비교한다.
+
+    python benchmarks/bench_session_registry.py --rate 20 --minutes 60 --ttl 300
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.config import AppConfig
+from src.session import QuizSession
+from src.session_registry import SessionRegistry
+from src.session_store import MemorySessionStore
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def new_quiz(rnd):
+    quiz = QuizSession("general", "v1")
+    for axis in AppConfig.AXES:
+        for qid in rnd.sample(range(40), 2):
+            quiz.add_item(axis, qid)
+    return quiz
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=20, help="초당 신규 사용자")
+    parser.add_argument("--minutes", type=int, default=60)
+    parser.add_argument("--abandon", type=float, default=0.7)
+    parser.add_argument("--ttl", type=float, default=300)
+    parser.add_argument("--budget-mb", type=float, default=8)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    clock = FakeClock()
+    registry = SessionRegistry(MemorySessionStore(), ttl=args.ttl,
+                               max_bytes=int(args.budget_mb * 1024 * 1024), clock=clock)
+    active = []  # [토큰, 세션, 남은 클릭 수]
+    unmanaged_bytes = 0
+    peak_live = 0
+    touch_time = touches = 0
+    for second in range(args.minutes * 60):
+        clock.now = float(second)
+        for i in range(args.rate):
+            quiz = new_quiz(rnd)
+            clicks = rnd.randint(1, 3) if rnd.random() < args.abandon else len(quiz)
+            active.append([f"{second}-{i}", quiz, clicks])
+            unmanaged_bytes += quiz.nbytes()
+        still = []
+        for entry in active:
+            token, quiz, clicks = entry
+            quiz.set_answer(quiz.answered_count % len(quiz), rnd.randrange(2))
+            started = time.perf_counter()
+            registry.touch(token, quiz)
+            touch_time += time.perf_counter() - started
+            touches += 1
+            entry[2] -= 1
+            if entry[2] > 0 and rnd.random() < 0.5:
+                still.append(entry)
+        active = still
+        peak_live = max(peak_live, registry.stats()["live_bytes"])
+
+    stats = registry.stats()
+    print(f"{args.minutes}분, 초당 {args.rate}명, 이탈 {args.abandon:.0%}, TTL {args.ttl:.0f}s, "
+          f"예산 {args.budget_mb}MB")
+    print(f"- 정리 없음: 세션 {args.rate * args.minutes * 60:,}개, {unmanaged_bytes / 2**20:,.1f}MB 유지")
+    print(f"- 레지스트리: 세션 {stats['live_sessions']:,}개, {stats['live_bytes'] / 2**20:,.2f}MB 유지 "
+          f"(최대 {peak_live / 2**20:,.2f}MB)")
+    print(f"- TTL 해제 {stats['expired']:,}개, 예산 해제 {stats['budget_evicted']:,}개, "
+          f"회수 {stats['reclaimed_bytes'] / 2**20:,.1f}MB")
+    print(f"- touch 평균 {touch_time / touches * 1e6:,.1f}µs ({touches:,}회)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_session_store.py
+"""
+세션 저장 지연 벤치마크: 재실행마다 동기 커밋 vs write-behind 저장소
+
+실제 크기의 세션 상태(기본 8문항 + 추가 문항, 일부 응답)를 재실행 1회 = 저장 1회로 보고
+재실행 스레드가 기다리는 시간만 잰다. write-behind 쪽은 백그라운드 기록이 함께 도는
+상태에서 측정하고, 마지막에 flush까지 포함한 총 처리량도 출력한다.
+
+    python benchmarks/bench_session_store.py --reruns 20000 --sessions 200
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.config import AppConfig
+from src.session import QuizSession
+from src.session_store import SQLiteSessionStore, new_session_token
+
+
+def make_state(rnd):
+    quiz = QuizSession("general", "1700000000000000000")
+    for axis in AppConfig.AXES:
+        for qid in rnd.sample(range(40), 3):
+            quiz.add_item(axis, qid)
+    for position in range(len(quiz)):
+        if rnd.random() < 0.7:
+            quiz.set_answer(position, rnd.randrange(2))
+    return {"mode": "general", "quiz": quiz.to_dict(), "base_done": False}
+
+
+def sync_save(conn, token, state):
+    """저장소 없이 재실행마다 바로 커밋하는 방식"""
+    conn.execute(
+        "INSERT INTO sessions (token, state, updated_at) VALUES (?, ?, ?) "
+        "ON CONFLICT(token) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at",
+        (token, json.dumps(state, ensure_ascii=False, separators=(",", ":")), time.time())
+    )
+    conn.commit()
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"- {name}: 평균 {statistics.fmean(samples) * 1e6:,.1f}µs, "
+          f"p50 {samples[len(samples) // 2] * 1e6:,.1f}µs, p99 {p99 * 1e6:,.1f}µs")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reruns", type=int, default=20000)
+    parser.add_argument("--sessions", type=int, default=200)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    tokens = [new_session_token() for _ in range(args.sessions)]
+    workload = [(rnd.choice(tokens), make_state(rnd)) for _ in range(args.reruns)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "sync.sqlite3"))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(SQLiteSessionStore._SCHEMA)
+        sync_samples = []
+        for token, state in workload:
+            started = time.perf_counter()
+            sync_save(conn, token, state)
+            sync_samples.append(time.perf_counter() - started)
+        conn.close()
+
+        store = SQLiteSessionStore(os.path.join(tmp, "store.sqlite3"))
+        store_samples = []
+        total_started = time.perf_counter()
+        for token, state in workload:
+            started = time.perf_counter()
+            store.save(token, state)
+            store_samples.append(time.perf_counter() - started)
+        store.close()
+        total = time.perf_counter() - total_started
+
+    print(f"재실행 {args.reruns:,}회, 세션 {args.sessions:,}개")
+    report("동기 커밋      ", sync_samples)
+    report("write-behind   ", store_samples)
+    print(f"- write-behind 기록: 배치 {store.flush_count:,}회, 행 {store.written_count:,}개 "
+          f"(종료 flush 포함 총 {total:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
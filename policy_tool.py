@@ -0,0 +1,97 @@
+# policy_tool.py
+"""
+종료 규칙 평가 도구
+
+사용 예:
+    python policy_tool.py simulate --respondents 10000000 --noise 1.0
+    python policy_tool.py simulate --base 2 --step 2 --max 8 --margin 2 --json
+    python policy_tool.py evaluate --max 20 --margin 2 --noise 1.0
+    python policy_tool.py evaluate --p 0.7
+"""
+
+import argparse
+import json
+import sys
+
+from src.config import AppConfig
+from src.policy import StoppingPolicy, evaluate_population
+from src.simulation import simulate
+
+
+def build_policy(args) -> StoppingPolicy:
+    return StoppingPolicy(args.base, args.step, args.max, args.margin)
+
+
+def cmd_simulate(args):
+    result = simulate(build_policy(args), args.respondents, noise=args.noise, seed=args.seed,
+                      workers=args.workers, chunk_size=args.chunk_size)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+    print(f"✅ {result['policy']}, 응답자 {result['respondents']:,}명, noise={result['noise']} "
+          f"({result['elapsed']:.2f}초, {result['respondents'] / result['elapsed']:,.0f}명/s)")
+    print(f"- 4축 모두 정답: {result['accuracy']:.2%}, 세션당 평균 문항: {result['mean_questions']:.3f}")
+    for axis, stats in result["axes"].items():
+        print(f"- {axis}: 정답률 {stats['accuracy']:.2%}, 미해결 {stats['unresolved_rate']:.2%}, "
+              f"평균 문항 {stats['mean_questions']:.3f}")
+
+
+def cmd_evaluate(args):
+    policy = build_policy(args)
+    if args.p is not None:
+        result = policy.evaluate(args.p)
+        title = f"응답 확률 p={args.p}"
+        lines = [f"- 첫 번째 극 {result['first']:.4%}, 두 번째 극 {result['second']:.4%}, "
+                 f"미해결 {result['unresolved']:.4%}",
+                 f"- 기대 문항 수: {result['expected_questions']:.4f}"]
+    else:
+        result = evaluate_population(policy, args.noise)
+        title = f"모집단 noise={args.noise}"
+        lines = [f"- 축 정답률 {result['accuracy']:.4%}, 미해결 {result['unresolved_rate']:.4%}",
+                 f"- 축당 기대 문항 수: {result['mean_questions']:.4f}"]
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+    print(f"✅ {policy!r}, {title} (정확한 DP)")
+    for line in lines:
+        print(line)
+    print("- 종료 시점: " + ", ".join(f"{n}문항 {prob:.2%}" for n, prob in result["stop_at"].items()))
+
+
+def add_policy_arguments(p):
+    p.add_argument("--base", type=int, default=AppConfig.BASE_QUESTIONS_PER_AXIS, help="기본 문항 수")
+    p.add_argument("--step", type=int, default=AppConfig.ADDITIONAL_QUESTIONS_PER_AXIS, help="추가 묶음 크기")
+    p.add_argument("--max", type=int, default=AppConfig.MAX_QUESTIONS_PER_AXIS, help="축당 최대 문항 수")
+    p.add_argument("--margin", type=int, default=1, help="조기 종료에 필요한 두 극의 차이")
+    p.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quick-MBTI 종료 규칙 평가 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("simulate", help="가상 응답자 몬테카를로 시뮬레이션")
+    add_policy_arguments(p)
+    p.add_argument("--respondents", type=int, default=1_000_000)
+    p.add_argument("--noise", type=float, default=1.0, help="응답 잡음 크기 (클수록 일관성 낮음)")
+    p.add_argument("--seed", type=int)
+    p.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: CPU 수, 0이면 현재 프로세스)")
+    p.add_argument("--chunk-size", type=int, default=1_000_000, help="워커당 한 번에 처리하는 응답자 수")
+    p.set_defaults(func=cmd_simulate)
+
+    p = sub.add_parser("evaluate", help="동적 계획법으로 정확한 결과 분포 계산")
+    add_policy_arguments(p)
+    p.add_argument("--p", type=float, help="응답자 한 명의 첫 번째 극 선택 확률 (생략 시 모집단)")
+    p.add_argument("--noise", type=float, default=1.0, help="모집단 응답 잡음 크기 (simulate와 같은 모형)")
+    p.set_defaults(func=cmd_evaluate)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args) or 0
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+# rescore_tool.py
+"""
+결과 일괄 재채점 도구
+
+DataUtils.export_results_to_dict 형식의 JSONL(한 줄에 결과 하나)을 읽어
+현재 채점 규칙으로 다시 계산한 결과를 같은 형식으로 기록한다.
+
+사용 예:
+    python rescore_tool.py results.jsonl -o results.rescored.jsonl
+    python rescore_tool.py results.jsonl -o out.jsonl --workers 8 --chunk-lines 5000 --json
+"""
+
+import argparse
+import json
+import sys
+
+from src.rescoring import rescore_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quick-MBTI 결과 일괄 재채점")
+    parser.add_argument("source", help="입력 JSONL 경로")
+    parser.add_argument("-o", "--output", help="출력 JSONL 경로 (기본: <입력>.rescored.jsonl)")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: CPU 수, 0이면 현재 프로세스)")
+    parser.add_argument("--chunk-lines", type=int, default=2000, help="워커에 넘기는 조각당 줄 수")
+    parser.add_argument("--max-inflight", type=int, help="동시에 처리 중인 조각 수 상한 (기본: 워커 수 × 2)")
+    parser.add_argument("--json", action="store_true", help="통계를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    output = args.output or args.source.rsplit(".", 1)[0] + ".rescored.jsonl"
+    try:
+        stats = rescore_file(args.source, output, workers=args.workers,
+                             chunk_lines=args.chunk_lines, max_inflight=args.max_inflight)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+    else:
+        t = stats["timings"]
+        mb_per_sec = stats["bytes_in"] / 1e6 / t["total"] if t["total"] else 0.0
+        print(f"✅ {args.source} → {output}")
+        print(f"- 결과 {stats['records']:,}건 (타입 변경 {stats['changed']:,}건, 오류 {stats['errors']:,}건)")
+        print(f"- 처리량: {stats['records_per_sec']:,.0f}건/s, {mb_per_sec:.1f} MB/s "
+              f"(워커 {stats['workers']}개, 조각 {stats['chunks']:,}개)")
+        print(f"- 단계별(초): 읽기 {t['read']:.2f} / 파싱 {t['parse']:.2f} / 채점 {t['score']:.2f} / "
+              f"직렬화 {t['encode']:.2f} / 대기 {t['wait']:.2f} / 쓰기 {t['write']:.2f} / 전체 {t['total']:.2f}")
+        print("  (파싱·채점·직렬화는 워커 합산 시간)")
+    for line_no, message in stats["error_samples"]:
+        print(f"❌ {args.source}:{line_no}: {message}", file=sys.stderr)
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,38 @@
 #src/__init__.py
 """
 MBTI Quick Test Application
+
+패키지 import는 채점·질문 은행·세션 같은 헤드리스 모듈만 불러온다. Streamlit에 의존하는
+UI 모듈(ui_components, utils)과 HTTP API(api)는 이름을 처음 참조할 때 불러오므로
+api_server.py나 일괄 작업은 UI 스택 없이 로드된다.
 """
 
+import importlib
+
 from .config import AppConfig
 from .mbti_analyzer import MBTIAnalyzer
 from .question_manager import QuestionManager
-from .ui_components import UIComponents
-from .utils import StateManager, ValidataionUtils, DataUtils, LoggingUtils
+from .adaptive import AdaptiveSelector
+from .session import QuizSession
+from .session_store import SessionStore, SQLiteSessionStore, MemorySessionStore, get_session_store
+from .session_registry import SessionRegistry, get_session_registry
+from .event_log import EventLogger, get_event_logger
+from .quiz_plan import QuizPlan, build_quiz_plan, start_quiz
+from .resume_token import encode_resume_token, decode_resume_token
+from .result_pages import ResultPageCache, get_result_pages
+from .question_bank import QuestionBank, get_shared_bank, watch_shared_bank
+from .bank_shards import ShardedQuestionBank, get_audience_bank
+
+# 처음 참조할 때 불러오는 이름 → 모듈
+_LAZY_EXPORTS = {
+    "QuizAPI": ".api",
+    "create_app": ".api",
+    "UIComponents": ".ui_components",
+    "StateManager": ".utils",
+    "ValidationUtils": ".utils",
+    "DataUtils": ".utils",
+    "LoggingUtils": ".utils",
+}
 
 __version__ = "2.0.0"
 __author__ = "JBS"
@@ -16,9 +41,33 @@ __all__ = [
     "AppConfig",
     "MBTIAnalyzer",
     "QuestionManager",
+    "AdaptiveSelector",
+    "QuizSession",
+    "SessionStore",
+    "SQLiteSessionStore",
+    "MemorySessionStore",
+    "get_session_store",
+    "SessionRegistry",
+    "get_session_registry",
+    "EventLogger",
+    "get_event_logger",
+    "QuizPlan",
+    "build_quiz_plan",
+    "start_quiz",
+    "encode_resume_token",
+    "decode_resume_token",
+    "ResultPageCache",
+    "get_result_pages",
+    "QuizAPI",
+    "create_app",
+    "QuestionBank",
+    "get_shared_bank",
+    "watch_shared_bank",
+    "ShardedQuestionBank",
+    "get_audience_bank",
     "UIComponents",
     "StateManager",
-    "ValidataionUtils",
+    "ValidationUtils",
     "DataUtils",
     "LoggingUtils",
 ]
@@ -26,4 +75,13 @@ __all__ = [
 #tests/__init__.py
 """
 Test Suite for MBTI Quick Test Application
-"""
\ No newline at end of file
+"""
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,134 @@
+"""
+적응형 문항 선택 모듈
+문항별 응답 통계로 축별 사후 확률을 갱신하고, 가장 불확실한 축에서
+기대 정보량이 가장 큰 문항을 골라 모든 축이 신뢰도 기준에 도달하면 멈춤
+
+문항 통계(선택 필드):
+    {"prompt": ..., "A": ..., "B": ...,
+     "endorse": [첫 번째 극 성향일 때 첫 번째 극을 고를 확률,
+                 두 번째 극 성향일 때 첫 번째 극을 고를 확률]}
+
+통계가 없는 문항(컴파일된 .qbank 포함)은 AppConfig.DEFAULT_ITEM_ENDORSEMENT를 사용한다.
+"""
+
+import math
+import random
+from typing import Dict, Any, Optional, Mapping, Tuple
+from src.config import AppConfig
+from src.question_bank import QuestionPool
+
+
+def _entropy(p: float) -> float:
+    """이진 엔트로피 (비트)"""
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return -(p * math.log2(p) + (1 - p) * math.log2(1 - p))
+
+
+class AdaptiveSelector:
+    """정보량 기반 적응형 문항 선택기
+    
+    축마다 "첫 번째 극 성향"일 로그 오즈를 상태로 들고, 답변이 들어올 때마다
+    문항 통계의 우도비로 갱신한다. 상태는 세션 상태에 그대로 저장할 수 있는 딕셔너리다.
+    """
+    
+    def __init__(self, confidence: Optional[float] = None, max_candidates: int = 64,
+                 rng: Optional[random.Random] = None):
+        self.config = AppConfig()
+        self.confidence = confidence or self.config.ADAPTIVE_CONFIDENCE
+        self.max_candidates = max_candidates
+        self._rng = rng or random.Random()
+    
+    def new_state(self) -> Dict[str, Dict[str, Any]]:
+        """축별 초기 상태 (사전 확률 0.5)"""
+        return {axis: {"log_odds": 0.0, "asked": 0} for axis in self.config.AXES}
+    
+    def item_stats(self, question: Mapping) -> Tuple[float, float]:
+        """문항의 (첫 번째 극 성향일 때, 두 번째 극 성향일 때) 첫 번째 극 선택 확률"""
+        endorse = question.get("endorse") or self.config.DEFAULT_ITEM_ENDORSEMENT
+        # 0/1 확률은 로그 우도비가 발산하므로 살짝 안쪽으로 자름
+        return tuple(min(max(float(p), 0.01), 0.99) for p in endorse[:2])
+    
+    def probability(self, state: Dict[str, Dict[str, Any]], axis: str) -> float:
+        """축이 첫 번째 극 성향일 사후 확률"""
+        return 1.0 / (1.0 + math.exp(-state[axis]["log_odds"]))
+    
+    def axis_confidence(self, state: Dict[str, Dict[str, Any]], axis: str) -> float:
+        """축 판정 신뢰도 (우세한 쪽의 사후 확률)"""
+        p = self.probability(state, axis)
+        return max(p, 1.0 - p)
+    
+    def is_axis_done(self, state: Dict[str, Dict[str, Any]], axis: str) -> bool:
+        """신뢰도 기준 도달 또는 최대 문항 수 소진"""
+        return (self.axis_confidence(state, axis) >= self.confidence or
+                state[axis]["asked"] >= self.config.MAX_QUESTIONS_PER_AXIS)
+    
+    def is_done(self, state: Dict[str, Dict[str, Any]]) -> bool:
+        return all(self.is_axis_done(state, axis) for axis in self.config.AXES)
+    
+    def update(self, state: Dict[str, Dict[str, Any]], axis: str, question: Mapping,
+               value: str):
+        """답변 하나로 축 상태 갱신"""
+        p_a, p_b = self.item_stats(question)
+        if value == self.config.POLES[axis][0]:
+            state[axis]["log_odds"] += math.log(p_a / p_b)
+        else:
+            state[axis]["log_odds"] += math.log((1 - p_a) / (1 - p_b))
+        state[axis]["asked"] += 1
+    
+    def expected_information(self, state: Dict[str, Dict[str, Any]], axis: str,
+                             question: Mapping) -> float:
+        """문항 답변이 축 판정에 주는 기대 정보량 (상호 정보량, 비트)"""
+        return self._information(self.probability(state, axis), self.item_stats(question))
+        
+    @staticmethod
+    def _information(prior: float, stats: Tuple[float, float]) -> float:
+        p_a, p_b = stats
+        p_first = prior * p_a + (1 - prior) * p_b
+        post_first = prior * p_a / p_first
+        post_second = prior * (1 - p_a) / (1 - p_first)
+        return _entropy(prior) - (p_first * _entropy(post_first) +
+                                  (1 - p_first) * _entropy(post_second))
+    
+    def next_axis(self, state: Dict[str, Dict[str, Any]], pools: Mapping[str, QuestionPool],
+                  used: Dict[str, int]) -> Optional[str]:
+        """아직 끝나지 않았고 남은 문항이 있는 축 중 신뢰도가 가장 낮은 축"""
+        open_axes = [
+            axis for axis in self.config.AXES
+            if not self.is_axis_done(state, axis) and pools[axis].mask & ~used[axis]
+        ]
+        if not open_axes:
+            return None
+        return min(open_axes, key=lambda axis: (self.axis_confidence(state, axis),
+                                                state[axis]["asked"]))
+    
+    def pick(self, state: Dict[str, Dict[str, Any]], pools: Mapping[str, QuestionPool],
+             used: Dict[str, int]) -> Optional[Tuple[str, Mapping]]:
+        """다음 (축, 문항) 선택 후 used 비트를 켬 (모든 축이 끝났거나 문항이 없으면 None)
+        
+        풀이 크면 무작위 시작점에서 미사용 문항 max_candidates개까지만 살펴본다.
+        """
+        axis = self.next_axis(state, pools, used)
+        if axis is None:
+            return None
+        
+        pool = pools[axis]
+        start = self._rng.randrange(len(pool))
+        best, best_info, scanned = None, -1.0, 0
+        info_by_stats: Dict[Tuple[float, float], float] = {}  # 통계가 같은 문항은 정보량도 같음
+        for offset in range(len(pool)):
+            question = pool[(start + offset) % len(pool)]
+            if (used[axis] >> question["qid"]) & 1:
+                continue
+            stats = self.item_stats(question)
+            info = info_by_stats.get(stats)
+            if info is None:
+                info = info_by_stats[stats] = self._information(self.probability(state, axis), stats)
+            if info > best_info:
+                best, best_info = question, info
+            scanned += 1
+            if scanned >= self.max_candidates:
+                break
+        
+        used[axis] |= 1 << best["qid"]
+        return axis, best
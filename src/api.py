@@ -0,0 +1,287 @@
+"""
+HTTP API 모듈
+Streamlit 없이 같은 퀴즈를 진행하고 채점하는 ASGI 애플리케이션 (프레임워크 의존성 없음)
+
+엔드포인트 (요청·응답 본문은 JSON):
+    GET  /health        은행 버전 확인
+    POST /quiz          {"audience", "seed"?} → 기본 문항과 재개 토큰
+    POST /quiz/answers  {"token", "answers": [{"position", "choice": "A"|"B"}]}
+                        → 갱신된 토큰, 동점 축의 추가 문항, 다 풀었으면 결과
+    POST /score         {"answers": [{"axis", "value"}]} → 채점 결과
+    POST /score/batch   {"sessions": [[{"axis", "value"}, ...], ...]} → 세션별 채점 결과
+
+퀴즈 상태는 서버에 두지 않고 재개 토큰(resume_token)에 담아 주고받는다. 문항은
+QuestionManager의 시드 계획으로 만들고 동점 해소 규칙은 앱과 같다(quiz_plan.add_tiebreakers).
+질문 은행은 앱과 같은 프로세스 공유 은행을 쓴다.
+
+    python api_server.py --port 8000        # 내장 서버 (asgi_server)
+    uvicorn src.api:app                     # 설치돼 있으면 다른 ASGI 서버도 가능
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from src.bank_shards import get_audience_bank
+from src.config import AppConfig
+from src.mbti_analyzer import MBTIAnalyzer
+from src.question_manager import QuestionManager
+from src.quiz_plan import add_tiebreakers, build_quiz_plan, start_quiz
+from src.result_pages import display_type
+from src.resume_token import decode_resume_token, encode_resume_token
+from src.session import QuizSession
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_BATCH_SESSIONS = 10000
+
+_JSON_HEADERS = [(b"content-type", b"application/json; charset=utf-8")]
+
+
+class ApiError(Exception):
+    """HTTP 상태 코드가 붙은 요청 오류"""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def _read_body(receive: Callable[[], Awaitable[Dict]]) -> bytes:
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ApiError(400, "요청 본문을 받기 전에 연결이 끊어졌습니다.")
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise ApiError(413, f"요청 본문은 {MAX_BODY_BYTES}바이트 이하여야 합니다.")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _question_json(quiz: QuizSession, pools: Mapping, position: int) -> Dict[str, Any]:
+    axis, qid, is_extra = quiz.item(position)
+    question = quiz.question(pools, position)
+    return {
+        "position": position,
+        "axis": axis,
+        "qid": qid,
+        "is_extra": is_extra,
+        "prompt": question["prompt"],
+        "A": dict(question["A"]),
+        "B": dict(question["B"]),
+    }
+
+
+def _answers_list(body: Mapping, key: str = "answers") -> List[Dict[str, Any]]:
+    answers = body.get(key)
+    if not isinstance(answers, list):
+        raise ApiError(400, f'"{key}"는 답변 목록이어야 합니다.')
+    for answer in answers:
+        if not isinstance(answer, dict) or answer.get("axis") not in AppConfig.POLES:
+            raise ApiError(400, f"답변마다 축(axis)은 {AppConfig.AXES} 중 하나여야 합니다.")
+        poles = AppConfig.POLES[answer["axis"]]
+        if answer.get("value") not in poles:
+            raise ApiError(400, f"{answer['axis']} 축 답변 값(value)은 {poles} 중 하나여야 합니다.")
+    return answers
+
+
+class QuizAPI:
+    """퀴즈·채점 ASGI 애플리케이션
+    
+    bank_for(대상)로 질문 은행을 얻는다 (기본: 프로세스 공유 은행). 핸들러는 모두 async이며
+    CPU를 오래 쓰는 일괄 채점만 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+    """
+    
+    def __init__(self, bank_for: Callable[[str], Any] = get_audience_bank):
+        self.bank_for = bank_for
+        self.manager = QuestionManager()
+        self.analyzer = MBTIAnalyzer()
+        self.routes: Dict[Tuple[str, str], Callable[[Mapping], Awaitable[Any]]] = {
+            ("GET", "/health"): self.health,
+            ("POST", "/quiz"): self.new_quiz,
+            ("POST", "/quiz/answers"): self.submit_answers,
+            ("POST", "/score"): self.score,
+            ("POST", "/score/batch"): self.score_batch,
+        }
+    
+    async def __call__(self, scope: Dict, receive: Callable, send: Callable):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        
+        status, payload = 200, None
+        try:
+            handler = self.routes.get((scope["method"], scope["path"]))
+            if handler is None:
+                if any(path == scope["path"] for _, path in self.routes):
+                    raise ApiError(405, "허용되지 않는 메서드입니다.")
+                raise ApiError(404, "없는 경로입니다.")
+            body = await _read_body(receive)
+            request = {}
+            if body:
+                try:
+                    request = json.loads(body)
+                except ValueError:
+                    raise ApiError(400, "요청 본문이 올바른 JSON이 아닙니다.")
+                if not isinstance(request, dict):
+                    raise ApiError(400, "요청 본문은 JSON 객체여야 합니다.")
+            payload = await handler(request)
+        except ApiError as e:
+            status, payload = e.status, {"error": str(e)}
+        except ValueError as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception:
+            # 처리하지 못한 오류도 JSON 500으로 응답 (연결을 끊지 않음)
+            logger.exception("API 요청 처리 오류: %s %s", scope["method"], scope["path"])
+            status, payload = 500, {"error": "서버 내부 오류입니다."}
+        
+        data = _encode(payload)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": _JSON_HEADERS + [(b"content-length", str(len(data)).encode("ascii"))],
+        })
+        await send({"type": "http.response.body", "body": data})
+    
+    async def _lifespan(self, receive: Callable, send: Callable):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # 첫 요청이 은행 로드 비용을 떠안지 않도록 시작할 때 대상별 은행을 미리 읽음
+                try:
+                    for audience in AppConfig.AUDIENCES:
+                        self.bank_for(audience)
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    
+    # ----------------------- 핸들러 -----------------------
+    async def health(self, request: Mapping) -> Dict[str, Any]:
+        return {"status": "ok", "bank_version": self.bank_for(AppConfig.AUDIENCES[0]).version}
+    
+    async def new_quiz(self, request: Mapping) -> Dict[str, Any]:
+        """새 퀴즈: 시드 계획의 기본 문항과 재개 토큰"""
+        audience = request.get("audience", AppConfig.AUDIENCES[0])
+        if audience not in AppConfig.AUDIENCES:
+            raise ApiError(400, f"대상은 {AppConfig.AUDIENCES} 중 하나여야 합니다.")
+        seed = request.get("seed")
+        if seed is not None and not (isinstance(seed, int) and 0 <= seed < 1 << 32):
+            raise ApiError(400, "seed는 0 이상 2^32 미만의 정수여야 합니다.")
+        
+        bank = self.bank_for(audience)
+        pools = bank.pool(audience)
+        plan = self.manager.plan_quiz(pools, bank.version, seed)
+        quiz = start_quiz(plan, audience)
+        return {
+            "token": encode_resume_token(quiz),
+            "audience": audience,
+            "seed": plan.seed,
+            "bank_version": bank.version,
+            "questions": [_question_json(quiz, pools, position) for position in range(len(quiz))],
+        }
+    
+    async def submit_answers(self, request: Mapping) -> Dict[str, Any]:
+        """답변 반영 → 동점 축 추가 문항 생성 → 다 풀었으면 채점"""
+        token = request.get("token")
+        if not isinstance(token, str):
+            raise ApiError(400, '"token"이 필요합니다.')
+        answers = request.get("answers", [])
+        if not isinstance(answers, list):
+            raise ApiError(400, '"answers"는 목록이어야 합니다.')
+        
+        quiz = decode_resume_token(token, self.bank_for)
+        pools = self.bank_for(quiz.mode).pool(quiz.mode)
+        for answer in answers:
+            position = answer.get("position") if isinstance(answer, dict) else None
+            choice = answer.get("choice") if isinstance(answer, dict) else None
+            if not isinstance(position, int) or not 0 <= position < len(quiz):
+                raise ApiError(400, f"position은 0 이상 {len(quiz)} 미만이어야 합니다.")
+            if choice not in ("A", "B"):
+                raise ApiError(400, 'choice는 "A" 또는 "B"여야 합니다.')
+            axis = quiz.item(position)[0]
+            value = quiz.question(pools, position)[choice]["value"]
+            quiz.set_answer(position, AppConfig.POLES[axis].index(value))
+        
+        added = []
+        if quiz.seed is not None:
+            plan = build_quiz_plan(pools, quiz.seed, quiz.bank_version)
+            added = add_tiebreakers(plan, quiz)
+        response = {
+            "token": encode_resume_token(quiz),
+            "complete": quiz.is_complete(),
+            "remaining": len(quiz) - quiz.answered_count,
+            "questions": [_question_json(quiz, pools, position) for position in added],
+        }
+        if quiz.is_complete():
+            response["result"] = self._quiz_result(quiz)
+        return response
+    
+    async def score(self, request: Mapping) -> Dict[str, Any]:
+        """답변 목록 채점 (compute_mbti)"""
+        model = self.analyzer.compute_mbti(_answers_list(request))
+        unresolved = self.analyzer.get_unresolved_axes(model)
+        return {
+            **model,
+            "unresolved": unresolved,
+            "display": self.analyzer.format_type_with_unresolved(model, unresolved),
+            "strength": {axis: self.analyzer.get_axis_preference_strength(axis, model)
+                         for axis in AppConfig.AXES},
+        }
+    
+    async def score_batch(self, request: Mapping) -> Dict[str, Any]:
+        """여러 세션 일괄 채점 (compute_mbti_batch, 스레드 풀에서 실행)"""
+        sessions = request.get("sessions")
+        if not isinstance(sessions, list):
+            raise ApiError(400, '"sessions"는 세션별 답변 목록의 목록이어야 합니다.')
+        if len(sessions) > MAX_BATCH_SESSIONS:
+            raise ApiError(413, f"한 번에 {MAX_BATCH_SESSIONS}개 세션까지 채점할 수 있습니다.")
+        checked = [_answers_list({"answers": answers}) for answers in sessions]
+        loop = asyncio.get_running_loop()
+        return {"results": await loop.run_in_executor(None, self._score_batch, checked)}
+    
+    # ----------------------- 채점 -----------------------
+    def _score_batch(self, sessions: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        batch = self.analyzer.compute_mbti_batch(self.analyzer.pack_answers(sessions))
+        poles = batch["poles"]
+        return [
+            {
+                "type": str(batch["type"][row]),
+                "count": dict(zip(poles, batch["count"][row].tolist())),
+                "totals": dict(zip(AppConfig.AXES, batch["totals"][row].tolist())),
+                "diff": dict(zip(AppConfig.AXES, batch["diff"][row].tolist())),
+                "strength": dict(zip(AppConfig.AXES, batch["strength"][row].tolist())),
+            }
+            for row in range(len(sessions))
+        ]
+    
+    def _quiz_result(self, quiz: QuizSession) -> Dict[str, Any]:
+        model = quiz.model()
+        counts = {axis: quiz.counts(axis) for axis in AppConfig.AXES}
+        return {
+            **model,
+            "display": display_type(counts),
+            "strength": {axis: self.analyzer.get_axis_preference_strength(axis, model)
+                         for axis in AppConfig.AXES},
+        }
+
+
+def create_app(bank_for: Optional[Callable[[str], Any]] = None) -> QuizAPI:
+    return QuizAPI(bank_for or get_audience_bank)
+
+
+# ASGI 서버용 진입점 (예: uvicorn src.api:app)
+app = create_app()
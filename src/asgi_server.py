@@ -0,0 +1,221 @@
+"""
+내장 ASGI 서버 모듈
+외부 패키지 없이 ASGI 앱을 로컬에서 띄우는 최소 HTTP/1.1 서버 (asyncio 스트림)
+
+지원: Content-Length 본문, keep-alive, lifespan 시작/종료.
+미지원: chunked 요청 본문, TLS, HTTP/2 (운영 환경에서는 uvicorn 등 전용 서버 권장)
+"""
+
+import asyncio
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAX_REQUEST_BYTES = 1024 * 1024
+MAX_HEADER_LINES = 100
+
+
+class _Lifespan:
+    """ASGI lifespan 프로토콜 구동 (앱이 지원하지 않으면 조용히 건너뜀)"""
+    
+    def __init__(self, app: Callable):
+        self.app = app
+        self._inbox: "asyncio.Queue[Dict]" = asyncio.Queue()
+        self._started = asyncio.Event()
+        self._stopped = asyncio.Event()
+        self._failure: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _send(self, message: Dict):
+        if message["type"] == "lifespan.startup.failed":
+            self._failure = message.get("message", "")
+        if message["type"].startswith("lifespan.startup"):
+            self._started.set()
+        elif message["type"].startswith("lifespan.shutdown"):
+            self._stopped.set()
+    
+    async def _run(self):
+        try:
+            await self.app({"type": "lifespan", "asgi": {"version": "3.0"}}, self._inbox.get, self._send)
+        except Exception:
+            pass
+        finally:
+            self._started.set()
+            self._stopped.set()
+    
+    async def startup(self):
+        self._task = asyncio.ensure_future(self._run())
+        await self._inbox.put({"type": "lifespan.startup"})
+        await self._started.wait()
+        if self._failure is not None:
+            raise RuntimeError(f"앱 시작 실패: {self._failure}")
+    
+    async def shutdown(self):
+        if self._task is None or self._task.done():
+            return
+        await self._inbox.put({"type": "lifespan.shutdown"})
+        await self._stopped.wait()
+
+
+async def _call_app(app: Callable, scope: Dict, body: bytes) -> Tuple[int, List, bytes]:
+    """HTTP 요청 하나를 앱에 넘기고 (상태, 헤더, 본문) 반환 (앱 예외는 500)"""
+    delivered = False
+    status, headers, chunks = 500, [], []
+    
+    async def receive() -> Dict:
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()  # 응답을 보낼 때까지 연결 종료 알림 없음
+    
+    async def send(message: Dict):
+        nonlocal status, headers
+        if message["type"] == "http.response.start":
+            status, headers = message["status"], list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+    
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        return 500, [(b"content-type", b"text/plain; charset=utf-8")], b"Internal Server Error"
+    return status, headers, b"".join(chunks)
+
+
+def _response_bytes(status: int, headers: List, body: bytes, keep_alive: bool) -> bytes:
+    try:
+        reason = HTTPStatus(status).phrase
+    except ValueError:
+        reason = ""
+    lines = [f"HTTP/1.1 {status} {reason}".encode("latin-1")]
+    names = set()
+    for name, value in headers:
+        names.add(bytes(name).lower())
+        lines.append(bytes(name) + b": " + bytes(value))
+    if b"content-length" not in names:
+        lines.append(b"content-length: " + str(len(body)).encode("ascii"))
+    lines.append(b"connection: keep-alive" if keep_alive else b"connection: close")
+    return b"\r\n".join(lines) + b"\r\n\r\n" + body
+
+
+class _BadRequest(Exception):
+    
+    def __init__(self, status: int):
+        self.status = status
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, str, List, bytes]]:
+    """요청 하나 읽기: (메서드, 대상, HTTP 버전, 헤더, 본문), 연결이 닫혔으면 None"""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise _BadRequest(400)
+    
+    headers, content_length = [], 0
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name, value = name.strip().lower(), value.strip()
+        headers.append((name.encode("latin-1"), value.encode("latin-1")))
+        if name == "content-length":
+            try:
+                content_length = int(value)
+            except ValueError:
+                raise _BadRequest(400)
+        elif name == "transfer-encoding":
+            raise _BadRequest(411)  # chunked 요청 본문은 지원하지 않음
+    else:
+        raise _BadRequest(431)
+    if content_length < 0:
+        raise _BadRequest(400)
+    if content_length > MAX_REQUEST_BYTES:
+        raise _BadRequest(413)
+    body = await reader.readexactly(content_length) if content_length else b""
+    return method, target, version, headers, body
+
+
+def _wants_keep_alive(version: str, headers: List) -> bool:
+    connection = next((value.decode("latin-1").lower() for name, value in headers
+                       if name == b"connection"), "")
+    if version == "HTTP/1.1":
+        return connection != "close"
+    return connection == "keep-alive"
+
+
+async def _handle_connection(app: Callable, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter, server: Tuple[str, int]):
+    client = writer.get_extra_info("peername")
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except _BadRequest as e:
+                writer.write(_response_bytes(e.status, [], b"", keep_alive=False))
+                await writer.drain()
+                return
+            if request is None:
+                return
+            method, target, version, headers, body = request
+            path, _, query = target.partition("?")
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": version.split("/", 1)[-1],
+                "method": method.upper(),
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode("latin-1"),
+                "query_string": query.encode("latin-1"),
+                "root_path": "",
+                "headers": headers,
+                "client": client[:2] if client else None,
+                "server": server,
+            }
+            keep_alive = _wants_keep_alive(version, headers)
+            status, response_headers, response_body = await _call_app(app, scope, body)
+            writer.write(_response_bytes(status, response_headers, response_body, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(app: Callable, host: str = "127.0.0.1", port: int = 8000,
+                ready: Optional[Callable[[Any], None]] = None, stop: Optional[asyncio.Event] = None):
+    """ASGI 앱을 host:port에서 서비스 (stop이 설정될 때까지)
+    
+    ready(서버)는 소켓을 연 직후 호출된다 (포트 0으로 띄웠을 때 실제 포트 확인용).
+    """
+    lifespan = _Lifespan(app)
+    await lifespan.startup()
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle_connection(app, reader, writer, (host, port)),
+        host, port, reuse_address=True
+    )
+    if ready is not None:
+        ready(server)
+    try:
+        async with server:
+            if stop is None:
+                await server.serve_forever()
+            else:
+                await stop.wait()
+    finally:
+        await lifespan.shutdown()
+
+
+def run(app: Callable, host: str = "127.0.0.1", port: int = 8000,
+        ready: Optional[Callable[[Any], None]] = None):
+    """serve()를 새 이벤트 루프에서 실행 (Ctrl+C로 종료)"""
+    try:
+        asyncio.run(serve(app, host, port, ready))
+    except KeyboardInterrupt:
+        pass
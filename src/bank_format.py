@@ -0,0 +1,309 @@
+"""
+컴파일된 질문 은행 모듈
+questions_bank.json을 압축 바이너리(.qbank)로 변환하고, mmap으로 열어 필요한 질문만 지연 생성
+
+파일 구조 (모두 little-endian)
+    헤더        HEADER                  (은행 버전 포함, 열 때 파일 전체를 해시하지 않음)
+    대상 테이블  u32 × n_audiences      (대상 이름의 문자열 ID, 코드 = 인덱스 + 1, 0 = 태그 없음)
+    축 범위     u32 × (n_axes + 1)      (축 코드별 레코드 시작 위치, 레코드는 축 순으로 정렬)
+    그룹 테이블  GROUP × n_groups       (대상 코드, 축 코드, 인덱스 오프셋, 개수)
+    그룹 인덱스  u32 × n_index          (그룹별 레코드 번호 배열)
+    질문 레코드  RECORD × n_questions
+    문자열 오프셋 u32 × (n_strings + 1)
+    문자열 blob  UTF-8
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Mapping
+from src.bank_validator import StreamingBankValidator
+from src.config import AppConfig
+from src.question_bank import QuestionBank, content_version, mask_from_qids
+
+MAGIC = b"QMBB"
+FORMAT_VERSION = 2
+
+# magic, 포맷 버전, 축 수, 문자열 수, 질문 수, 대상 수, 그룹 수, 인덱스 길이, 은행 버전(ASCII)
+HEADER = struct.Struct("<4sHHIIIII16s")
+# 대상 코드, 축 코드, 인덱스 오프셋, 개수
+GROUP = struct.Struct("<BBxxII")
+# 축 코드, 대상 코드, A 극 코드, B 극 코드, 질문/A 라벨/B 라벨 문자열 ID
+RECORD = struct.Struct("<BBBBIII")
+U32 = struct.Struct("<I")
+
+
+class _StringTable:
+    """컴파일 시 문자열 인터닝"""
+    
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: List[bytes] = []
+    
+    def intern(self, value: str) -> int:
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = len(self.values)
+            self.ids[value] = sid
+            self.values.append(value.encode("utf-8"))
+        return sid
+
+
+def compile_question_bank(questions_data: Dict[str, List[Dict[str, Any]]],
+                          version: Optional[str] = None) -> bytes:
+    """질문 데이터를 .qbank 바이너리로 변환
+    
+    version은 헤더에 기록할 은행 버전이다. 주지 않으면 헤더 뒤 본문의 content_version을 쓴다.
+    """
+    config = AppConfig()
+    strings = _StringTable()
+    
+    audiences: List[str] = []
+    records: List[bytes] = []
+    record_meta: List[Tuple[int, int]] = []  # (축 코드, 대상 코드)
+    axis_starts = []
+    
+    for axis_code, axis in enumerate(config.AXES):
+        axis_starts.append(len(records))
+        poles = config.POLES[axis]
+        
+        for i, question in enumerate(questions_data.get(axis, []), start=1):
+            tag = question.get("audience")
+            if tag:
+                if tag not in audiences:
+                    audiences.append(tag)
+                audience_code = audiences.index(tag) + 1
+            else:
+                audience_code = 0
+            
+            pole_codes = []
+            for choice in ["A", "B"]:
+                value = question[choice]["value"]
+                if value not in poles:
+                    raise ValueError(f"{axis}[{i}] {choice}.value 값 오류(축 {axis}): {value}")
+                pole_codes.append(poles.index(value))
+            
+            records.append(RECORD.pack(
+                axis_code, audience_code, pole_codes[0], pole_codes[1],
+                strings.intern(question["prompt"]),
+                strings.intern(question["A"]["label"]),
+                strings.intern(question["B"]["label"]),
+            ))
+            record_meta.append((axis_code, audience_code))
+    axis_starts.append(len(records))
+    
+    audience_sids = [strings.intern(name) for name in audiences]
+    
+    # 대상별 풀을 미리 계산 (태그 없음/both 문항은 모든 대상에 포함)
+    shared_codes = {0}
+    if "both" in audiences:
+        shared_codes.add(audiences.index("both") + 1)
+    # QuestionBank와 같이 설정된 대상만 미리 계산 (그 밖의 대상은 pool()이 요청 때 만듦)
+    pool_audiences = list(config.AUDIENCES)
+    
+    groups: List[bytes] = []
+    index: List[int] = []
+    for name in pool_audiences:
+        code = audiences.index(name) + 1 if name in audiences else 0
+        if code == 0:
+            # 데이터에 없는 설정상의 대상: 이름을 테이블에 추가
+            audiences.append(name)
+            audience_sids.append(strings.intern(name))
+            code = len(audiences)
+        for axis_code in range(len(config.AXES)):
+            members = [
+                rid for rid in range(axis_starts[axis_code], axis_starts[axis_code + 1])
+                if record_meta[rid][1] in shared_codes or record_meta[rid][1] == code
+            ]
+            groups.append(GROUP.pack(code, axis_code, len(index), len(members)))
+            index.extend(members)
+    
+    string_offsets = [0]
+    for value in strings.values:
+        string_offsets.append(string_offsets[-1] + len(value))
+    
+    parts = [
+        struct.pack(f"<{len(audience_sids)}I", *audience_sids),
+        struct.pack(f"<{len(axis_starts)}I", *axis_starts),
+        b"".join(groups),
+        struct.pack(f"<{len(index)}I", *index),
+        b"".join(records),
+        struct.pack(f"<{len(string_offsets)}I", *string_offsets),
+        b"".join(strings.values),
+    ]
+    body = b"".join(parts)
+    
+    version = content_version(body) if version is None else version
+    encoded = version.encode("ascii")
+    if len(encoded) > 16:
+        raise ValueError(f"은행 버전은 16바이트 이하여야 합니다: {version}")
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(config.AXES), len(strings.values),
+                         len(records), len(audiences), len(groups), len(index), encoded)
+    return header + body
+
+
+def write_compiled_bank(questions_data: Dict[str, List[Dict[str, Any]]], path: str,
+                        version: Optional[str] = None) -> int:
+    """컴파일 결과를 원자적으로 기록 (기존 파일을 mmap 중인 프로세스에 영향 없음)"""
+    payload = compile_question_bank(questions_data, version)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return len(payload)
+
+
+def compile_bank_file(source: str, path: str) -> Tuple[int, str]:
+    """JSON 질문 은행 파일을 검증한 뒤 .qbank로 기록하고 (크기, 은행 버전) 반환
+    
+    원본을 한 번만 읽어 검증·파싱·버전 계산을 모두 하며, 검증에 실패하면 아무것도 쓰지 않고
+    ValueError를 낸다. 버전은 원본 JSON의 content_version이라 같은 원본을 JSON으로 연 은행과
+    버전이 같다 (재개 토큰·출제 계획을 서로 넘겨 쓸 수 있음).
+    """
+    with open(source, "rb") as f:
+        data = f.read()
+    report = StreamingBankValidator().validate_bytes(data)
+    if not report["ok"]:
+        raise ValueError(f"{source}: {StreamingBankValidator.summarize(report)}")
+    version = content_version(data)
+    return write_compiled_bank(json.loads(data), path, version), version
+
+
+class _LazyQuestions(Sequence):
+    """레코드 번호 배열 위의 지연 질문 시퀀스 (QuestionPool과 같은 mask/by_qid 제공)"""
+    
+    def __init__(self, bank: "CompiledQuestionBank", offset: int, count: int,
+                 contiguous: bool, axis_start: int):
+        self._bank = bank
+        self._offset = offset
+        self._count = count
+        self._contiguous = contiguous
+        self._axis_start = axis_start
+        self._mask = None
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _record_id(self, i: int) -> int:
+        if self._contiguous:
+            return self._offset + i
+        return self._bank._index_at(self._offset + i)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._bank.question(self._record_id(i))
+    
+    @property
+    def mask(self) -> int:
+        """qid 비트마스크 (최초 접근 시 인덱스 배열만 읽어 계산)"""
+        if self._mask is None:
+            if self._contiguous:
+                self._mask = (1 << self._count) - 1
+            else:
+                self._mask = mask_from_qids(
+                    self._record_id(i) - self._axis_start for i in range(self._count)
+                )
+        return self._mask
+    
+    def by_qid(self, qid: int) -> Mapping:
+        """qid로 질문 조회"""
+        return self._bank.question(self._axis_start + qid)
+
+
+class CompiledQuestionBank(QuestionBank):
+    """mmap으로 연 .qbank 질문 은행
+    
+    파일 전체를 파싱하지 않고, 조회되는 질문만 그때그때 딕셔너리로 만든다.
+    """
+    
+    def __init__(self, path: str):
+        self.config = AppConfig()
+        self.path = path
+        
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        (magic, format_version, n_axes, n_strings, n_questions,
+         n_audiences, n_groups, n_index, version) = HEADER.unpack_from(self._mm, 0)
+        # 버전은 컴파일할 때 헤더에 기록해 둔 값 (파일 전체를 읽어 해시하지 않으므로 지연 로드 유지)
+        self.version = version.rstrip(b"\0").decode("ascii")
+        if magic != MAGIC:
+            raise ValueError(f"{path}: qbank 파일이 아닙니다.")
+        if format_version != FORMAT_VERSION or n_axes != len(self.config.AXES):
+            raise ValueError(f"{path}: 지원하지 않는 qbank 버전입니다.")
+        
+        pos = HEADER.size
+        audience_sids = struct.unpack_from(f"<{n_audiences}I", self._mm, pos)
+        pos += 4 * n_audiences
+        axis_starts = struct.unpack_from(f"<{n_axes + 1}I", self._mm, pos)
+        pos += 4 * (n_axes + 1)
+        groups_pos = pos
+        pos += GROUP.size * n_groups
+        self._index_pos = pos
+        pos += 4 * n_index
+        self._records_pos = pos
+        pos += RECORD.size * n_questions
+        self._string_offsets_pos = pos
+        pos += 4 * (n_strings + 1)
+        self._blob_pos = pos
+        
+        self._audience_names = [None] + [self._string(sid) for sid in audience_sids]
+        
+        self._axes = {
+            axis: _LazyQuestions(self, axis_starts[code], axis_starts[code + 1] - axis_starts[code],
+                                 True, axis_starts[code])
+            for code, axis in enumerate(self.config.AXES)
+        }
+        self._axis_starts = axis_starts
+        
+        self._index: Dict[Tuple[str, str], Sequence] = {}
+        pools: Dict[str, Dict[str, Sequence]] = {}
+        for g in range(n_groups):
+            audience_code, axis_code, offset, count = GROUP.unpack_from(self._mm, groups_pos + g * GROUP.size)
+            audience = self._audience_names[audience_code]
+            axis = self.config.AXES[axis_code]
+            questions = _LazyQuestions(self, offset, count, False, axis_starts[axis_code])
+            self._index[(audience, axis)] = questions
+            pools.setdefault(audience, {})[axis] = questions
+        self._pools = {audience: MappingProxyType(pool) for audience, pool in pools.items()}
+    
+    @classmethod
+    def open(cls, path: str) -> "CompiledQuestionBank":
+        """qbank 파일 열기"""
+        return cls(path)
+    
+    def _string(self, sid: int) -> str:
+        start, end = struct.unpack_from("<II", self._mm, self._string_offsets_pos + 4 * sid)
+        return self._mm[self._blob_pos + start:self._blob_pos + end].decode("utf-8")
+    
+    def _index_at(self, i: int) -> int:
+        return U32.unpack_from(self._mm, self._index_pos + 4 * i)[0]
+    
+    def question(self, record_id: int) -> Mapping:
+        """레코드 번호로 질문 딕셔너리 생성"""
+        (axis_code, audience_code, pole_a, pole_b,
+         prompt_sid, label_a_sid, label_b_sid) = RECORD.unpack_from(
+            self._mm, self._records_pos + RECORD.size * record_id)
+        poles = self.config.POLES[self.config.AXES[axis_code]]
+        
+        question = {
+            "qid": record_id - self._axis_starts[axis_code],
+            "prompt": self._string(prompt_sid),
+            "A": MappingProxyType({"label": self._string(label_a_sid), "value": poles[pole_a]}),
+            "B": MappingProxyType({"label": self._string(label_b_sid), "value": poles[pole_b]}),
+        }
+        if audience_code:
+            question["audience"] = self._audience_names[audience_code]
+        return MappingProxyType(question)
+    
+    def close(self):
+        """mmap 해제"""
+        self._mm.close()
@@ -0,0 +1,161 @@
+"""
+샤드 질문 은행 모듈
+질문 은행을 (대상, 로케일, 축) 단위 파일로 나누고, 세션이 고른 대상만 지연 로드해 LRU로 보관
+
+매니페스트 형식:
+    {"version": "...",
+     "shards": [{"audience": "both", "locale": "ko", "axis": "EI",
+                 "path": "ko/both/EI.json", "count": 0, "hash": "..."}, ...]}
+
+hash는 샤드 파일 내용의 content_version, version은 모든 샤드의 (경로, hash)로 만든 해시라서
+같은 원본으로 만든 매니페스트는 어느 노드에서든, 다시 만들어도 버전이 같다.
+
+"both" 샤드에는 audience가 없거나 both인 문항이 들어가며 모든 대상과 함께 로드된다.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+from src.config import AppConfig
+from src.question_bank import QuestionBank, content_version, get_shared_bank
+
+SHARED_AUDIENCE = "both"
+
+
+def _manifest_version(out_dir: str, shards: List[Dict[str, Any]]) -> str:
+    """샤드 내용 해시로 매니페스트 버전 계산 (hash가 없는 예전 항목은 파일을 읽어 채움)"""
+    for shard in shards:
+        if "hash" not in shard:
+            with open(os.path.join(out_dir, shard["path"]), "rb") as f:
+                shard["hash"] = content_version(f.read())
+    listing = "".join(f"{shard['path']}={shard['hash']}\n" for shard in sorted(shards, key=lambda s: s["path"]))
+    return content_version(listing.encode("utf-8"))
+
+
+def write_shards(questions_data: Dict[str, List[Dict[str, Any]]], out_dir: str,
+                 locale: str) -> Dict[str, Any]:
+    """질문 데이터를 샤드 파일로 나누고 매니페스트 갱신 (다른 로케일 항목은 유지)"""
+    config = AppConfig()
+    manifest_path = os.path.join(out_dir, config.SHARD_MANIFEST_NAME)
+    
+    shards = []
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            shards = [s for s in json.load(f)["shards"] if s["locale"] != locale]
+    
+    # "both" 샤드를 먼저 기록 → 로드 시 qid 순서가 항상 같도록
+    audiences = [SHARED_AUDIENCE]
+    for axis in config.AXES:
+        for question in questions_data.get(axis, []):
+            tag = question.get("audience")
+            if tag and tag not in audiences:
+                audiences.append(tag)
+    
+    for audience in audiences:
+        for axis in config.AXES:
+            questions = [
+                q for q in questions_data.get(axis, [])
+                if (q.get("audience") or SHARED_AUDIENCE) == audience
+            ]
+            rel_path = os.path.join(locale, audience, f"{axis}.json")
+            os.makedirs(os.path.join(out_dir, locale, audience), exist_ok=True)
+            payload = json.dumps(questions, ensure_ascii=False).encode("utf-8")
+            with open(os.path.join(out_dir, rel_path), "wb") as f:
+                f.write(payload)
+            shards.append({
+                "audience": audience, "locale": locale, "axis": axis,
+                "path": rel_path, "count": len(questions), "hash": content_version(payload)
+            })
+    
+    manifest = {"version": _manifest_version(out_dir, shards), "shards": shards}
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+
+class ShardedQuestionBank:
+    """매니페스트 기반 지연 로드 질문 은행 모음
+    
+    (대상, 로케일)별 QuestionBank를 처음 요청될 때 해당 샤드만 읽어 만들고,
+    최근 사용한 cache_size개만 보관한다. 밀려난 은행은 그것을 쥔 세션이 끝나면 해제된다.
+    """
+    
+    def __init__(self, manifest_path: str, cache_size: Optional[int] = None):
+        self.config = AppConfig()
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.version = str(manifest.get("version", ""))
+        self.cache_size = cache_size or self.config.SHARD_CACHE_SIZE
+        self._root = os.path.dirname(os.path.abspath(manifest_path))
+        self._shards = manifest["shards"]
+        self._cache: "OrderedDict[Tuple[str, str], QuestionBank]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.load_count = 0
+        self.evict_count = 0
+    
+    def bank_for(self, audience: str, locale: str) -> QuestionBank:
+        """대상/로케일의 질문 은행 반환 (없으면 샤드를 읽어 생성)"""
+        key = (audience, locale)
+        with self._lock:
+            bank = self._cache.get(key)
+            if bank is not None:
+                self._cache.move_to_end(key)
+                return bank
+        
+        # 파일 I/O는 잠금 밖에서 (동시에 같은 키를 읽으면 먼저 들어간 쪽을 사용)
+        bank = self._load(audience, locale)
+        with self._lock:
+            bank = self._cache.setdefault(key, bank)
+            self._cache.move_to_end(key)
+            self.load_count += 1
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self.evict_count += 1
+        return bank
+    
+    def _load(self, audience: str, locale: str) -> QuestionBank:
+        questions_data = {axis: [] for axis in self.config.AXES}
+        found = False
+        for shard in self._shards:
+            if shard["locale"] != locale or shard["audience"] not in (SHARED_AUDIENCE, audience):
+                continue
+            with open(os.path.join(self._root, shard["path"]), "r", encoding="utf-8") as f:
+                questions_data[shard["axis"]].extend(json.load(f))
+            found = True
+        
+        if not found:
+            raise KeyError(f"'{audience}'/'{locale}' 샤드가 매니페스트에 없습니다.")
+        return QuestionBank(questions_data, version=f"{self.version}:{audience}:{locale}")
+    
+    def cached_keys(self) -> List[Tuple[str, str]]:
+        """현재 캐시된 (대상, 로케일) 목록 (오래된 순)"""
+        with self._lock:
+            return list(self._cache)
+
+
+_shard_sets: Dict[str, Optional[ShardedQuestionBank]] = {}
+_shard_lock = threading.Lock()
+
+
+def get_shared_shards(manifest_path: Optional[str] = None) -> Optional[ShardedQuestionBank]:
+    """프로세스 공유 샤드 은행 반환 (매니페스트가 없으면 None, 존재 여부도 한 번만 확인)"""
+    key = os.path.abspath(manifest_path or AppConfig.SHARD_MANIFEST)
+    if key in _shard_sets:
+        return _shard_sets[key]
+    
+    with _shard_lock:
+        if key not in _shard_sets:
+            _shard_sets[key] = ShardedQuestionBank(key) if os.path.exists(key) else None
+    return _shard_sets[key]
+
+
+def get_audience_bank(audience: str, locale: Optional[str] = None) -> QuestionBank:
+    """대상에 맞는 질문 은행 반환 (샤드 매니페스트가 있으면 샤드, 없으면 단일 파일)"""
+    shards = get_shared_shards()
+    if shards is None:
+        return get_shared_bank(validate=True)
+    return shards.bank_for(audience, locale or AppConfig.LOCALE)
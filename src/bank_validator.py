@@ -0,0 +1,310 @@
+"""
+질문 은행 스트리밍 검증 모듈
+JSON 파일을 조각 단위로 읽으며 구조·중복·극 값·대상별 최소 문항 수를 한 번에 검사
+"""
+
+import hashlib
+import io
+import json
+from typing import Dict, Any, Optional, TextIO, Tuple
+from src.config import AppConfig
+from src.question_bank import is_valid_audience_tag
+
+
+class _JsonSyntaxError(Exception):
+    """스트림 파싱 중 문법 오류"""
+    
+    def __init__(self, message: str, line: int, column: int):
+        super().__init__(message)
+        self.line = line
+        self.column = column
+
+
+class _JsonStream:
+    """최상위 객체/배열 구조만 직접 따라가고, 개별 값은 json 디코더로 읽는 스트림
+    
+    이미 처리한 앞부분은 버퍼에서 버리므로 메모리는 가장 큰 문항 하나 크기로 제한된다.
+    """
+    
+    def __init__(self, fp: TextIO, chunk_size: int, max_item_chars: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._max_item_chars = max_item_chars
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._line = 1  # 버퍼 첫 글자의 줄 번호
+        self._eof = False
+    
+    def _fill(self) -> bool:
+        """다음 조각을 읽어 버퍼에 추가 (소비한 앞부분은 버림)"""
+        if self._eof:
+            return False
+        data = self._fp.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        if self._pos:
+            self._line += self._buf.count("\n", 0, self._pos)
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += data
+        return True
+    
+    def location(self, pos: Optional[int] = None) -> Tuple[int, int]:
+        """버퍼 위치의 (줄, 열) 반환 (1부터 시작, 기본값은 다음 토큰 위치)"""
+        if pos is None:
+            self.peek()
+            pos = self._pos
+        line = self._line + self._buf.count("\n", 0, pos)
+        return line, pos - self._buf.rfind("\n", 0, pos)
+    
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 글자 (파일 끝이면 빈 문자열)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+    
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            line, column = self.location()
+            raise _JsonSyntaxError(f"'{char}'가 필요하지만 '{found or 'EOF'}'가 있습니다.", line, column)
+        self._pos += 1
+    
+    def value(self) -> Any:
+        """현재 위치의 JSON 값 하나를 읽음 (필요한 만큼만 추가로 읽음)"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if len(self._buf) - self._pos <= self._max_item_chars and self._fill():
+                    continue
+                line, column = self.location(e.pos)
+                raise _JsonSyntaxError(e.msg, line, column)
+            # 버퍼 끝에서 끝난 숫자는 잘렸을 수 있으므로 더 읽어서 재시도
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+class StreamingBankValidator:
+    """단일 패스 스트리밍 질문 은행 검증기"""
+    
+    def __init__(self, chunk_size: int = 64 * 1024, max_item_chars: int = 1024 * 1024,
+                 max_errors: int = 1000):
+        self.config = AppConfig()
+        self.chunk_size = chunk_size
+        self.max_item_chars = max_item_chars
+        self.max_errors = max_errors
+    
+    def validate_file(self, path: str) -> Dict[str, Any]:
+        """파일 검증 후 리포트 반환"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                report = self.validate_stream(f)
+        except (OSError, UnicodeDecodeError) as e:
+            report = self._new_report()
+            self._add_error(report, "io_error", None, None, None, str(e))
+            report["ok"] = False
+        report["path"] = path
+        return report
+    
+    def validate_bytes(self, data: bytes) -> Dict[str, Any]:
+        """이미 읽어 둔 파일 내용 검증 후 리포트 반환 (파일을 다시 읽지 않음)"""
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            report = self._new_report()
+            self._add_error(report, "io_error", None, None, None, str(e))
+            report["ok"] = False
+            return report
+        return self.validate_stream(io.StringIO(text))
+    
+    def validate_stream(self, fp: TextIO) -> Dict[str, Any]:
+        """텍스트 스트림 검증 후 리포트 반환
+        
+        리포트 형식:
+            {"ok": bool, "questions": int, "counts": {대상: {축: 문항 수}},
+             "errors": [{"code", "axis", "index", "line", "message"}, ...],
+             "truncated": bool}
+        """
+        report = self._new_report()
+        stream = _JsonStream(fp, self.chunk_size, self.max_item_chars)
+        # 축별 태그 개수 (대상별 최소 문항 수는 마지막에 계산)
+        tag_counts = {axis: {} for axis in self.config.AXES}
+        seen_axes = set()
+        
+        try:
+            stream.expect("{")
+            if stream.peek() == "}":
+                stream.expect("}")
+            else:
+                while True:
+                    line, _ = stream.location()
+                    axis = stream.value()
+                    stream.expect(":")
+                    self._check_axis_key(report, axis, seen_axes, line)
+                    self._validate_axis(report, stream, axis, tag_counts.get(axis))
+                    if stream.peek() == ",":
+                        stream.expect(",")
+                        continue
+                    stream.expect("}")
+                    break
+            if stream.peek():
+                line, column = stream.location()
+                raise _JsonSyntaxError("최상위 객체 뒤에 데이터가 더 있습니다.", line, column)
+        except _JsonSyntaxError as e:
+            self._add_error(report, "syntax", None, None, e.line, f"{e} (열 {e.column})")
+            report["ok"] = False
+            return report
+        
+        for axis in self.config.AXES:
+            if axis not in seen_axes:
+                self._add_error(report, "missing_axis", axis, None, None, f"축 누락: {axis}")
+        
+        shared = {
+            axis: tag_counts[axis].get(None, 0) + tag_counts[axis].get("both", 0)
+            for axis in self.config.AXES
+        }
+        for audience in self.config.AUDIENCES:
+            counts = report["counts"].setdefault(audience, {})
+            for axis in self.config.AXES:
+                counts[axis] = shared[axis] + tag_counts[axis].get(audience, 0)
+                if axis in seen_axes and counts[axis] < self.config.BASE_QUESTIONS_PER_AXIS:
+                    self._add_error(
+                        report, "insufficient_questions", axis, None, None,
+                        f"'{audience}' 대상 {axis} 축 문항이 "
+                        f"{self.config.BASE_QUESTIONS_PER_AXIS}개 미만입니다: {counts[axis]}개"
+                    )
+        report["ok"] = not report["errors"]
+        return report
+    
+    @staticmethod
+    def summarize(report: Dict[str, Any], limit: int = 5) -> str:
+        """리포트 오류를 사람이 읽을 수 있는 한 줄 요약으로 변환"""
+        messages = [
+            f"{e['message']} ({e['line']}번째 줄)" if e["line"] else e["message"]
+            for e in report["errors"][:limit]
+        ]
+        more = len(report["errors"]) - limit
+        if more > 0 or report["truncated"]:
+            messages.append(f"외 {max(more, 0)}건" + (" 이상" if report["truncated"] else ""))
+        return "; ".join(messages)
+    
+    def _new_report(self) -> Dict[str, Any]:
+        return {"ok": True, "questions": 0, "counts": {}, "errors": [], "truncated": False}
+    
+    def _add_error(self, report: Dict[str, Any], code: str, axis: Optional[str],
+                   index: Optional[int], line: Optional[int], message: str):
+        if len(report["errors"]) >= self.max_errors:
+            report["truncated"] = True
+            return
+        report["errors"].append({
+            "code": code, "axis": axis, "index": index, "line": line, "message": message
+        })
+    
+    def _check_axis_key(self, report: Dict[str, Any], axis: Any, seen_axes: set, line: int):
+        if not isinstance(axis, str):
+            self._add_error(report, "invalid_type", None, None, line, "축 키는 문자열이어야 합니다.")
+        elif axis not in self.config.AXES:
+            self._add_error(report, "unknown_axis", axis, None, line, f"알 수 없는 축: {axis}")
+        elif axis in seen_axes:
+            self._add_error(report, "duplicate_axis", axis, None, line, f"축이 두 번 정의되었습니다: {axis}")
+        else:
+            seen_axes.add(axis)
+    
+    def _validate_axis(self, report: Dict[str, Any], stream: _JsonStream, axis: Any,
+                       tag_counts: Optional[Dict[Optional[str], int]]):
+        """축 배열의 문항을 하나씩 읽으며 검사"""
+        line, _ = stream.location()
+        if stream.peek() != "[":
+            stream.value()
+            self._add_error(report, "invalid_type", axis, None, line, f"{axis}는 리스트여야 합니다.")
+            return
+        stream.expect("[")
+        if stream.peek() == "]":
+            stream.expect("]")
+            return
+        
+        # 중복 검사는 문항 전문 대신 8바이트 다이제스트만 보관
+        seen_prompts: Dict[bytes, Tuple[int, int]] = {}
+        index = 0
+        while True:
+            index += 1
+            line, _ = stream.location()
+            question = stream.value()
+            report["questions"] += 1
+            if tag_counts is not None and self._check_question(report, axis, index, line, question):
+                tag = question.get("audience") or None
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+                
+                digest = hashlib.blake2b(question["prompt"].strip().encode("utf-8"),
+                                         digest_size=8).digest()
+                if digest in seen_prompts:
+                    first_index, first_line = seen_prompts[digest]
+                    self._add_error(
+                        report, "duplicate_prompt", axis, index, line,
+                        f"{axis}[{index}] prompt 중복 ({axis}[{first_index}], {first_line}번째 줄)"
+                    )
+                else:
+                    seen_prompts[digest] = (index, line)
+            
+            if stream.peek() == ",":
+                stream.expect(",")
+                continue
+            stream.expect("]")
+            return
+    
+    def _check_question(self, report: Dict[str, Any], axis: str, index: int, line: int,
+                        question: Any) -> bool:
+        """문항 하나의 구조/값 검사 (집계에 포함할 수 있으면 True)"""
+        where = f"{axis}[{index}]"
+        if not isinstance(question, dict):
+            self._add_error(report, "not_object", axis, index, line, f"{where} 문항은 객체여야 합니다.")
+            return False
+        
+        ok = True
+        prompt = question.get("prompt")
+        if not isinstance(prompt, str):
+            self._add_error(report, "missing_field", axis, index, line, f"{where} prompt 누락/형식 오류")
+            ok = False
+        elif not prompt.strip():
+            self._add_error(report, "empty_prompt", axis, index, line, f"{where} prompt가 비어 있습니다.")
+            ok = False
+        
+        audience = question.get("audience")
+        if not is_valid_audience_tag(audience):
+            self._add_error(report, "invalid_audience", axis, index, line,
+                            f"{where} audience 값 오류: {audience}")
+            ok = False
+        
+        poles = self.config.POLES[axis]
+        values = []
+        for choice in ["A", "B"]:
+            choice_data = question.get(choice)
+            if not isinstance(choice_data, dict):
+                self._add_error(report, "missing_field", axis, index, line, f"{where} {choice} 항목 누락")
+                ok = False
+                continue
+            if not isinstance(choice_data.get("label"), str):
+                self._add_error(report, "missing_field", axis, index, line, f"{where} {choice}.label 누락")
+                ok = False
+            value = choice_data.get("value")
+            if value not in poles:
+                self._add_error(report, "invalid_value", axis, index, line,
+                                f"{where} {choice}.value 값 오류(축 {axis}): {value}")
+                ok = False
+            values.append(value)
+        
+        if ok and values[0] == values[1]:
+            self._add_error(report, "same_poles", axis, index, line,
+                            f"{where} A와 B가 같은 극({values[0]})을 가리킵니다.")
+            ok = False
+        return ok
@@ -8,9 +8,42 @@ class AppConfig:
     
     PAGE_TITLE = "Quick-MBTI : 빠르게 MBTI를 알려줍니다"
     QUESTIONS_FILE = "questions_bank.json"
+    COMPILED_SUFFIX = ".qbank"  # bank_tool.py compile 결과물 확장자
+    BANK_RELOAD_INTERVAL = 2.0  # 질문 파일 변경 확인 주기(초)
     
+    # 샤드 질문 은행 (매니페스트가 있으면 단일 파일 대신 사용)
+    LOCALE = "ko"
+    SHARD_MANIFEST_NAME = "manifest.json"
+    SHARD_MANIFEST = "question_shards/manifest.json"
+    SHARD_CACHE_SIZE = 8  # 프로세스당 보관할 (대상, 로케일) 은행 수
+    
+    # 서버 측 세션 저장소 (":memory:"이면 프로세스 메모리, 그 외에는 SQLite 파일)
+    SESSION_STORE_PATH = "sessions.sqlite3"
+    SESSION_FLUSH_INTERVAL = 0.5  # write-behind 기록 주기(초)
+    SESSION_QUERY_PARAM = "s"  # 재접속용 세션 토큰을 담는 URL 파라미터
+    RESUME_QUERY_PARAM = "r"  # 퀴즈 상태 전체를 담은 재개 토큰 URL 파라미터 (다른 워커에서도 복원)
+    SESSION_TTL = 1800.0  # 이 시간(초) 동안 활동이 없으면 메모리에서 내보냄
+    SESSION_MEMORY_BUDGET = 64 * 1024 * 1024  # 프로세스당 메모리에 둘 세션 총 바이트
+    # 저장소에서도 이 시간(초) 넘게 갱신이 없으면 삭제 (메모리에서 내보낸 세션이 돌아올 여유를 둠)
+    SESSION_STORE_TTL = SESSION_TTL * 48
+    SESSION_PURGE_INTERVAL = 600.0  # 저장소 기록 스레드가 오래된 세션을 지우는 주기(초)
+    
+    # 폼 모드: 기본 문항·추가 문항을 각각 한 번에 제출 (라디오 클릭마다 서버 왕복 없음)
+    FORM_MODE = False  # 기본값 (URL의 FORM_QUERY_PARAM이 "1"/"0"이면 그 값을 따름)
+    FORM_QUERY_PARAM = "form"
+    
+    # 이벤트 로그 (백그라운드 스레드가 모아서 JSONL로 기록, 크기 기준 회전)
+    EVENT_LOG_PATH = "logs/events.jsonl"
+    EVENT_LOG_FLUSH_INTERVAL = 1.0  # 기록 주기(초)
+    EVENT_LOG_MAX_QUEUE = 10000  # 대기열 상한 (넘으면 버리고 개수만 셈)
+    EVENT_LOG_MAX_BYTES = 10 * 1024 * 1024  # 파일 하나의 최대 크기
+    EVENT_LOG_BACKUPS = 5  # 회전해 남겨둘 이전 파일 수
+
     AXES = ["EI", "SN", "TF", "JP"]
     
+    # 출제 대상 그룹 ("both" 또는 태그 없는 문항은 모든 대상에 포함)
+    AUDIENCES = ["general", "senior"]
+    
     POLES = {
         "EI": ("E", "I"),
         "SN": ("S", "N"),
@@ -39,4 +72,8 @@ class AppConfig:
     # 질문 개수 설정
     BASE_QUESTIONS_PER_AXIS = 2
     ADDITIONAL_QUESTIONS_PER_AXIS = 2
-    MAX_QUESTIONS_PER_AXIS = 6
\ No newline at end of file
+    MAX_QUESTIONS_PER_AXIS = 6
+    
+    # 적응형 문항 선택 (축 판정 신뢰도 기준, 통계 없는 문항의 기본 응답 확률)
+    ADAPTIVE_CONFIDENCE = 0.9
+    DEFAULT_ITEM_ENDORSEMENT = (0.8, 0.2)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+이벤트 로그 모듈
+재실행 중 발생한 사용자 이벤트를 프로세스 공유 대기열에 넣고, 백그라운드 스레드가 모아서
+회전하는 JSONL 파일에 기록 (세션 상태에 로그를 쌓지 않음)
+
+log()는 (시각, 이벤트, 세션, 상세) 튜플을 대기열에 넣기만 하므로 요청 경로 비용은 수 µs다.
+대기열이 가득 차면 기다리지 않고 버린 뒤 dropped를 센다 (로깅이 요청을 막지 않음).
+시각은 단조 시계로 재고, 기록할 때 시작 시점의 벽시계에 더해 되돌아가지 않는 ts로 쓴다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from src.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+Event = Tuple[int, str, Optional[str], Any]  # (단조 시각 ns, 이벤트, 세션 토큰, 상세)
+
+
+class EventLogger:
+    """비동기 일괄 이벤트 기록기 (JSONL, 크기 기준 회전)
+    
+    기록 스레드는 flush_interval마다, 또는 대기열이 batch_size만큼 차면 깨어나
+    쌓인 이벤트를 한 번의 write로 기록한다. 파일이 max_bytes를 넘으면 path.1, path.2 …로
+    밀어내고 backups개까지만 남긴다.
+    """
+    
+    def __init__(self, path: str, flush_interval: Optional[float] = None,
+                 max_queue: Optional[int] = None, max_bytes: Optional[int] = None,
+                 backups: Optional[int] = None, batch_size: int = 512):
+        self.path = path
+        self.flush_interval = (AppConfig.EVENT_LOG_FLUSH_INTERVAL
+                               if flush_interval is None else flush_interval)
+        self.max_queue = AppConfig.EVENT_LOG_MAX_QUEUE if max_queue is None else max_queue
+        self.max_bytes = AppConfig.EVENT_LOG_MAX_BYTES if max_bytes is None else max_bytes
+        self.backups = AppConfig.EVENT_LOG_BACKUPS if backups is None else backups
+        self.batch_size = batch_size
+        self.logged = 0
+        self.dropped = 0  # 대기열이 가득 차서 버린 수
+        self.failed = 0  # 파일 기록에 실패해 버린 수
+        self.written = 0
+        self.flush_count = 0
+        self.rotations = 0
+        self.last_error: Optional[str] = None
+        
+        # 단조 시계 기준점 (ts = 시작 벽시계 + 경과 단조 시간)
+        self._wall_origin = time.time()
+        self._mono_origin = time.monotonic_ns()
+        
+        self._queue: Deque[Event] = deque()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="EventLogWriter", daemon=True)
+        self._writer.start()
+    
+    def log(self, event: str, session: Optional[str] = None, details: Any = None) -> bool:
+        """이벤트를 대기열에 추가 (가득 찼거나 닫혔으면 버리고 False)"""
+        item = (time.monotonic_ns(), event, session, details)
+        with self._lock:
+            if self._closed or len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self._queue.append(item)
+            self.logged += 1
+            wake = len(self._queue) == self.batch_size
+        if wake:
+            self._wakeup.set()
+        return True
+    
+    def _encode(self, item: Event) -> str:
+        mono_ns, event, session, details = item
+        record = {
+            "ts": round(self._wall_origin + (mono_ns - self._mono_origin) / 1e9, 6),
+            "mono": round(mono_ns / 1e9, 6),
+            "event": event,
+            "session": session,
+            "details": details,
+        }
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+    
+    def flush(self):
+        """대기 중인 이벤트를 모두 기록"""
+        with self._write_lock:
+            with self._lock:
+                batch, self._queue = self._queue, deque()
+            if not batch:
+                return
+            data = ("\n".join(self._encode(item) for item in batch) + "\n").encode("utf-8")
+            try:
+                self._rotate_if_needed(len(data))
+                with open(self.path, "ab") as f:
+                    f.write(data)
+            except OSError as e:
+                # 기록 실패분은 버림 (로그 때문에 메모리가 계속 늘지 않도록)
+                self.last_error = str(e)
+                self.failed += len(batch)
+                logger.warning("이벤트 로그 기록 실패 (%d건 버림): %s", len(batch), e)
+                return
+            self.flush_count += 1
+            self.written += len(batch)
+    
+    def _rotate_if_needed(self, incoming: int):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size == 0 or size + incoming <= self.max_bytes:
+            return
+        if self.backups <= 0:
+            os.remove(self.path)
+        else:
+            for index in range(self.backups - 1, 0, -1):
+                older = f"{self.path}.{index}"
+                if os.path.exists(older):
+                    os.replace(older, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        self.rotations += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._queue)
+        return {
+            "logged": self.logged,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "written": self.written,
+            "pending": pending,
+            "flushes": self.flush_count,
+            "rotations": self.rotations,
+            "last_error": self.last_error,
+        }
+    
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("이벤트 로그 스레드 오류")
+    
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        self._writer.join(timeout=5)
+        self.flush()
+
+
+_shared_logger: Optional[EventLogger] = None
+_logger_lock = threading.Lock()
+
+
+def get_event_logger(path: Optional[str] = None) -> EventLogger:
+    """프로세스 공유 이벤트 기록기 (최초 호출 시 생성, 종료 시 남은 이벤트 기록)"""
+    global _shared_logger
+    if _shared_logger is not None:
+        return _shared_logger
+    
+    with _logger_lock:
+        if _shared_logger is None:
+            log_path = path or AppConfig.EVENT_LOG_PATH
+            os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+            _shared_logger = EventLogger(log_path)
+            atexit.register(_shared_logger.close)
+    return _shared_logger
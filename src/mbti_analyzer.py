@@ -3,10 +3,85 @@ MBTI 분석 모듈
 MBTI 결과 계산 및 분석 로직을 담당
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, NamedTuple, Sequence
 from src.config import AppConfig
 
 
+def _strength_label(diff: int, total: int) -> str:
+    """차이/문항 수 비율로 선호도 강도 라벨 결정"""
+    if total == 0:
+        return "측정 불가"
+        
+    strength_ratio = diff / total
+    
+    if strength_ratio >= 0.6:
+        return "강함"
+    elif strength_ratio >= 0.3:
+        return "보통"
+    elif strength_ratio > 0:
+        return "약함"
+    else:
+        return "동점"
+
+
+class AxisOutcome(NamedTuple):
+    """적응형 규칙으로 한 축의 응답 경로를 채점한 결과"""
+    token: str        # 우세 극점, 최대 문항 후에도 동점이면 "(E/I)"
+    used: int         # 판정까지 실제로 사용한 문항 수
+    diff: int
+    strength: str
+    unresolved: bool
+    count_a: int
+    count_b: int
+
+
+def build_outcome_table(axis: str) -> Tuple[AxisOutcome, ...]:
+    """축의 모든 응답 경로(비트마스크) → 결과 표 생성
+    
+    마스크의 i번째 비트가 1이면 i번째 답이 두 번째 극점이다.
+    기본 문항 수에서 동점이면 추가 문항 수만큼 더 보고, 최대 문항 수까지 반복한다.
+    판정 이후의 비트는 결과에 영향을 주지 않는다.
+    """
+    config = AppConfig()
+    pole_a, pole_b = config.POLES[axis]
+    max_questions = config.MAX_QUESTIONS_PER_AXIS
+    table = []
+    for mask in range(1 << max_questions):
+        count_a = count_b = used = 0
+        checkpoint = config.BASE_QUESTIONS_PER_AXIS
+        while True:
+            while used < checkpoint:
+                if (mask >> used) & 1:
+                    count_b += 1
+                else:
+                    count_a += 1
+                used += 1
+            if count_a != count_b or used >= max_questions:
+                break
+            checkpoint = min(checkpoint + config.ADDITIONAL_QUESTIONS_PER_AXIS, max_questions)
+            
+        unresolved = count_a == count_b
+        if unresolved:
+            token = f"({pole_a}/{pole_b})"
+        else:
+            token = pole_a if count_a > count_b else pole_b
+        diff = abs(count_a - count_b)
+        table.append(AxisOutcome(token, used, diff, _strength_label(diff, used),
+                                 unresolved, count_a, count_b))
+    return tuple(table)
+
+
+# 축별 결과 표 (축당 2^MAX_QUESTIONS_PER_AXIS개, import 시 1회 생성)
+# 적응형 2/4/6 규칙의 표로 종료 규칙 평가(policy, simulation), dev_debug, 그 규칙으로 기록된
+# 세션의 일괄 채점에서 쓴다. Streamlit 앱은 동점 축에 추가 문항을 한 번만 내는 2+1 규칙이라
+# 이 표로 채점하지 않는다. 앱의 마스크에는 답하지 않은 문항과 첫 번째 극이 모두 0으로 남아서
+# 예비 문항이 떨어져 동점으로 끝난 축(2문항)과 추가 문항까지 답한 축(3문항)을 마스크만으로는
+# 구분할 수 없기 때문이다. 앱 결과는 QuizSession.counts()/model()의 popcount로 구한다.
+OUTCOME_TABLES: Dict[str, Tuple[AxisOutcome, ...]] = {
+    axis: build_outcome_table(axis) for axis in AppConfig.AXES
+}
+
+
 class MBTIAnalyzer:
     """MBTI 분석 클래스"""
     
@@ -97,19 +172,121 @@ class MBTIAnalyzer:
         
     def get_axis_preference_strength(self, axis: str, model: Dict[str, Any]) -> str:
         """축별 선호도 강도 반환"""
-        diff = model["diff"][axis]
-        total = model["totals"][axis]
+        return _strength_label(model["diff"][axis], model["totals"][axis])
         
-        if total == 0:
-            return "측정 불가"
-            
-        strength_ratio = diff / total
-        
-        if strength_ratio >= 0.6:
-            return "강함"
-        elif strength_ratio >= 0.3:
-            return "보통"
-        elif strength_ratio > 0:
-            return "약함"
-        else:
-            return "동점"
\ No newline at end of file
+    def axis_path_mask(self, axis: str, values: Sequence[str]) -> int:
+        """축의 답변 값들(응답 순서)을 결과 표 조회용 비트마스크로 변환"""
+        pole_b = self.config.POLES[axis][1]
+        mask = 0
+        for i, value in enumerate(values):
+            if value == pole_b:
+                mask |= 1 << i
+        return mask
+        
+    def decode_session(self, masks: Sequence[int]) -> Dict[str, Any]:
+        """축별 응답 경로 비트마스크(축 순서)로 세션 결과를 표 조회만으로 계산
+        
+        반환값은 compute_mbti와 같은 키에 더해 "unresolved"(미해결 축),
+        "display"(format_type_with_unresolved 결과), "strength"(축별 강도),
+        "used"(축별 사용 문항 수)를 담는다. 적응형 규칙(OUTCOME_TABLES) 전용이며
+        앱 세션(2+1 규칙)의 결과는 QuizSession.model()로 구한다.
+        """
+        count, totals, diff, strength, used = {}, {}, {}, {}, {}
+        mbti_type, display, unresolved = "", "", []
+        for axis, mask in zip(self.config.AXES, masks):
+            outcome = OUTCOME_TABLES[axis][mask]
+            pole_a, pole_b = self.config.POLES[axis]
+            count[pole_a] = outcome.count_a
+            count[pole_b] = outcome.count_b
+            totals[axis] = used[axis] = outcome.used
+            diff[axis] = outcome.diff
+            strength[axis] = outcome.strength
+            mbti_type += pole_b if outcome.count_a < outcome.count_b else pole_a
+            display += outcome.token
+            if outcome.unresolved:
+                unresolved.append(axis)
+                
+        return {
+            "type": mbti_type,
+            "count": count,
+            "totals": totals,
+            "diff": diff,
+            "unresolved": unresolved,
+            "display": display,
+            "strength": strength,
+            "used": used
+        }
+        
+    def pack_answers(self, sessions: Sequence[Sequence[Dict[str, Any]]]):
+        """세션별 답변 리스트를 (세션 × 문항 × {축, 극}) int8 배열로 변환
+        
+        축은 AXES 순서의 인덱스, 극은 0(첫 번째 극)/1(두 번째 극)이며
+        세션마다 길이가 다른 부분은 -1로 채운다.
+        """
+        import numpy as np
+        
+        axis_index = {axis: i for i, axis in enumerate(self.config.AXES)}
+        pole_index = {pole: j for poles in self.config.POLES.values() for j, pole in enumerate(poles)}
+        width = max((len(answers) for answers in sessions), default=0)
+        packed = np.full((len(sessions), width, 2), -1, dtype=np.int8)
+        for row, answers in enumerate(sessions):
+            for col, answer in enumerate(answers):
+                packed[row, col, 0] = axis_index[answer["axis"]]
+                packed[row, col, 1] = pole_index.get(answer["value"], -1)
+        return packed
+        
+    def compute_mbti_batch(self, packed) -> Dict[str, Any]:
+        """여러 세션을 한 번에 채점 (compute_mbti의 벡터화 버전)
+        
+        packed는 pack_answers 형식의 (N, Q, 2) 정수 배열이다.
+        극이 -1인 답은 compute_mbti에서 알 수 없는 값처럼 문항 수에만 포함되고,
+        축이 -1인 칸은 빈 칸으로 무시된다.
+        
+        반환값(배열 첫 차원은 세션):
+            {"type": (N,) 문자열, "count": (N, 축*2) 극 순서는 POLES 순,
+             "totals": (N, 축), "diff": (N, 축), "strength": (N, 축) 문자열,
+             "poles": 극 이름 목록}
+        """
+        import numpy as np
+        
+        packed = np.asarray(packed)
+        n_sessions = packed.shape[0]
+        n_axes = len(self.config.AXES)
+        axis = packed[..., 0].astype(np.int64)
+        pole = packed[..., 1].astype(np.int64)
+        filled = axis >= 0
+        voted = filled & (pole >= 0)
+        rows = np.broadcast_to(np.arange(n_sessions)[:, None], axis.shape)
+        
+        # 세션마다 칸을 나눈 bincount 한 번으로 극/축 카운트 계산
+        count = np.bincount(
+            (rows * (n_axes * 2) + axis * 2 + pole)[voted], minlength=n_sessions * n_axes * 2
+        ).reshape(n_sessions, n_axes * 2)
+        totals = np.bincount(
+            (rows * n_axes + axis)[filled], minlength=n_sessions * n_axes
+        ).reshape(n_sessions, n_axes)
+        count_a, count_b = count[:, 0::2], count[:, 1::2]
+        diff = np.abs(count_a - count_b)
+        
+        # 동점은 첫 번째 극 → 두 번째 극이 이긴 축만 비트로 모아 타입 이름 표에서 조회
+        type_index = ((count_a < count_b) << np.arange(n_axes)).sum(axis=1)
+        type_names = np.array([
+            "".join(self.config.POLES[axis_name][(code >> i) & 1]
+                    for i, axis_name in enumerate(self.config.AXES))
+            for code in range(1 << n_axes)
+        ])
+        
+        ratio = diff / np.maximum(totals, 1)
+        labels = np.array(["측정 불가", "강함", "보통", "약함", "동점"])
+        strength_index = np.select(
+            [totals == 0, ratio >= 0.6, ratio >= 0.3, ratio > 0], [0, 1, 2, 3], default=4
+        )
+        
+        return {
+            "type": type_names[type_index],
+            "count": count,
+            "totals": totals,
+            "diff": diff,
+            "strength": labels[strength_index],
+            "poles": [p for axis_name in self.config.AXES for p in self.config.POLES[axis_name]]
+        }
@@ -0,0 +1,132 @@
+"""
+종료 규칙 모듈
+축별 "몇 문항을 묻고 언제 멈출지"를 기술하는 정책과 그 판정 로직
+"""
+
+from typing import Dict, Any, List, Tuple
+from src.config import AppConfig
+
+
+class StoppingPolicy:
+    """체크포인트 방식 종료 규칙
+    
+    base문항을 먼저 묻고, 체크포인트마다 두 극의 차이가 margin 이상이면 멈춘다.
+    아니면 step문항씩 더 묻되 max_questions에서 끝낸다. 마지막 체크포인트에서는
+    차이가 있으면 많은 쪽으로 판정하고, 동점이면 미해결이다.
+    기본값(2/2/6, margin 1)이 MBTIAnalyzer의 2→4→6 규칙이다.
+    """
+    
+    def __init__(self, base: int = None, step: int = None, max_questions: int = None,
+                 margin: int = 1):
+        config = AppConfig()
+        self.base = config.BASE_QUESTIONS_PER_AXIS if base is None else base
+        self.step = config.ADDITIONAL_QUESTIONS_PER_AXIS if step is None else step
+        self.max_questions = config.MAX_QUESTIONS_PER_AXIS if max_questions is None else max_questions
+        self.margin = margin
+        if not (0 < self.base <= self.max_questions and self.step > 0 and self.margin > 0):
+            raise ValueError(f"잘못된 종료 규칙: {self}")
+    
+    def __repr__(self) -> str:
+        return (f"StoppingPolicy(base={self.base}, step={self.step}, "
+                f"max_questions={self.max_questions}, margin={self.margin})")
+    
+    def checkpoints(self) -> List[int]:
+        """판정 시점(누적 문항 수) 목록"""
+        points = list(range(self.base, self.max_questions, self.step))
+        return points + [self.max_questions]
+    
+    def decide(self, first_cumsum) -> Tuple[object, object]:
+        """응답자별 판정 (벡터화)
+        
+        first_cumsum: (N, max_questions) 배열, [i, k]는 응답자 i가 처음 k+1문항 중
+        첫 번째 극을 고른 횟수.
+        반환: (판정 (N,) int8: +1 첫 번째 극 / -1 두 번째 극 / 0 미해결,
+              사용 문항 수 (N,) int16)
+        """
+        import numpy as np
+        
+        n = first_cumsum.shape[0]
+        # 2·누적 횟수가 int8 범위(127)를 넘지 않으면 int8 그대로 계산
+        dtype = np.int8 if self.max_questions <= 63 else np.int16
+        decision = np.zeros(n, dtype=np.int8)
+        used = np.full(n, self.max_questions, dtype=np.int16)
+        open_rows = np.ones(n, dtype=bool)
+        points = self.checkpoints()
+        for point in points:
+            diff = 2 * first_cumsum[:, point - 1].astype(dtype, copy=False) - dtype(point)
+            if point == points[-1]:
+                stop = open_rows
+            else:
+                stop = open_rows & (np.abs(diff) >= self.margin)
+                np.copyto(used, point, where=stop)
+            np.copyto(decision, np.sign(diff), where=stop, casting="unsafe")
+            open_rows &= ~stop
+        return decision, used
+    
+    def evaluate(self, p_first: float) -> Dict[str, Any]:
+        """응답 확률이 p_first인 응답자에 대한 정확한 결과 분포 (DP)
+        
+        상태는 (답한 문항 수, 첫 번째 극 - 두 번째 극 차이)이며, 체크포인트마다
+        멈추는 상태의 확률을 흡수한다. 비용은 O(max_questions²)라 2^n 경로 열거 없이
+        축당 수십 문항 규칙도 바로 계산된다.
+        
+        반환 형식:
+            {"first", "second", "unresolved": 판정 확률,
+             "expected_questions": 기대 문항 수, "stop_at": {문항 수: 그 시점에 멈출 확률}}
+        """
+        if not 0.0 <= p_first <= 1.0:
+            raise ValueError(f"확률은 0~1 사이여야 합니다: {p_first}")
+        
+        # diff → 확률 (아직 멈추지 않은 상태만)
+        states = {0: 1.0}
+        result = {"first": 0.0, "second": 0.0, "unresolved": 0.0, "expected_questions": 0.0,
+                  "stop_at": {}}
+        checkpoints = set(self.checkpoints())
+        for answered in range(1, self.max_questions + 1):
+            stepped: Dict[int, float] = {}
+            for diff, prob in states.items():
+                stepped[diff + 1] = stepped.get(diff + 1, 0.0) + prob * p_first
+                stepped[diff - 1] = stepped.get(diff - 1, 0.0) + prob * (1.0 - p_first)
+            states = stepped
+            if answered not in checkpoints:
+                continue
+            
+            final = answered == self.max_questions
+            stopped = 0.0
+            for diff in list(states):
+                if final or abs(diff) >= self.margin:
+                    prob = states.pop(diff)
+                    key = "first" if diff > 0 else "second" if diff < 0 else "unresolved"
+                    result[key] += prob
+                    stopped += prob
+            result["stop_at"][answered] = stopped
+            result["expected_questions"] += answered * stopped
+        return result
+
+
+def evaluate_population(policy: StoppingPolicy, noise: float = 1.0,
+                        nodes: int = 96) -> Dict[str, Any]:
+    """simulation 모듈과 같은 응답 모형의 모집단 기대값 (몬테카를로 없이 정확한 적분)
+    
+    θ ~ N(0, 1)에 대해 가우스-에르미트 구적법으로 evaluate(sigmoid(θ / noise))를 평균한다.
+    θ > 0이면 첫 번째 극이 정답이다.
+    
+    반환 형식:
+        {"accuracy", "unresolved_rate", "mean_questions", "stop_at": {문항 수: 확률}}
+    """
+    import math
+    import numpy as np
+    
+    points, weights = np.polynomial.hermite_e.hermegauss(nodes)
+    weights = weights / weights.sum()
+    summary = {"accuracy": 0.0, "unresolved_rate": 0.0, "mean_questions": 0.0, "stop_at": {}}
+    # 응답 모형이 대칭이므로 |θ|로 바꿔 "첫 번째 극 판정 = 정답"으로 계산
+    for theta, weight in zip(np.abs(points).tolist(), weights.tolist()):
+        p_first = 1.0 / (1.0 + math.exp(-min(max(theta / noise, -30.0), 30.0)))
+        outcome = policy.evaluate(p_first)
+        summary["accuracy"] += weight * outcome["first"]
+        summary["unresolved_rate"] += weight * outcome["unresolved"]
+        summary["mean_questions"] += weight * outcome["expected_questions"]
+        for answered, prob in outcome["stop_at"].items():
+            summary["stop_at"][answered] = summary["stop_at"].get(answered, 0.0) + weight * prob
+    return summary
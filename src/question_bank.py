@@ -0,0 +1,270 @@
+"""
+질문 은행 모듈
+프로세스 단위로 한 번만 로드되어 모든 세션이 공유하는 읽기 전용 질문 인덱스
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple, Iterator, Iterable, Optional
+from src.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze_question(question: Dict[str, Any], qid: int) -> Mapping:
+    """질문 딕셔너리를 qid가 붙은 수정 불가능한 매핑으로 변환"""
+    frozen = dict(question)
+    frozen["qid"] = qid
+    for choice in ["A", "B"]:
+        if isinstance(frozen.get(choice), dict):
+            frozen[choice] = MappingProxyType(dict(frozen[choice]))
+    return MappingProxyType(frozen)
+
+
+def content_version(data) -> str:
+    """은행 파일 내용의 버전 문자열 (blake2b 해시, 같은 내용이면 어느 노드에서든 같은 값)"""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def is_valid_audience_tag(tag: Any) -> bool:
+    """문항 audience 태그 규칙: 없음, "both", 설정된 대상(AppConfig.AUDIENCES)만 허용
+    
+    검증기는 이 규칙으로 오류를 내고, 은행은 이 규칙의 대상만 미리 인덱싱한다.
+    """
+    return tag is None or tag == "both" or tag in AppConfig.AUDIENCES
+
+
+def mask_from_qids(qids: Iterable[int]) -> int:
+    """qid 목록을 비트마스크로 변환 (bytearray 경유로 O(n))"""
+    bitmap = bytearray()
+    for qid in qids:
+        byte = qid >> 3
+        if byte >= len(bitmap):
+            bitmap.extend(bytes(byte - len(bitmap) + 1))
+        bitmap[byte] |= 1 << (qid & 7)
+    return int.from_bytes(bitmap, "little")
+
+
+def iter_qids(mask: int) -> Iterator[int]:
+    """비트마스크에 켜진 qid를 작은 순서대로 반환"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class QuestionPool(tuple):
+    """(대상, 축) 조합의 질문 목록
+    
+    각 질문의 qid(축 내 고정 번호)를 비트마스크로 함께 들고 있어
+    "아직 안 쓴 문항"을 ``pool.mask & ~used`` 비트 연산으로 구할 수 있다.
+    """
+    
+    def __new__(cls, questions: Iterable[Mapping], axis_questions=None):
+        pool = super().__new__(cls, questions)
+        pool.mask = mask_from_qids(q["qid"] for q in pool)
+        if axis_questions is None:
+            axis_questions = {q["qid"]: q for q in pool}
+        pool._axis_questions = axis_questions
+        return pool
+    
+    @classmethod
+    def from_list(cls, questions: List[Dict[str, Any]]) -> "QuestionPool":
+        """qid 없는 원본 질문 리스트를 위치 기반 qid로 감싸기"""
+        return cls({**q, "qid": q.get("qid", i)} for i, q in enumerate(questions))
+    
+    def by_qid(self, qid: int) -> Mapping:
+        """qid로 질문 조회"""
+        return self._axis_questions[qid]
+
+
+class QuestionBank(Mapping):
+    """(대상, 축) 단위로 미리 인덱싱된 불변 질문 은행
+    
+    축 이름으로 조회하면 원본 JSON과 같은 구조(축 → 질문 목록)로 동작하므로
+    기존의 ``bank.get(axis, [])`` 형태 코드를 그대로 사용할 수 있다.
+    """
+    
+    def __init__(self, questions_data: Dict[str, List[Dict[str, Any]]], version: str = ""):
+        self.config = AppConfig()
+        self.version = version
+        
+        self._axes = {
+            axis: tuple(_freeze_question(q, qid) for qid, q in enumerate(questions_data.get(axis, [])))
+            for axis in self.config.AXES
+        }
+        
+        # 설정된 대상만 미리 인덱싱 (그 밖의 태그는 is_valid_audience_tag 규칙상 검증 오류,
+        # 설정에 없는 대상을 요청하면 pool()이 그때 만든다)
+        self._index: Dict[Tuple[str, str], QuestionPool] = {}
+        self._pools: Dict[str, Mapping] = {}
+        for audience in self.config.AUDIENCES:
+            self._pools[audience] = self._build_pool(audience)
+    
+    def _build_pool(self, audience: str) -> Mapping:
+        """특정 대상의 축별 질문 풀 생성"""
+        pool = {}
+        for axis in self.config.AXES:
+            questions = QuestionPool(
+                (q for q in self._axes[axis]
+                 if not q.get("audience") or q.get("audience") == "both"
+                 or q.get("audience") == audience),
+                self._axes[axis]
+            )
+            self._index[(audience, axis)] = questions
+            pool[axis] = questions
+        return MappingProxyType(pool)
+    
+    @classmethod
+    def from_file(cls, path: str, validate: bool = False) -> "QuestionBank":
+        """JSON 파일(또는 컴파일된 .qbank 파일)에서 질문 은행 생성"""
+        if path.endswith(AppConfig.COMPILED_SUFFIX):
+            # bank_tool compile(compile_bank_file)은 검증을 통과한 원본만 기록하므로 그대로 mmap
+            # (버전도 헤더에 기록된 값을 사용)
+            from src.bank_format import CompiledQuestionBank
+            return CompiledQuestionBank.open(path)
+        
+        # 한 번 읽은 바이트로 검증·파싱·버전 계산을 모두 수행
+        # (그 사이 파일이 교체돼도 버전과 내용이 어긋나지 않음)
+        with open(path, "rb") as f:
+            data = f.read()
+        
+        if validate:
+            # 모든 대상을 한 번에 검사하는 스트리밍 검증기 사용
+            from src.bank_validator import StreamingBankValidator
+            report = StreamingBankValidator().validate_bytes(data)
+            if not report["ok"]:
+                raise ValueError(f"{path}: {StreamingBankValidator.summarize(report)}")
+                
+        return cls(json.loads(data), version=content_version(data))
+    
+    def __getitem__(self, axis: str) -> Tuple[Mapping, ...]:
+        return self._axes[axis]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._axes)
+    
+    def __len__(self) -> int:
+        return len(self._axes)
+    
+    def pool(self, audience: str) -> Mapping:
+        """대상 그룹의 축별 질문 풀 반환 (읽기 전용)"""
+        pool = self._pools.get(audience)
+        if pool is None:
+            # 처음 보는 대상은 한 번만 만들어 캐시 (불변이므로 경쟁해도 결과 동일)
+            pool = self._build_pool(audience)
+            self._pools[audience] = pool
+        return pool
+    
+    def questions(self, audience: str, axis: str) -> QuestionPool:
+        """대상/축 조합의 질문 목록 반환"""
+        questions = self._index.get((audience, axis))
+        if questions is None:
+            questions = self.pool(audience).get(axis, ())
+        return questions
+
+
+_shared_banks: Dict[str, QuestionBank] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_bank(path: Optional[str] = None, validate: bool = False) -> QuestionBank:
+    """프로세스 공유 질문 은행 반환 (최초 호출 시 한 번만 로드, validate는 최초 로드에만 적용)"""
+    key = os.path.abspath(path or AppConfig.QUESTIONS_FILE)
+    bank = _shared_banks.get(key)
+    if bank is not None:
+        return bank
+    
+    with _shared_lock:
+        bank = _shared_banks.get(key)
+        if bank is None:
+            bank = QuestionBank.from_file(key, validate=validate)
+            _shared_banks[key] = bank
+    return bank
+
+
+class BankWatcher(threading.Thread):
+    """질문 파일 변경을 감시해 검증된 새 은행으로 교체하는 백그라운드 스레드
+    
+    파싱·검증·인덱싱은 모두 이 스레드에서 수행하고, 요청 경로에는 완성된
+    은행 참조만 원자적으로 교체된다. 기존 은행 객체는 불변이므로 이미 참조를
+    쥐고 있는 세션은 시작할 때의 버전을 그대로 사용한다.
+    """
+    
+    def __init__(self, path: str, interval: float):
+        super().__init__(name=f"BankWatcher({os.path.basename(path)})", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+        self._stop_event = threading.Event()
+        # 기준 시그니처 없이 시작해 첫 확인에서 한 번 읽고 버전을 비교한다 (공유 은행을 로드한 뒤
+        # 감시를 시작하기 전에 바뀐 파일도 놓치지 않음)
+        self._signature: Optional[Tuple[int, int]] = None
+    
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        """파일 변경 감지용 (mtime, size)"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def check_once(self) -> bool:
+        """변경 여부를 한 번 확인하고 교체되었으면 True 반환"""
+        signature = self._stat_signature()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        
+        try:
+            bank = QuestionBank.from_file(self.path, validate=True)
+        except Exception as e:
+            # 잘못된 파일은 무시하고 기존 은행 유지 (다음 저장 때 재시도)
+            self.last_error = str(e)
+            logger.warning("질문 은행 재로드 실패, 기존 버전 유지: %s", e)
+            return False
+        
+        current = _shared_banks.get(self.path)
+        if current is not None and current.version == bank.version:
+            # 내용이 같으면(mtime만 바뀜) 기존 은행 유지
+            self.last_error = None
+            return False
+        _shared_banks[self.path] = bank
+        self.reload_count += 1
+        self.last_error = None
+        logger.info("질문 은행 교체 완료: version=%s", bank.version)
+        return True
+    
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.check_once()
+    
+    def stop(self):
+        """감시 중지"""
+        self._stop_event.set()
+
+
+_watchers: Dict[str, BankWatcher] = {}
+
+
+def watch_shared_bank(path: Optional[str] = None,
+                      interval: Optional[float] = None) -> BankWatcher:
+    """공유 은행 파일 감시 스레드 시작 (경로당 한 번만 생성)"""
+    key = os.path.abspath(path or AppConfig.QUESTIONS_FILE)
+    watcher = _watchers.get(key)
+    if watcher is not None:
+        return watcher
+    
+    with _shared_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = BankWatcher(key, interval or AppConfig.BANK_RELOAD_INTERVAL)
+            watcher.start()
+            _watchers[key] = watcher
+    return watcher
@@ -5,21 +5,31 @@
 
 import json
 import random
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional
 from src.config import AppConfig
+from src.question_bank import QuestionBank, QuestionPool, get_shared_bank
+from src.sampler import QuestionSampler
+from src.bank_validator import StreamingBankValidator
+from src.bank_format import CompiledQuestionBank
+from src.adaptive import AdaptiveSelector
+from src.quiz_plan import QuizPlan, build_quiz_plan, new_plan_seed
 
 
 class QuestionManager:
-    """질문 관리 클래스"""
+    """질문 관리 클래스
     
-    def __init__(self):
+    난수는 인스턴스 전용 Random만 사용한다(스크립트 스레드끼리 전역 random 상태를 공유하지 않음).
+    같은 시드의 rng를 넘기면 같은 문항이 나온다.
+    """
+    
+    def __init__(self, rng: Optional[random.Random] = None):
         self.config = AppConfig()
+        self._rng = rng or random.Random()
         
-    def load_questions(self) -> Dict[str, List[Dict[str, Any]]]:
-        """질문 데이터 로드"""
+    def load_questions(self) -> QuestionBank:
+        """질문 데이터 로드 (프로세스 공유 인덱스, 최초 1회만 파싱)"""
         try:
-            with open(self.config.QUESTIONS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return get_shared_bank(self.config.QUESTIONS_FILE)
         except FileNotFoundError:
             raise FileNotFoundError(f"{self.config.QUESTIONS_FILE} 파일을 찾을 수 없습니다.")
         except json.JSONDecodeError:
@@ -27,9 +37,21 @@ class QuestionManager:
         except Exception as e:
             raise Exception(f"질문 파일 로드 중 오류 발생: {e}")
             
+    def load_compiled_questions(self, path: str = None) -> QuestionBank:
+        """컴파일된 .qbank 질문 은행을 mmap으로 로드 (질문은 조회 시점에 생성)"""
+        path = path or self.config.QUESTIONS_FILE.rsplit(".", 1)[0] + self.config.COMPILED_SUFFIX
+        try:
+            return CompiledQuestionBank.open(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{path} 파일을 찾을 수 없습니다.")
+            
     def filter_by_audience(self, questions_data: Dict[str, List[Dict[str, Any]]], 
                           audience: str) -> Dict[str, List[Dict[str, Any]]]:
         """대상 그룹별로 질문 필터링"""
+        if isinstance(questions_data, QuestionBank):
+            # 미리 인덱싱된 풀을 그대로 반환
+            return questions_data.pool(audience)
+            
         filtered = {axis: [] for axis in self.config.AXES}
         
         for axis in self.config.AXES:
@@ -44,29 +66,44 @@ class QuestionManager:
                     
         return filtered
         
-    def _sample_random_questions(self, questions: List[Dict[str, Any]], 
-                                count: int) -> List[Dict[str, Any]]:
-        """질문 리스트에서 랜덤하게 선택"""
-        if len(questions) < count:
+    def _sample_random_questions(self, questions: QuestionPool, axis: str,
+                                used: Dict[str, int], count: int,
+                                sampler: QuestionSampler = None) -> List[Dict[str, Any]]:
+        """풀에서 미사용 문항을 O(count)로 랜덤 선택"""
+        sampler = sampler or QuestionSampler(self._rng)
+        selected = sampler.draw(questions, axis, used, count)
+        
+        if selected and len(selected) < count:
             # 질문이 부족하면 중복 허용
-            return random.choices(questions, k=count) if questions else []
+            selected += self._rng.choices(selected, k=count - len(selected))
+        return selected
+        
+    @staticmethod
+    def _as_pool(questions) -> QuestionPool:
+        """질문 목록을 qid 비트마스크가 있는 풀로 변환 (은행 풀은 그대로 사용)"""
+        if hasattr(questions, "mask"):
+            return questions
+        return QuestionPool.from_list(list(questions))
         
-        return random.sample(questions, count)
+    def generate_base_questions(self, filtered_bank: Dict[str, List[Dict[str, Any]]],
+                                sampler: QuestionSampler = None) -> Dict[str, Any]:
+        """기본 질문 생성 (각 축당 2개)
         
-    def generate_base_questions(self, filtered_bank: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
-        """기본 질문 생성 (각 축당 2개)"""
+        sampler를 넘기면 이후 generate_additional_questions가 같은 커서에서 이어서 뽑는다.
+        """
+        sampler = sampler or QuestionSampler(self._rng)
         base_questions = []
         base_ids = []
-        used_prompts = {axis: set() for axis in self.config.AXES}
+        used = {axis: 0 for axis in self.config.AXES}
         
         for axis in self.config.AXES:
-            axis_questions = filtered_bank.get(axis, [])
+            axis_questions = self._as_pool(filtered_bank.get(axis, []))
             
             if len(axis_questions) < self.config.BASE_QUESTIONS_PER_AXIS:
                 raise ValueError(f"{axis} 축의 질문이 {self.config.BASE_QUESTIONS_PER_AXIS}개 미만입니다.")
                 
             selected_questions = self._sample_random_questions(
-                axis_questions, self.config.BASE_QUESTIONS_PER_AXIS
+                axis_questions, axis, used, self.config.BASE_QUESTIONS_PER_AXIS, sampler
             )
             
             for i, question_data in enumerate(selected_questions, 1):
@@ -79,38 +116,46 @@ class QuestionManager:
                 
                 base_questions.append(question)
                 base_ids.append(question_id)
-                used_prompts[axis].add(question_data["prompt"])
                 
         # 질문 순서 섞기
-        random.shuffle(base_questions)
+        self._rng.shuffle(base_questions)
         
         return {
             "questions": base_questions,
             "ids": base_ids,
-            "used_prompts": used_prompts
+            "used": used
         }
         
+    def plan_quiz(self, filtered_bank: Dict[str, List[Dict[str, Any]]], bank_version: str = "",
+                  seed: Optional[int] = None) -> QuizPlan:
+        """시드 기반 출제 계획 생성 (시드를 생략하면 새로 발급)
+        
+        같은 시드·은행 버전이면 어디서든 같은 기본 문항과 예비 문항이 나온다.
+        """
+        seed = new_plan_seed() if seed is None else seed
+        pools = {axis: self._as_pool(filtered_bank.get(axis, [])) for axis in self.config.AXES}
+        return build_quiz_plan(pools, seed, bank_version)
+        
     def generate_additional_questions(self, filtered_bank: Dict[str, List[Dict[str, Any]]], 
-                                    axis: str, used_prompts: Dict[str, Set[str]], 
-                                    count: int = 2) -> List[Dict[str, Any]]:
-        """추가 질문 생성"""
-        axis_questions = filtered_bank.get(axis, [])
-        
-        # 사용하지 않은 질문들 필터링
-        available_questions = [
-            q for q in axis_questions 
-            if q["prompt"] not in used_prompts[axis]
-        ]
-        
-        if not available_questions:
+                                    axis: str, used: Dict[str, int], 
+                                    count: int = 2,
+                                    sampler: QuestionSampler = None) -> List[Dict[str, Any]]:
+        """추가 질문 생성 (used: 축별 사용한 qid 비트마스크)"""
+        axis_questions = self._as_pool(filtered_bank.get(axis, []))
+        
+        # 사용하지 않은 질문 = 풀 마스크에서 사용 비트 제거
+        if not axis_questions.mask & ~used[axis]:
             # 사용 가능한 질문이 없으면 빈 리스트 반환
             return []
             
-        selected_questions = self._sample_random_questions(available_questions, count)
+        selected_questions = self._sample_random_questions(
+            axis_questions, axis, used, count, sampler
+        )
         additional_questions = []
         
-        for question_data in selected_questions:
-            question_id = f"extra_{axis}_{random.randint(1, 10**9)}"
+        for i, question_data in enumerate(selected_questions, 1):
+            # 사용 비트로 qid는 세션 안에서 유일, 부족분 중복 채움만 순번으로 구분
+            question_id = f"extra_{axis}_{question_data['qid']}_{i}"
             question = {
                 "id": question_id,
                 "axis": axis,
@@ -119,10 +164,29 @@ class QuestionManager:
             }
             
             additional_questions.append(question)
-            used_prompts[axis].add(question_data["prompt"])
             
         return additional_questions
         
+    def generate_adaptive_question(self, filtered_bank: Dict[str, List[Dict[str, Any]]],
+                                   state: Dict[str, Dict[str, Any]], used: Dict[str, int],
+                                   selector: AdaptiveSelector = None) -> Optional[Dict[str, Any]]:
+        """적응형 다음 질문 생성 (모든 축이 신뢰도 기준에 도달하면 None)
+        
+        state는 AdaptiveSelector.new_state()로 만들고, 답변마다 selector.update로 갱신한다.
+        """
+        selector = selector or AdaptiveSelector()
+        pools = {axis: self._as_pool(filtered_bank.get(axis, [])) for axis in self.config.AXES}
+        picked = selector.pick(state, pools, used)
+        if picked is None:
+            return None
+            
+        axis, question_data = picked
+        return {
+            "id": f"adaptive_{axis}_{question_data['qid']}",
+            "axis": axis,
+            **question_data
+        }
+        
     def validate_question_bank(self, questions_data: Dict[str, List[Dict[str, Any]]], 
                              audience: str) -> bool:
         """질문 데이터 유효성 검사"""
@@ -148,4 +212,8 @@ class QuestionManager:
                     if not all(field in choice_data for field in ["label", "value"]):
                         return False
                         
-        return True
\ No newline at end of file
+        return True
+        
+    def validate_question_file(self, path: str = None) -> Dict[str, Any]:
+        """질문 파일을 스트리밍으로 한 번에 검증 (모든 대상, 줄 번호 포함 리포트)"""
+        return StreamingBankValidator().validate_file(path or self.config.QUESTIONS_FILE)
@@ -0,0 +1,91 @@
+"""
+퀴즈 계획 모듈
+세션 시드와 은행 버전만으로 기본 문항·출제 순서·축별 동점 해소 예비 문항을 결정적으로 생성
+(같은 시드·같은 은행이면 어느 워커에서든 같은 계획이 나오므로 문항을 저장할 필요가 없음)
+
+난수는 전역 random 대신 (시드, 은행 버전, 용도)로 초기화한 세션 전용 Random만 사용한다.
+축마다 별도 스트림을 쓰므로 한 축의 풀이 바뀌어도 다른 축의 문항은 그대로다.
+은행 버전은 파일 내용의 해시(question_bank.content_version)이므로 수정 시각이 다른 노드끼리도 같다.
+"""
+
+import random
+import secrets
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+from src.config import AppConfig
+from src.question_bank import QuestionPool
+from src.sampler import QuestionSampler
+from src.session import QuizSession
+
+SEED_BITS = 32
+
+
+class QuizPlan(NamedTuple):
+    """한 세션의 출제 계획"""
+    seed: int
+    bank_version: str
+    base: Tuple[Tuple[str, int], ...]  # 표시 순서의 (축, qid)
+    reserve: Dict[str, Tuple[int, ...]]  # 축별 동점 해소용 예비 qid (출제 순서)
+
+
+def new_plan_seed() -> int:
+    """새 세션 시드"""
+    return secrets.randbits(SEED_BITS)
+
+
+def plan_rng(seed: int, bank_version: str, stream: str) -> random.Random:
+    """(시드, 은행 버전, 용도)별 독립 난수 생성기 (문자열 시드라 프로세스와 무관하게 재현됨)"""
+    return random.Random(f"{seed}:{bank_version}:{stream}")
+
+
+def build_quiz_plan(pools: Mapping[str, QuestionPool], seed: int, bank_version: str,
+                    base_per_axis: Optional[int] = None,
+                    max_per_axis: Optional[int] = None) -> QuizPlan:
+    """시드·은행 버전으로 출제 계획 생성
+    
+    축마다 같은 지연 순열 커서에서 기본 문항 base_per_axis개와 예비 문항을
+    max_per_axis개까지 이어서 뽑는다. 기본 문항이 부족하면 ValueError.
+    """
+    base_per_axis = AppConfig.BASE_QUESTIONS_PER_AXIS if base_per_axis is None else base_per_axis
+    max_per_axis = AppConfig.MAX_QUESTIONS_PER_AXIS if max_per_axis is None else max_per_axis
+    base, reserve = [], {}
+    for axis in AppConfig.AXES:
+        pool = pools.get(axis, ())
+        sampler = QuestionSampler(plan_rng(seed, bank_version, axis))
+        drawn = sampler.draw(pool, axis, {axis: 0}, max_per_axis)
+        if len(drawn) < base_per_axis:
+            raise ValueError(f"{axis} 축 문항이 {base_per_axis}개 미만입니다.")
+        base += [(axis, question["qid"]) for question in drawn[:base_per_axis]]
+        reserve[axis] = tuple(question["qid"] for question in drawn[base_per_axis:])
+    
+    plan_rng(seed, bank_version, "order").shuffle(base)
+    return QuizPlan(seed, bank_version, tuple(base), reserve)
+
+
+def start_quiz(plan: QuizPlan, mode: str) -> QuizSession:
+    """계획의 기본 문항으로 새 세션 생성"""
+    quiz = QuizSession(mode, plan.bank_version, seed=plan.seed)
+    for axis, qid in plan.base:
+        quiz.add_item(axis, qid)
+    return quiz
+
+
+def next_reserve(plan: QuizPlan, quiz: QuizSession, axis: str) -> Optional[int]:
+    """축의 다음 예비 qid (이미 낸 추가 문항 수 기준, 소진되면 None)"""
+    extras = sum(1 for _, item_axis, _, is_extra in quiz.items() if is_extra and item_axis == axis)
+    reserve = plan.reserve.get(axis, ())
+    return reserve[extras] if extras < len(reserve) else None
+
+
+def add_tiebreakers(plan: QuizPlan, quiz: QuizSession) -> List[int]:
+    """기본 문항이 모두 답해졌는데 동점인 축마다 예비 문항 1개 추가, 추가한 위치 반환
+    
+    축당 추가 문항은 한 번만 낸다 (앱의 동점 해소 규칙과 같음). 예비가 소진된 축은 건너뛴다.
+    """
+    added = []
+    for axis in AppConfig.AXES:
+        if quiz.total(axis) != AppConfig.BASE_QUESTIONS_PER_AXIS or quiz.diff(axis) or quiz.has_extra(axis):
+            continue
+        qid = next_reserve(plan, quiz, axis)
+        if qid is not None:
+            added.append(quiz.add_item(axis, qid, is_extra=True))
+    return added
@@ -0,0 +1,176 @@
+"""
+결과 재채점 모듈
+DataUtils.export_results_to_dict 형식의 JSONL 내보내기를 조각 단위로 읽어
+MBTIAnalyzer로 다시 채점하고, 프로세스 풀로 병렬 처리하며 순서대로 기록
+"""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from src.mbti_analyzer import MBTIAnalyzer
+from src.utils import DataUtils
+
+# 워커 프로세스별 분석기 (조각마다 새로 만들지 않음)
+_analyzer: Optional[MBTIAnalyzer] = None
+
+
+def rescore_record(record: Dict[str, Any], analyzer: MBTIAnalyzer) -> Dict[str, Any]:
+    """내보낸 결과 하나를 현재 규칙으로 재채점 (결과 외의 추가 필드는 유지)"""
+    answers = record["answers"]
+    model = analyzer.compute_mbti(answers)
+    rescored = dict(record)
+    rescored.update(DataUtils.export_results_to_dict(model, answers))
+    return rescored
+
+
+def rescore_chunk(first_line: int, lines: List[str]) -> Dict[str, Any]:
+    """JSONL 줄 묶음 재채점 (워커에서 실행)
+    
+    반환 형식:
+        {"output": str, "records": int, "changed": int,
+         "errors": [(줄 번호, 메시지), ...], "timings": {단계: 초}}
+    """
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = MBTIAnalyzer()
+    
+    timings = {"parse": 0.0, "score": 0.0, "encode": 0.0}
+    out, errors = [], []
+    changed = 0
+    for offset, line in enumerate(lines):
+        if not line.strip():
+            continue
+        line_no = first_line + offset
+        
+        t0 = time.perf_counter()
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            errors.append((line_no, f"JSON 오류: {e.msg}"))
+            continue
+        t1 = time.perf_counter()
+        try:
+            rescored = rescore_record(record, _analyzer)
+        except (KeyError, TypeError) as e:
+            errors.append((line_no, f"결과 형식 오류: {e!r}"))
+            continue
+        t2 = time.perf_counter()
+        out.append(json.dumps(rescored, ensure_ascii=False))
+        t3 = time.perf_counter()
+        
+        if record.get("mbti_type") != rescored["mbti_type"]:
+            changed += 1
+        timings["parse"] += t1 - t0
+        timings["score"] += t2 - t1
+        timings["encode"] += t3 - t2
+    
+    return {
+        "output": "".join(f"{line}\n" for line in out),
+        "records": len(out),
+        "changed": changed,
+        "errors": errors,
+        "timings": timings
+    }
+
+
+def iter_chunks(fp, chunk_lines: int) -> Iterator[Tuple[int, List[str]]]:
+    """파일을 (시작 줄 번호, 줄 목록) 조각으로 나눠 읽음"""
+    chunk, first_line = [], 1
+    for line_no, line in enumerate(fp, start=1):
+        if not chunk:
+            first_line = line_no
+        chunk.append(line)
+        if len(chunk) >= chunk_lines:
+            yield first_line, chunk
+            chunk = []
+    if chunk:
+        yield first_line, chunk
+
+
+class _InlineExecutor:
+    """워커 0개일 때 현재 프로세스에서 바로 실행하는 실행기"""
+    
+    class _Done:
+        def __init__(self, value):
+            self._value = value
+        
+        def result(self):
+            return self._value
+    
+    def submit(self, fn, *args):
+        return self._Done(fn(*args))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+def rescore_file(source: str, output: str, workers: Optional[int] = None,
+                 chunk_lines: int = 2000, max_inflight: Optional[int] = None,
+                 max_error_samples: int = 20) -> Dict[str, Any]:
+    """JSONL 결과 파일 재채점
+    
+    읽기 → 워커 재채점 → 쓰기를 파이프라인으로 돌리며, 처리 중인 조각 수를
+    max_inflight(기본: 워커 수의 2배)로 제한해 메모리를 파일 크기와 무관하게 유지한다.
+    출력은 입력 순서를 유지하며 임시 파일에 쓴 뒤 원자적으로 교체한다.
+    workers가 0이면 현재 프로세스에서 처리한다.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    max_inflight = max_inflight or max(2, workers * 2)
+    stats = {
+        "records": 0, "changed": 0, "errors": 0, "error_samples": [],
+        "chunks": 0, "bytes_in": os.path.getsize(source), "workers": workers,
+        "timings": {"read": 0.0, "parse": 0.0, "score": 0.0, "encode": 0.0,
+                    "write": 0.0, "wait": 0.0, "total": 0.0}
+    }
+    timings = stats["timings"]
+    started = time.perf_counter()
+    
+    def drain(pending: deque, out):
+        t0 = time.perf_counter()
+        result = pending.popleft().result()
+        t1 = time.perf_counter()
+        out.write(result["output"])
+        timings["wait"] += t1 - t0
+        timings["write"] += time.perf_counter() - t1
+        stats["records"] += result["records"]
+        stats["changed"] += result["changed"]
+        stats["errors"] += len(result["errors"])
+        room = max_error_samples - len(stats["error_samples"])
+        stats["error_samples"].extend(result["errors"][:max(room, 0)])
+        for stage, seconds in result["timings"].items():
+            timings[stage] += seconds
+    
+    tmp_path = f"{output}.tmp"
+    executor = ProcessPoolExecutor(workers) if workers > 0 else _InlineExecutor()
+    try:
+        with executor, open(source, "r", encoding="utf-8") as src, \
+                open(tmp_path, "w", encoding="utf-8") as out:
+            pending: deque = deque()
+            chunks = iter_chunks(src, chunk_lines)
+            while True:
+                t0 = time.perf_counter()
+                chunk = next(chunks, None)
+                timings["read"] += time.perf_counter() - t0
+                if chunk is None:
+                    break
+                stats["chunks"] += 1
+                pending.append(executor.submit(rescore_chunk, *chunk))
+                if len(pending) >= max_inflight:
+                    drain(pending, out)
+            while pending:
+                drain(pending, out)
+        os.replace(tmp_path, output)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    timings["total"] = time.perf_counter() - started
+    stats["records_per_sec"] = stats["records"] / timings["total"] if timings["total"] else 0.0
+    return stats
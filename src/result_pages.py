@@ -0,0 +1,177 @@
+"""
+결과 페이지 캐시 모듈
+결과 화면의 정적인 부분(유형 헤더, 축별 비율, 팁, MBTI 의미)을 (유형, 축별 응답 수, 로케일)별로
+한 번만 마크다운으로 만들어 두고 재사용. 제출 때는 사용자별 응답 로그만 새로 조립한다.
+
+축마다 결과는 기본 문항 수와 동점 해소 1문항으로 정해지는 몇 가지 응답 수 조합뿐이므로
+앱이 실제로 낼 수 있는 페이지는 시작할 때 미리 만들어 둔다(warm).
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+from src.config import AppConfig
+
+AxisCounts = Tuple[int, int]  # 축의 (첫째 극, 둘째 극) 응답 수
+ResultKey = Tuple[str, Tuple[AxisCounts, ...], str]  # (표시 유형, 축 순서의 응답 수, 로케일)
+
+# 로케일별 결과 화면 문구 (팁·의미 목록은 AppConfig의 기본 로케일 문구)
+RESULT_TEXT: Dict[str, Dict[str, object]] = {
+    "ko": {
+        "title": "결과",
+        "ratios": "축별 선택 비율",
+        "ratio_line": "- {axis}: {a} {pa}% / {b} {pb}%  (총 {total}문항)",
+        "tips_title": "팁",
+        "tips": AppConfig.COMMON_TIPS,
+        "meanings_title": "MBTI 의미",
+        "meanings": AppConfig.MEANINGS,
+        "log_title": "응답 로그",
+    },
+}
+
+
+def percent(a: int, b: int) -> Tuple[int, int]:
+    """두 응답 수를 합이 100인 정수 백분율로 변환 (응답이 없으면 (0, 0))"""
+    total = a + b
+    if total == 0:
+        return (0, 0)
+    pa = int(round(a * 100.0 / total))
+    return (pa, 100 - pa)
+
+
+def display_type(counts: Mapping[str, AxisCounts]) -> str:
+    """축별 응답 수로 표시 유형 문자열 생성 (동점 축은 "(EI)"처럼 두 극을 함께 표시)"""
+    tokens = []
+    for axis in AppConfig.AXES:
+        a, b = AppConfig.POLES[axis]
+        ca, cb = counts[axis]
+        tokens.append(f"({a}{b})" if ca == cb else a if ca > cb else b)
+    return "".join(tokens)
+
+
+def result_key(type_text: str, counts: Mapping[str, AxisCounts], locale: str) -> ResultKey:
+    return (type_text, tuple(tuple(counts[axis]) for axis in AppConfig.AXES), locale)
+
+
+def render_result_markdown(type_text: str, counts: Mapping[str, AxisCounts], locale: str) -> str:
+    """앱 결과 화면의 정적인 부분을 마크다운 한 덩어리로 렌더링 (유형 헤더는 HTML)"""
+    text = RESULT_TEXT.get(locale)
+    if text is None:
+        raise ValueError(f"결과 화면 문구가 없는 로케일입니다: {locale}")
+    
+    blocks = [f"### {text['title']}", f"<h2>{type_text}</h2>", f"### {text['ratios']}"]
+    lines = []
+    for axis in AppConfig.AXES:
+        a, b = AppConfig.POLES[axis]
+        ca, cb = counts[axis]
+        pa, pb = percent(ca, cb)
+        lines.append(text["ratio_line"].format(axis=axis, a=a, b=b, pa=pa, pb=pb, total=ca + cb))
+    blocks.append("\n".join(lines))
+    
+    blocks.append(f"### {text['tips_title']}")
+    blocks += list(text["tips"])
+    blocks.append(f"### {text['meanings_title']}")
+    blocks.append("\n".join(f"- **{name}**: {description}" for name, description in text["meanings"]))
+    blocks.append(f"### {text['log_title']}")
+    return "\n\n".join(blocks)
+
+
+def reachable_axis_counts(base_per_axis: Optional[int] = None) -> List[AxisCounts]:
+    """한 축이 가질 수 있는 응답 수 조합 (기본 문항 전부 + 동점이면 추가 1문항)
+    
+    기본 2문항이면 (2, 0), (1, 1), (0, 2), (2, 1), (1, 2). 예비 문항이 없어 동점으로
+    끝나는 경우도 포함한다.
+    """
+    base = AppConfig.BASE_QUESTIONS_PER_AXIS if base_per_axis is None else base_per_axis
+    outcomes = [(a, base - a) for a in range(base, -1, -1)]
+    if base % 2 == 0:
+        half = base // 2
+        outcomes += [(half + 1, half), (half, half + 1)]
+    return outcomes
+
+
+class ResultPage(NamedTuple):
+    """캐시된 결과 페이지"""
+    display_type: str
+    markdown: str
+
+
+class ResultPageCache:
+    """(유형, 축별 응답 수, 로케일) → 렌더링된 결과 페이지
+    
+    render(유형, 축별 응답 수, 로케일)은 같은 키에 대해 항상 같은 문자열을 돌려줘야 한다.
+    maxsize를 넘으면 가장 오래 쓰지 않은 페이지부터 버린다 (None이면 무제한).
+    """
+    
+    def __init__(self, render: Callable[[str, Mapping[str, AxisCounts], str], str] = render_result_markdown,
+                 maxsize: Optional[int] = 4096):
+        self._render = render
+        self.maxsize = maxsize
+        self._pages: "OrderedDict[ResultKey, ResultPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._pages)
+    
+    def get(self, type_text: str, counts: Mapping[str, AxisCounts],
+            locale: Optional[str] = None) -> ResultPage:
+        """캐시된 페이지 반환 (없으면 렌더링해 보관)"""
+        locale = AppConfig.LOCALE if locale is None else locale
+        key = result_key(type_text, counts, locale)
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return page
+            self.misses += 1
+        
+        # 렌더링은 잠금 밖에서 (동시에 같은 키를 만들어도 결과는 같음)
+        page = ResultPage(type_text, self._render(type_text, counts, locale))
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while self.maxsize is not None and len(self._pages) > self.maxsize:
+                self._pages.popitem(last=False)
+        return page
+    
+    def page_for(self, counts: Mapping[str, AxisCounts], locale: Optional[str] = None) -> ResultPage:
+        """축별 응답 수로 표시 유형을 정해 페이지 반환"""
+        return self.get(display_type(counts), counts, locale)
+    
+    def warm(self, locales: Optional[Iterable[str]] = None,
+             axis_counts: Optional[Iterable[AxisCounts]] = None) -> int:
+        """축별 응답 수 조합의 모든 곱에 대해 페이지를 미리 렌더링, 새로 만든 수 반환"""
+        locales = [AppConfig.LOCALE] if locales is None else list(locales)
+        axis_counts = reachable_axis_counts() if axis_counts is None else list(axis_counts)
+        created = 0
+        for locale in locales:
+            for combo in itertools.product(axis_counts, repeat=len(AppConfig.AXES)):
+                counts = dict(zip(AppConfig.AXES, combo))
+                type_text = display_type(counts)
+                if result_key(type_text, counts, locale) not in self._pages:
+                    self.get(type_text, counts, locale)
+                    created += 1
+        return created
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"pages": len(self._pages), "hits": self.hits, "misses": self.misses}
+
+
+_shared_pages: Optional[ResultPageCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_result_pages() -> ResultPageCache:
+    """프로세스 공유 결과 페이지 캐시 (처음 호출할 때 도달 가능한 페이지를 모두 렌더링)"""
+    global _shared_pages
+    with _shared_lock:
+        if _shared_pages is None:
+            pages = ResultPageCache()
+            pages.warm()
+            _shared_pages = pages
+        return _shared_pages
@@ -0,0 +1,164 @@
+"""
+재개 토큰 모듈
+퀴즈 상태 전체(대상, 은행 버전 지문, 출제 문항, 답변 비트)를 수십 바이트로 비트 패킹해
+URL 파라미터 하나에 담음. 서버 저장소 없이 어느 워커에서든 세션을 다시 만들 수 있음
+
+비트 배치 (앞에서부터, 마지막 바이트는 0으로 채움):
+    공통: 형식 버전 4 | 대상 번호 4 | 은행 지문(crc32) 32
+    형식 1 (문항 목록): 문항 수 8 | qid 비트 폭 5
+        문항마다: 축 2 | 추가 문항 1 | qid (폭만큼) | 응답 여부 1 | 두 번째 극 1
+    형식 2 (시드 세션): 시드 32 | 추가 문항 수 4 | 추가 문항마다 축 2
+        문항마다: 응답 여부 1 | 두 번째 극 1
+그 뒤에 본문의 crc32 4바이트를 붙이고 URL-safe base64(패딩 없음)로 인코딩한다.
+형식 2는 문항을 quiz_plan의 계획으로 다시 만들므로 qid를 싣지 않는다.
+"""
+
+import base64
+import binascii
+import zlib
+from typing import Callable, Optional
+from src.config import AppConfig
+from src.question_bank import QuestionBank
+from src.quiz_plan import SEED_BITS, build_quiz_plan, next_reserve, start_quiz
+from src.session import AXIS_INDEX, QuizSession
+
+FORMAT_ITEMS = 1
+FORMAT_SEEDED = 2
+_MAX_EXTRAS = 15
+_CHECKSUM_BYTES = 4
+
+
+def bank_fingerprint(bank_version: str) -> int:
+    """은행 버전 문자열의 32비트 지문"""
+    return zlib.crc32(bank_version.encode("utf-8"))
+
+
+class _BitWriter:
+    
+    def __init__(self):
+        self.value = 0
+        self.length = 0
+    
+    def write(self, value: int, width: int):
+        self.value = (self.value << width) | value
+        self.length += width
+    
+    def to_bytes(self) -> bytes:
+        padding = -self.length % 8
+        return (self.value << padding).to_bytes((self.length + padding) // 8, "big")
+
+
+class _BitReader:
+    
+    def __init__(self, data: bytes):
+        self.value = int.from_bytes(data, "big")
+        self.remaining = len(data) * 8
+    
+    def read(self, width: int) -> int:
+        if width > self.remaining:
+            raise ValueError("재개 토큰이 잘렸습니다.")
+        self.remaining -= width
+        return (self.value >> self.remaining) & ((1 << width) - 1)
+
+
+def encode_resume_token(quiz: QuizSession) -> str:
+    """세션을 재개 토큰 문자열로 인코딩 (샘플러 커서는 제외)
+
+    시드 세션은 계획대로(start_quiz/next_reserve) 문항을 추가했다고 보고 형식 2로 싣는다.
+    """
+    extras = [axis for _, axis, _, is_extra in quiz.items() if is_extra]
+    seeded = quiz.seed is not None and len(extras) <= _MAX_EXTRAS
+    writer = _BitWriter()
+    writer.write(FORMAT_SEEDED if seeded else FORMAT_ITEMS, 4)
+    writer.write(AppConfig.AUDIENCES.index(quiz.mode), 4)
+    writer.write(bank_fingerprint(quiz.bank_version), 32)
+    if seeded:
+        writer.write(quiz.seed, SEED_BITS)
+        writer.write(len(extras), 4)
+        for axis in extras:
+            writer.write(AXIS_INDEX[axis], 2)
+        for position in range(len(quiz)):
+            answer = quiz.answer(position)
+            writer.write(answer is not None, 1)
+            writer.write(answer or 0, 1)
+    else:
+        qid_width = max((qid.bit_length() for _, _, qid, _ in quiz.items()), default=0)
+        writer.write(len(quiz), 8)
+        writer.write(qid_width, 5)
+        for position, axis, qid, is_extra in quiz.items():
+            answer = quiz.answer(position)
+            writer.write(AXIS_INDEX[axis], 2)
+            writer.write(int(is_extra), 1)
+            writer.write(qid, qid_width)
+            writer.write(answer is not None, 1)
+            writer.write(answer or 0, 1)
+    
+    payload = writer.to_bytes()
+    checksum = zlib.crc32(payload).to_bytes(_CHECKSUM_BYTES, "big")
+    return base64.urlsafe_b64encode(payload + checksum).rstrip(b"=").decode("ascii")
+
+
+def decode_resume_token(token: str,
+                        bank_for: Optional[Callable[[str], QuestionBank]] = None) -> QuizSession:
+    """재개 토큰을 세션으로 복원
+    
+    bank_for(대상)가 주어지면 그 대상의 현재 은행과 버전 지문을 비교하고 세션의
+    bank_version으로 설정한다. 형식 1은 문항이 그 대상의 풀에 있는지도 확인한다. 형식 2(시드 세션)는
+    그 은행으로 계획을 다시 만들므로 bank_for가 필요하다. 토큰이 손상됐거나 은행이 바뀌었으면 ValueError.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError("재개 토큰 형식이 잘못되었습니다.")
+    if len(raw) <= _CHECKSUM_BYTES:
+        raise ValueError("재개 토큰이 잘렸습니다.")
+    payload, checksum = raw[:-_CHECKSUM_BYTES], raw[-_CHECKSUM_BYTES:]
+    if zlib.crc32(payload).to_bytes(_CHECKSUM_BYTES, "big") != checksum:
+        raise ValueError("재개 토큰 체크섬이 맞지 않습니다.")
+    
+    reader = _BitReader(payload)
+    token_format = reader.read(4)
+    if token_format not in (FORMAT_ITEMS, FORMAT_SEEDED):
+        raise ValueError("지원하지 않는 재개 토큰 형식입니다.")
+    audience_index = reader.read(4)
+    if audience_index >= len(AppConfig.AUDIENCES):
+        raise ValueError(f"알 수 없는 대상 번호입니다: {audience_index}")
+    mode = AppConfig.AUDIENCES[audience_index]
+    fingerprint = reader.read(32)
+    
+    bank = bank_for(mode) if bank_for is not None else None
+    if bank is not None and bank_fingerprint(bank.version) != fingerprint:
+        raise ValueError("질문 은행이 바뀌어 재개할 수 없습니다.")
+    
+    if token_format == FORMAT_SEEDED:
+        if bank is None:
+            raise ValueError("시드 재개 토큰을 복원하려면 질문 은행이 필요합니다.")
+        plan = build_quiz_plan(bank.pool(mode), reader.read(SEED_BITS), bank.version)
+        quiz = start_quiz(plan, mode)
+        for _ in range(reader.read(4)):
+            axis = AppConfig.AXES[reader.read(2)]
+            qid = next_reserve(plan, quiz, axis)
+            if qid is None:
+                raise ValueError(f"{axis} 축 예비 문항이 부족합니다.")
+            quiz.add_item(axis, qid, is_extra=True)
+        for position in range(len(quiz)):
+            answered, pole_index = reader.read(1), reader.read(1)
+            if answered:
+                quiz.set_answer(position, pole_index)
+        return quiz
+    
+    quiz = QuizSession(mode, bank.version if bank is not None else "")
+    pools = bank.pool(mode) if bank is not None else None
+    count, qid_width = reader.read(8), reader.read(5)
+    for _ in range(count):
+        axis = AppConfig.AXES[reader.read(2)]
+        is_extra = bool(reader.read(1))
+        qid = reader.read(qid_width)
+        # 은행이 있으면 그 대상의 풀에 있는 문항만 허용 (범위 밖·다른 대상 문항은 렌더링 때 깨짐)
+        if pools is not None and not (getattr(pools.get(axis), "mask", 0) >> qid) & 1:
+            raise ValueError(f"{mode} 대상의 {axis} 축에 없는 문항입니다: qid={qid}")
+        position = quiz.add_item(axis, qid, is_extra)
+        answered, pole_index = reader.read(1), reader.read(1)
+        if answered:
+            quiz.set_answer(position, pole_index)
+    return quiz
@@ -0,0 +1,81 @@
+"""
+문항 샘플링 모듈
+풀 크기와 무관하게 k개의 미사용 문항을 O(k) 시간/메모리로 뽑는 세션별 샘플러
+"""
+
+import random
+from typing import Dict, List, Optional, Mapping, Sequence
+
+
+class LazyPermutation:
+    """필요한 만큼만 전개되는 0..n-1 무작위 순열 (희소 Fisher-Yates)
+    
+    실제로 뒤섞인 위치만 딕셔너리에 기록하므로 n이 커도
+    지금까지 꺼낸 개수만큼의 메모리만 사용한다.
+    """
+    
+    __slots__ = ("size", "cursor", "_swaps", "_rng")
+    
+    def __init__(self, size: int, rng: Optional[random.Random] = None):
+        self.size = size
+        self.cursor = 0
+        self._swaps: Dict[int, int] = {}
+        self._rng = rng or random.Random()
+    
+    def next(self) -> Optional[int]:
+        """다음 위치 반환 (모두 소진되면 None)"""
+        if self.cursor >= self.size:
+            return None
+        
+        cursor = self.cursor
+        j = self._rng.randrange(cursor, self.size)
+        picked = self._swaps.get(j, j)
+        # j 자리에 cursor 자리 값을 옮기고, 다시 볼 일 없는 cursor 자리는 삭제
+        self._swaps[j] = self._swaps.pop(cursor, cursor)
+        if j == cursor:
+            del self._swaps[j]
+        self.cursor = cursor + 1
+        return picked
+    
+    @property
+    def remaining(self) -> int:
+        return self.size - self.cursor
+
+
+class QuestionSampler:
+    """세션별 축 샘플러
+    
+    축마다 풀 위의 지연 순열 커서를 하나씩 두고, 기본 문항과 추가 문항을
+    모두 같은 커서에서 이어서 뽑는다. 같은 커서에서 나온 문항은 다시 나오지
+    않으므로 사용 여부 확인은 커서 밖에서 쓰인 문항에 대해서만 의미가 있다.
+    """
+    
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._rng = rng or random.Random()
+        self._cursors: Dict[str, LazyPermutation] = {}
+    
+    def draw(self, pool: Sequence[Mapping], axis: str, used: Dict[str, int],
+             count: int) -> List[Mapping]:
+        """pool에서 used에 없는 문항을 최대 count개 뽑고 used 비트를 켬"""
+        cursor = self._cursors.get(axis)
+        if cursor is None or cursor.size != len(pool):
+            cursor = LazyPermutation(len(pool), self._rng)
+            self._cursors[axis] = cursor
+        
+        picked = []
+        while len(picked) < count:
+            position = cursor.next()
+            if position is None:
+                break
+            question = pool[position]
+            qid = question["qid"]
+            if (used[axis] >> qid) & 1:
+                continue
+            used[axis] |= 1 << qid
+            picked.append(question)
+        return picked
+    
+    def remaining(self, axis: str) -> Optional[int]:
+        """커서에 남은 위치 수 (아직 뽑은 적 없는 축이면 None)"""
+        cursor = self._cursors.get(axis)
+        return cursor.remaining if cursor else None
@@ -0,0 +1,207 @@
+"""
+세션 모델 모듈
+문항은 공유 은행의 (축, qid) 번호로만, 답변은 축별 비트필드로만 들고 있는 압축 세션 표현
+(라벨·질문 문구는 렌더링할 때 은행에서 조회)
+"""
+
+import sys
+from array import array
+from typing import Dict, List, Any, Iterator, Mapping, Optional, Tuple
+from src.config import AppConfig
+from src.sampler import QuestionSampler
+
+AXIS_INDEX = {axis: i for i, axis in enumerate(AppConfig.AXES)}
+
+# 문항 코드: (qid << 8) | (축 내 순번 << 4) | (축 번호 << 1) | 추가 문항 여부
+_QID_SHIFT = 8
+_ORDINAL_SHIFT = 4
+_MAX_QID = (1 << (32 - _QID_SHIFT)) - 1
+_MAX_ORDINAL = 15
+
+
+class QuizSession:
+    """한 사용자의 퀴즈 진행 상태
+    
+    축별로 두 개의 정수 비트필드를 둔다. 비트 위치는 그 축 안에서 출제된 순번이다.
+    - answered: 답한 문항
+    - second: 두 번째 극(예: I, N, F, P)을 고른 문항
+    second 비트필드는 MBTIAnalyzer.axis_path_mask와 같은 형식이다.
+    극별 개수는 popcount로 바로 구하므로 재실행마다 답변을 다시 세지 않는다.
+    앱의 결과(축당 추가 문항 한 번, 2+1 규칙)는 model()로 구한다. OUTCOME_TABLES는 동점마다
+    ADDITIONAL_QUESTIONS_PER_AXIS개씩 더 보는 적응형 규칙의 표라서 이 세션의 결과가 아니다.
+    """
+    
+    __slots__ = ("mode", "bank_version", "seed", "_sampler", "_items", "_axis_len",
+                 "_answered", "_second")
+    
+    def __init__(self, mode: str, bank_version: str = "",
+                 sampler: Optional[QuestionSampler] = None, seed: Optional[int] = None):
+        self.mode = mode
+        self.bank_version = bank_version
+        # 시드가 있으면 문항은 quiz_plan의 계획(시드 + 은행 버전)으로 다시 만들 수 있음
+        self.seed = seed
+        # 샘플러(난수 상태 약 2.5 KB)는 시드 없는 이전 세션의 추가 문항 추첨에서만 쓰므로 필요할 때 생성
+        self._sampler = sampler
+        self._items = array("I")
+        self._axis_len = [0] * len(AppConfig.AXES)
+        self._answered = [0] * len(AppConfig.AXES)
+        self._second = [0] * len(AppConfig.AXES)
+    
+    @property
+    def sampler(self) -> QuestionSampler:
+        """시드 없는 세션의 문항 샘플러 (처음 접근할 때 생성)"""
+        if self._sampler is None:
+            self._sampler = QuestionSampler()
+        return self._sampler
+    
+    # ----------------------- 문항 -----------------------
+    def add_item(self, axis: str, qid: int, is_extra: bool = False) -> int:
+        """문항 추가 후 표시 순서상 위치 반환"""
+        axis_index = AXIS_INDEX[axis]
+        ordinal = self._axis_len[axis_index]
+        if qid > _MAX_QID or ordinal > _MAX_ORDINAL:
+            raise ValueError(f"세션에 담을 수 없는 문항입니다: {axis} qid={qid}, 순번={ordinal}")
+        self._items.append((qid << _QID_SHIFT) | (ordinal << _ORDINAL_SHIFT) |
+                           (axis_index << 1) | int(is_extra))
+        self._axis_len[axis_index] = ordinal + 1
+        return len(self._items) - 1
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def item(self, position: int) -> Tuple[str, int, bool]:
+        """위치의 (축, qid, 추가 문항 여부)"""
+        code = self._items[position]
+        return (AppConfig.AXES[(code >> 1) & 0x7], code >> _QID_SHIFT, bool(code & 1))
+    
+    def items(self) -> Iterator[Tuple[int, str, int, bool]]:
+        """(위치, 축, qid, 추가 문항 여부)를 표시 순서대로"""
+        for position in range(len(self._items)):
+            yield (position,) + self.item(position)
+    
+    def question(self, pools: Mapping[str, Any], position: int) -> Mapping:
+        """위치의 질문을 공유 은행 풀에서 조회"""
+        axis, qid, _ = self.item(position)
+        return pools[axis].by_qid(qid)
+    
+    def has_extra(self, axis: str) -> bool:
+        return any(extra and item_axis == axis for _, item_axis, _, extra in self.items())
+    
+    def used_masks(self) -> Dict[str, int]:
+        """축별 출제한 qid 비트마스크 (QuestionSampler.draw의 used 인자 형식)"""
+        used = {axis: 0 for axis in AppConfig.AXES}
+        for _, axis, qid, _ in self.items():
+            used[axis] |= 1 << qid
+        return used
+    
+    # ----------------------- 답변 -----------------------
+    def _bit(self, position: int) -> Tuple[int, int]:
+        code = self._items[position]
+        return (code >> 1) & 0x7, 1 << ((code >> _ORDINAL_SHIFT) & 0xF)
+    
+    def answer(self, position: int) -> Optional[int]:
+        """위치의 답 (0: 첫 번째 극, 1: 두 번째 극, 미응답이면 None)"""
+        axis_index, bit = self._bit(position)
+        if not self._answered[axis_index] & bit:
+            return None
+        return 1 if self._second[axis_index] & bit else 0
+    
+    def set_answer(self, position: int, pole_index: int) -> bool:
+        """답 기록 (실제로 바뀌었으면 True)"""
+        if self.answer(position) == pole_index:
+            return False
+        axis_index, bit = self._bit(position)
+        self._answered[axis_index] |= bit
+        if pole_index:
+            self._second[axis_index] |= bit
+        else:
+            self._second[axis_index] &= ~bit
+        return True
+    
+    def clear_answer(self, position: int) -> bool:
+        """답 삭제 (있었으면 True)"""
+        axis_index, bit = self._bit(position)
+        if not self._answered[axis_index] & bit:
+            return False
+        self._answered[axis_index] &= ~bit
+        self._second[axis_index] &= ~bit
+        return True
+    
+    @property
+    def answered_count(self) -> int:
+        return sum(bin(mask).count("1") for mask in self._answered)
+    
+    def is_complete(self) -> bool:
+        """출제된 모든 문항에 답했는지"""
+        return all(self._answered[i] == (1 << n) - 1 for i, n in enumerate(self._axis_len))
+    
+    # ----------------------- 집계 -----------------------
+    def counts(self, axis: str) -> Tuple[int, int]:
+        """축의 (첫 번째 극, 두 번째 극) 선택 수"""
+        axis_index = AXIS_INDEX[axis]
+        second = bin(self._second[axis_index]).count("1")
+        return bin(self._answered[axis_index]).count("1") - second, second
+    
+    def total(self, axis: str) -> int:
+        return bin(self._answered[AXIS_INDEX[axis]]).count("1")
+    
+    def diff(self, axis: str) -> int:
+        count_a, count_b = self.counts(axis)
+        return abs(count_a - count_b)
+    
+    def axis_masks(self) -> List[int]:
+        """축 순서의 두 번째 극 비트필드 (axis_path_mask 형식, 답하지 않은 비트는 0)
+        
+        MBTIAnalyzer.decode_session은 적응형 규칙으로 경로를 읽으므로 동점 축이 있으면
+        답하지 않은 비트까지 첫 번째 극으로 세어 model()과 달라진다 (예: E,I,E → 3:1, 4문항).
+        기본 문항에서 판정이 끝난 세션에서만 두 결과가 같다.
+        """
+        return list(self._second)
+    
+    def model(self) -> Dict[str, Any]:
+        """compute_mbti와 같은 형식의 결과 딕셔너리"""
+        count, totals, diff = {}, {}, {}
+        mbti_type = ""
+        for axis in AppConfig.AXES:
+            pole_a, pole_b = AppConfig.POLES[axis]
+            count[pole_a], count[pole_b] = self.counts(axis)
+            totals[axis] = count[pole_a] + count[pole_b]
+            diff[axis] = abs(count[pole_a] - count[pole_b])
+            mbti_type += pole_b if count[pole_a] < count[pole_b] else pole_a
+        return {"type": mbti_type, "count": count, "totals": totals, "diff": diff}
+    
+    # ----------------------- 직렬화/크기 -----------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """캐시/저장용 평탄한 딕셔너리 (샘플러 커서는 제외)"""
+        return {
+            "mode": self.mode,
+            "bank_version": self.bank_version,
+            "seed": self.seed,
+            "items": self._items.tolist(),
+            "answered": list(self._answered),
+            "second": list(self._second)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "QuizSession":
+        session = cls(data["mode"], data.get("bank_version", ""), seed=data.get("seed"))
+        session._items = array("I", data["items"])
+        for code in session._items:
+            axis_index = (code >> 1) & 0x7
+            session._axis_len[axis_index] = max(session._axis_len[axis_index],
+                                                ((code >> _ORDINAL_SHIFT) & 0xF) + 1)
+        session._answered = list(data["answered"])
+        session._second = list(data["second"])
+        return session
+    
+    def nbytes(self) -> int:
+        """세션이 직접 들고 있는 객체들의 대략적인 메모리 크기 (샘플러 포함)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self._items) + sys.getsizeof(self.seed)
+        for values in (self._axis_len, self._answered, self._second):
+            size += sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+        if self._sampler is not None:
+            size += (sys.getsizeof(self._sampler) + sys.getsizeof(self._sampler._rng)
+                     + sys.getsizeof(self._sampler._cursors))
+            for cursor in self._sampler._cursors.values():
+                size += sys.getsizeof(cursor) + sys.getsizeof(cursor._swaps)
+        return size
@@ -0,0 +1,177 @@
+"""
+세션 레지스트리 모듈
+진행 중인 QuizSession을 토큰별로 보관하며 마지막 활동 시각과 크기를 추적하고,
+오래 쉬는 세션이나 메모리 예산을 넘는 세션을 세션 저장소로 내보낸 뒤 메모리에서 해제
+
+내보낸 세션은 같은 토큰으로 다시 요청되면 저장소에서 복원된다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional
+from src.config import AppConfig
+from src.session import QuizSession
+from src.session_store import SessionStore, get_session_store
+
+
+class _Entry:
+    __slots__ = ("quiz", "last_active", "nbytes", "saved")
+    
+    def __init__(self, quiz: QuizSession, last_active: float):
+        self.quiz = quiz
+        self.last_active = last_active
+        self.nbytes = quiz.nbytes()
+        self.saved: Optional[Dict[str, Any]] = None
+
+
+class SessionRegistry:
+    """토큰 → QuizSession 보관소 (TTL·메모리 예산 기반 내보내기)
+    
+    항목은 마지막 활동 순서(OrderedDict)로 유지되므로 TTL 검사와 예산 초과 시 정리는
+    앞쪽(가장 오래 쉰 세션)부터 필요한 만큼만 본다. 정리는 touch()마다 함께 수행해
+    별도 스레드 없이도 버려진 세션이 다른 사용자의 활동에 맞춰 해제된다.
+    """
+    
+    def __init__(self, store: SessionStore, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self.store = store
+        self.ttl = AppConfig.SESSION_TTL if ttl is None else ttl
+        self.max_bytes = AppConfig.SESSION_MEMORY_BUDGET if max_bytes is None else max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.expired_count = 0
+        self.budget_evicted_count = 0
+        self.reclaimed_bytes = 0
+        self.revived_count = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, token: str) -> bool:
+        return token in self._entries
+    
+    def get(self, token: str) -> Optional[QuizSession]:
+        """토큰의 세션 (메모리에 없으면 저장소에서 복원, 어디에도 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                return entry.quiz
+        
+        state = self.store.load(token)
+        if not state or "quiz" not in state:
+            return None
+        quiz = QuizSession.from_dict(state["quiz"])
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:  # 그 사이 다른 실행이 먼저 복원함
+                return entry.quiz
+            entry = self._insert(token, quiz)
+            entry.saved = state
+            self.revived_count += 1
+        return quiz
+    
+    def put(self, token: str, quiz: QuizSession):
+        """새 세션 등록 (같은 토큰의 기존 세션은 대체)"""
+        with self._lock:
+            self._insert(token, quiz)
+    
+    def touch(self, token: str, quiz: QuizSession) -> bool:
+        """재실행 끝에 호출: 활동 시각·크기 갱신, 바뀐 상태는 저장소에 기록, 유휴 세션 정리
+        
+        실행 도중 내보내진 세션도 여기서 다시 등록된다. 저장소에 기록했으면 True.
+        """
+        state = {"mode": quiz.mode, "quiz": quiz.to_dict()}
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry.quiz is not quiz:
+                entry = self._insert(token, quiz)
+            else:
+                entry.last_active = self._clock()
+                self._entries.move_to_end(token)
+                size = quiz.nbytes()
+                self._bytes += size - entry.nbytes
+                entry.nbytes = size
+            changed = entry.saved != state
+            if changed:
+                entry.saved = state
+        if changed:
+            self.store.save(token, state)
+        self.sweep()
+        return changed
+    
+    def drop(self, token: str):
+        """세션 삭제 (메모리와 저장소 모두)"""
+        with self._lock:
+            entry = self._entries.pop(token, None)
+            if entry is not None:
+                self._bytes -= entry.nbytes
+        self.store.delete(token)
+    
+    def sweep(self, now: Optional[float] = None) -> int:
+        """TTL이 지난 세션과 예산 초과분을 저장소로 내보내고 해제 (해제한 세션 수 반환)
+        
+        예산 초과 정리는 가장 최근 세션 하나는 남긴다.
+        """
+        now = self._clock() if now is None else now
+        spilled = []
+        with self._lock:
+            while self._entries:
+                token, entry = next(iter(self._entries.items()))
+                if now - entry.last_active >= self.ttl:
+                    self.expired_count += 1
+                elif self._bytes > self.max_bytes and len(self._entries) > 1:
+                    self.budget_evicted_count += 1
+                else:
+                    break
+                del self._entries[token]
+                self._bytes -= entry.nbytes
+                self.reclaimed_bytes += entry.nbytes
+                spilled.append((token, entry))
+        
+        for token, entry in spilled:
+            state = {"mode": entry.quiz.mode, "quiz": entry.quiz.to_dict()}
+            if entry.saved != state:
+                self.store.save(token, state)
+        return len(spilled)
+    
+    def stats(self) -> Dict[str, Any]:
+        """현재 보관 수·바이트와 누적 해제/복원 통계"""
+        with self._lock:
+            return {
+                "live_sessions": len(self._entries),
+                "live_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "expired": self.expired_count,
+                "budget_evicted": self.budget_evicted_count,
+                "reclaimed_bytes": self.reclaimed_bytes,
+                "revived": self.revived_count
+            }
+    
+    def _insert(self, token: str, quiz: QuizSession) -> _Entry:
+        """잠금을 쥔 상태에서 호출"""
+        old = self._entries.pop(token, None)
+        if old is not None:
+            self._bytes -= old.nbytes
+        entry = self._entries[token] = _Entry(quiz, self._clock())
+        self._bytes += entry.nbytes
+        return entry
+
+
+_shared_registry: Optional[SessionRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_session_registry() -> SessionRegistry:
+    """프로세스 공유 세션 레지스트리 (공유 세션 저장소 사용)"""
+    global _shared_registry
+    if _shared_registry is not None:
+        return _shared_registry
+    
+    with _registry_lock:
+        if _shared_registry is None:
+            _shared_registry = SessionRegistry(get_session_store())
+    return _shared_registry
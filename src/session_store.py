@@ -0,0 +1,225 @@
+"""
+세션 저장소 모듈
+진행 중인 퀴즈 상태를 토큰 단위로 서버 측에 보관해 워커 재시작·재접속 후에도 이어서 풀 수 있게 함
+
+저장은 write-behind 방식이다. save()는 메모리 대기열에 최신 상태만 남기고 바로 돌아오며,
+백그라운드 스레드가 모아서 한 트랜잭션으로 기록한다. 같은 스레드가 purge_interval마다
+SESSION_STORE_TTL보다 오래 갱신되지 않은 세션을 지워 파일이 끝없이 커지지 않게 한다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+from src.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+
+def new_session_token() -> str:
+    """URL에 넣을 수 있는 추측 불가능한 세션 토큰"""
+    return secrets.token_urlsafe(12)
+
+
+class SessionStore(ABC):
+    """세션 저장소 인터페이스"""
+    
+    @abstractmethod
+    def save(self, token: str, state: Dict[str, Any]):
+        """토큰의 상태 저장"""
+    
+    @abstractmethod
+    def load(self, token: str) -> Optional[Dict[str, Any]]:
+        """토큰의 상태 (없으면 None)"""
+    
+    @abstractmethod
+    def delete(self, token: str):
+        """토큰의 상태 삭제"""
+    
+    def flush(self):
+        """대기 중인 쓰기를 모두 반영"""
+    
+    def close(self):
+        self.flush()
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 메모리 저장소 (테스트/단일 워커용)
+    
+    SQLite 저장소와 같은 의미를 갖도록 상태를 JSON으로 직렬화해 복사본을 보관한다.
+    """
+    
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def save(self, token: str, state: Dict[str, Any]):
+        encoded = json.dumps(state, ensure_ascii=False)
+        with self._lock:
+            self._data[token] = encoded
+    
+    def load(self, token: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            encoded = self._data.get(token)
+        return json.loads(encoded) if encoded is not None else None
+    
+    def delete(self, token: str):
+        with self._lock:
+            self._data.pop(token, None)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite 저장소 (write-behind 일괄 기록)
+    
+    같은 토큰의 연속 저장은 대기열에서 하나로 합쳐지므로, 클릭이 아무리 잦아도
+    flush_interval마다 세션당 최대 한 번만 디스크에 쓴다.
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            token TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    """
+    
+    def __init__(self, path: str, flush_interval: Optional[float] = None, max_pending: int = 1024,
+                 ttl: Optional[float] = None, purge_interval: Optional[float] = None):
+        self.path = path
+        self.flush_interval = (AppConfig.SESSION_FLUSH_INTERVAL
+                               if flush_interval is None else flush_interval)
+        self.max_pending = max_pending
+        self.ttl = AppConfig.SESSION_STORE_TTL if ttl is None else ttl
+        self.purge_interval = (AppConfig.SESSION_PURGE_INTERVAL
+                               if purge_interval is None else purge_interval)
+        self.flush_count = 0
+        self.written_count = 0
+        self.purged_count = 0
+        self.last_error: Optional[str] = None
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(self._SCHEMA)
+        self._db_lock = threading.Lock()
+        
+        # 토큰 → (직렬화된 상태 또는 삭제 표시 None, 시각)
+        self._pending: Dict[str, Any] = {}
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._last_purge = time.monotonic()
+        self._writer = threading.Thread(target=self._run, name="SessionStoreWriter", daemon=True)
+        self._writer.start()
+    
+    def save(self, token: str, state: Dict[str, Any]):
+        encoded = json.dumps(state, ensure_ascii=False, separators=(",", ":"))
+        with self._pending_lock:
+            self._pending[token] = (encoded, time.time())
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wakeup.set()
+    
+    def load(self, token: str) -> Optional[Dict[str, Any]]:
+        with self._pending_lock:
+            pending = self._pending.get(token)
+        if pending is not None:
+            return json.loads(pending[0]) if pending[0] is not None else None
+        with self._db_lock:
+            row = self._conn.execute("SELECT state FROM sessions WHERE token = ?", (token,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def delete(self, token: str):
+        with self._pending_lock:
+            self._pending[token] = (None, time.time())
+    
+    def flush(self):
+        with self._pending_lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        upserts = [(token, state, ts) for token, (state, ts) in batch.items() if state is not None]
+        deletes = [(token,) for token, (state, _) in batch.items() if state is None]
+        with self._db_lock:
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT INTO sessions (token, state, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(token) DO UPDATE SET state = excluded.state, "
+                    "updated_at = excluded.updated_at", upserts
+                )
+                self._conn.executemany("DELETE FROM sessions WHERE token = ?", deletes)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._conn.execute("ROLLBACK")
+                self.last_error = str(e)
+                logger.warning("세션 저장 실패 (%d건 재시도 예정): %s", len(batch), e)
+                # 그 사이 들어온 더 새로운 상태는 유지하고 나머지만 되돌림
+                with self._pending_lock:
+                    for token, value in batch.items():
+                        self._pending.setdefault(token, value)
+                return
+        self.flush_count += 1
+        self.written_count += len(batch)
+    
+    def purge_older_than(self, seconds: float) -> int:
+        """마지막 저장이 seconds보다 오래된 세션 삭제 (삭제 건수 반환)"""
+        self.flush()
+        with self._db_lock:
+            cursor = self._conn.execute("DELETE FROM sessions WHERE updated_at < ?",
+                                        (time.time() - seconds,))
+        self.purged_count += cursor.rowcount
+        return cursor.rowcount
+    
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(min(self.flush_interval, self.purge_interval))
+            self._wakeup.clear()
+            try:
+                self.flush()
+                if time.monotonic() - self._last_purge >= self.purge_interval:
+                    self._last_purge = time.monotonic()
+                    self.purge_older_than(self.ttl)
+            except Exception:
+                logger.exception("세션 저장 스레드 오류")
+    
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._writer.join(timeout=5)
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+
+_shared_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_store(path: Optional[str] = None) -> SessionStore:
+    """프로세스 공유 세션 저장소 (최초 호출 시 생성, 종료 시 남은 쓰기 반영)"""
+    global _shared_store
+    if _shared_store is not None:
+        return _shared_store
+    
+    with _store_lock:
+        if _shared_store is None:
+            store_path = path or AppConfig.SESSION_STORE_PATH
+            if store_path == ":memory:":
+                _shared_store = MemorySessionStore()
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(store_path)), exist_ok=True)
+                _shared_store = SQLiteSessionStore(store_path)
+            atexit.register(_shared_store.close)
+    return _shared_store
@@ -6,6 +6,54 @@ UI 컴포넌트 모듈
 import streamlit as st
 from typing import Dict, List, Any, Callable
 from src.config import AppConfig
+from src.result_pages import AxisCounts, ResultPageCache
+
+
+def _render_result_markdown(display_type: str, counts: Dict[str, AxisCounts], locale: str) -> str:
+    """render_results의 정적인 부분(타입 헤더, 상세 결과, 팁, MBTI 의미)을 마크다운으로 렌더링"""
+    from src.mbti_analyzer import MBTIAnalyzer
+    analyzer = MBTIAnalyzer()
+    
+    blocks = [
+        "### 결과",
+        f"<h2 style='text-align: center; color: #1f77b4;'>{display_type}</h2>",
+        "### 📊 상세 결과",
+    ]
+    for axis in AppConfig.AXES:
+        pole_a, pole_b = AppConfig.POLES[axis]
+        count_a, count_b = counts[axis]
+        total = count_a + count_b
+        
+        if total > 0:
+            model = {"diff": {axis: abs(count_a - count_b)}, "totals": {axis: total}}
+            strength = analyzer.get_axis_preference_strength(axis, model)
+            
+            # 우세한 극점 결정
+            if count_a > count_b:
+                dominant = pole_a
+                percentage = (count_a / total) * 100
+            elif count_b > count_a:
+                dominant = pole_b
+                percentage = (count_b / total) * 100
+            else:
+                dominant = "동점"
+                percentage = 50
+            
+            blocks.append(f"**{axis}축**: {dominant} ({percentage:.1f}%) - {strength}")
+        else:
+            blocks.append(f"**{axis}축**: 측정 안됨")
+    
+    blocks.append("### 💡 일반적인 팁")
+    blocks += [f"• {tip}" for tip in AppConfig.COMMON_TIPS]
+    blocks.append("### 📚 MBTI 의미")
+    blocks += [f"**{meaning}**: {description}" for meaning, description in AppConfig.MEANINGS]
+    return "\n\n".join(blocks)
+
+
+# (표시 유형, 축별 응답 수, 로케일)별 결과 페이지
+# 표시 유형은 format_type_with_unresolved 결과라 미해결 축("(E/I)")이 키에 반영된다.
+# 미해결 축은 호출하는 쪽이 정하므로 앱의 결과 페이지처럼 미리 만들지 않고 처음 쓸 때 채운다.
+_RESULT_PAGES = ResultPageCache(_render_result_markdown)
 
 
 class UIComponents:
@@ -30,7 +78,7 @@ class UIComponents:
                 "is_extra": question.get("is_extra", False)
             }
             answer_callback(question_id, answer_data)
-            
+        
         # B 선택지
         if col2.button(f"② {question['B']['label']}", key=f"{question_id}_B"):
             answer_data = {
@@ -41,65 +89,27 @@ class UIComponents:
                 "is_extra": question.get("is_extra", False)
             }
             answer_callback(question_id, answer_data)
-            
+    
     def render_results(self, model: Dict[str, Any], unresolved_axes: List[str], 
                       answers: List[Dict[str, Any]], config: AppConfig):
-        """결과 화면 렌더링"""
+        """결과 화면 렌더링 (응답 로그 외에는 캐시된 페이지 사용)"""
         from src.mbti_analyzer import MBTIAnalyzer
         analyzer = MBTIAnalyzer()
         
         # MBTI 타입 표시
         display_type = analyzer.format_type_with_unresolved(model, unresolved_axes)
+        counts = {
+            axis: (model["count"][config.POLES[axis][0]], model["count"][config.POLES[axis][1]])
+            for axis in config.AXES
+        }
         
-        st.subheader("결과")
-        st.markdown(f"<h2 style='text-align: center; color: #1f77b4;'>{display_type}</h2>", 
-                   unsafe_allow_html=True)
+        # 타입 헤더, 상세 결과, 팁, MBTI 의미
+        page = _RESULT_PAGES.get(display_type, counts, config.LOCALE)
+        st.markdown(page.markdown, unsafe_allow_html=True)
         
-        # 상세 결과 표시
-        self._render_detailed_results(model, config, analyzer)
-        
-        # 일반적인 팁 표시
-        st.subheader("💡 일반적인 팁")
-        for tip in config.COMMON_TIPS:
-            st.write(f"• {tip}")
-            
-        # MBTI 의미 설명
-        st.subheader("📚 MBTI 의미")
-        for meaning, description in config.MEANINGS:
-            st.write(f"**{meaning}**: {description}")
-            
         # 응답 로그 표시
         self._render_answer_log(answers)
-        
-    def _render_detailed_results(self, model: Dict[str, Any], config: AppConfig, 
-                               analyzer):
-        """상세 결과 표시"""
-        st.subheader("📊 상세 결과")
-        
-        for axis in config.AXES:
-            pole_a, pole_b = config.POLES[axis]
-            count_a = model["count"][pole_a]
-            count_b = model["count"][pole_b]
-            total = model["totals"][axis]
-            
-            if total > 0:
-                strength = analyzer.get_axis_preference_strength(axis, model)
-                
-                # 우세한 극점 결정
-                if count_a > count_b:
-                    dominant = pole_a
-                    percentage = (count_a / total) * 100
-                elif count_b > count_a:
-                    dominant = pole_b
-                    percentage = (count_b / total) * 100
-                else:
-                    dominant = "동점"
-                    percentage = 50
-                    
-                st.write(f"**{axis}축**: {dominant} ({percentage:.1f}%) - {strength}")
-            else:
-                st.write(f"**{axis}축**: 측정 안됨")
-                
+    
     def _render_answer_log(self, answers: List[Dict[str, Any]]):
         """응답 로그 렌더링"""
         st.subheader("📝 응답 로그")
@@ -111,7 +121,7 @@ class UIComponents:
                 st.write(f"**{i}) [{answer['axis']}] {extra_tag}{answer['prompt']}**")
                 st.write(f"   → 선택: {answer['label']} ({answer['value']})")
                 st.write("")
-                
+    
     def render_progress_indicator(self, current_answered: int, total_questions: int):
         """진행률 표시"""
         if total_questions > 0:
@@ -119,7 +129,7 @@ class UIComponents:
             st.progress(progress)
             st.write(f"진행률: {current_answered}/{total_questions} "
                     f"({progress * 100:.1f}%)")
-                    
+    
     def render_error_message(self, message: str, error_type: str = "error"):
         """에러 메시지 렌더링"""
         if error_type == "error":
@@ -130,7 +140,7 @@ class UIComponents:
             st.info(message)
         else:
             st.write(message)
-            
+    
     def render_loading_spinner(self, text: str = "처리 중..."):
         """로딩 스피너 표시"""
         with st.spinner(text):
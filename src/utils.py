@@ -4,35 +4,67 @@
 """
 
 import streamlit as st
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional, Set
 from src.config import AppConfig
+from src.session import QuizSession
+from src.session_registry import SessionRegistry, get_session_registry
+from src.session_store import new_session_token
+from src.event_log import get_event_logger
+
+
+def _current_quiz(registry: Optional[SessionRegistry] = None) -> Optional[QuizSession]:
+    """현재 세션 토큰의 QuizSession (레지스트리에 없으면 None)"""
+    token = st.session_state.get("token")
+    if token is None:
+        return None
+    if registry is None:
+        registry = get_session_registry()
+    return registry.get(token)
 
 
 class StateManager:
-    """세션 상태 관리 클래스"""
+    """세션 상태 관리 클래스
+    
+    퀴즈 진행 상태는 app.py와 같이 세션 레지스트리에 토큰으로 보관하고,
+    st.session_state에는 토큰과 화면 플래그만 둔다 (상태 사본을 따로 두지 않음).
+    """
     
-    def __init__(self):
+    def __init__(self, registry: Optional[SessionRegistry] = None):
         self.config = AppConfig()
-        
-    def reset_state(self):
-        """세션 상태 초기화"""
-        st.session_state.base = []
-        st.session_state.base_ids = []
-        st.session_state.used = {axis: set() for axis in self.config.AXES}
-        st.session_state.answers = {}
-        st.session_state.extra = []
+        self.registry = registry if registry is not None else get_session_registry()
+        
+    @property
+    def quiz(self) -> QuizSession:
+        """현재 세션의 QuizSession (레지스트리에 없으면 새로 등록)"""
+        quiz = _current_quiz(self.registry)
+        if quiz is None:
+            quiz = self.reset_state()
+        return quiz
+        
+    def reset_state(self) -> QuizSession:
+        """세션 상태 초기화 (문항/답변은 QuizSession 하나에 압축 보관)"""
+        if "token" not in st.session_state:
+            st.session_state.token = new_session_token()
+        quiz = QuizSession(getattr(st.session_state, "mode", "general"))
+        self.registry.put(st.session_state.token, quiz)
         st.session_state.base_done = False
         st.session_state.result_ready = False
         st.session_state.unresolved_axes = []
         st.session_state.answer_log = []
+        return quiz
         
     def get_current_progress(self) -> Dict[str, int]:
         """현재 진행 상황 반환"""
-        base_answered = sum(1 for qid in st.session_state.base_ids 
-                          if qid in st.session_state.answers)
-        extra_answered = sum(1 for q in st.session_state.extra 
-                           if q["id"] in st.session_state.answers)
-        total_questions = len(st.session_state.base) + len(st.session_state.extra)
+        quiz = self.quiz
+        base_answered = extra_answered = 0
+        for position, _, _, is_extra in quiz.items():
+            if quiz.answer(position) is None:
+                continue
+            if is_extra:
+                extra_answered += 1
+            else:
+                base_answered += 1
+        total_questions = len(quiz)
         
         return {
             "base_answered": base_answered,
@@ -43,34 +75,40 @@ class StateManager:
         
     def is_base_complete(self) -> bool:
         """기본 질문 완료 여부 확인"""
-        base_answered = sum(1 for qid in st.session_state.base_ids 
-                          if qid in st.session_state.answers)
-        return base_answered == len(st.session_state.base_ids)
+        quiz = self.quiz
+        return all(quiz.answer(position) is not None
+                   for position, _, _, is_extra in quiz.items() if not is_extra)
         
     def is_all_complete(self) -> bool:
         """모든 질문 완료 여부 확인"""
-        all_ids = st.session_state.base_ids + [q["id"] for q in st.session_state.extra]
-        return all(qid in st.session_state.answers for qid in all_ids)
+        return self.quiz.is_complete()
         
     def get_answers_by_axis(self, axis: str) -> List[Dict[str, Any]]:
-        """특정 축의 답변들 반환"""
-        return [answer for answer in st.session_state.answers.values() 
-                if answer["axis"] == axis]
+        """특정 축의 답변들 반환 ({"axis", "value"}만, 문구는 은행에서 조회)"""
+        quiz = self.quiz
+        answers = []
+        for position, item_axis, _, _ in quiz.items():
+            pole = quiz.answer(position)
+            if item_axis == axis and pole is not None:
+                answers.append({"axis": axis, "value": self.config.POLES[axis][pole]})
+        return answers
                 
     def save_state_to_cache(self) -> Dict[str, Any]:
         """현재 상태를 캐시용 딕셔너리로 저장"""
         return {
             "mode": st.session_state.mode,
-            "answers": st.session_state.answers.copy(),
-            "base_done": st.session_state.base_done
+            "quiz": self.quiz.to_dict(),
+            "base_done": st.session_state.get("base_done", False)
         }
         
     def load_state_from_cache(self, cached_state: Dict[str, Any]):
         """캐시된 상태를 복원"""
         if "mode" in cached_state:
             st.session_state.mode = cached_state["mode"]
-        if "answers" in cached_state:
-            st.session_state.answers = cached_state["answers"]
+        if "quiz" in cached_state:
+            if "token" not in st.session_state:
+                st.session_state.token = new_session_token()
+            self.registry.put(st.session_state.token, QuizSession.from_dict(cached_state["quiz"]))
         if "base_done" in cached_state:
             st.session_state.base_done = cached_state["base_done"]
 
@@ -107,8 +145,7 @@ class ValidationUtils:
         errors = []
         
         required_session_keys = [
-            "base", "base_ids", "used", "answers", "extra", 
-            "base_done", "result_ready", "unresolved_axes"
+            "token", "base_done", "result_ready", "unresolved_axes"
         ]
         
         for key in required_session_keys:
@@ -185,30 +222,21 @@ class LoggingUtils:
     
     @staticmethod
     def log_user_action(action_type: str, details: Dict[str, Any] = None):
-        """사용자 액션 로깅 (개발/디버깅용)"""
-        if "action_log" not in st.session_state:
-            st.session_state.action_log = []
-            
-        log_entry = {
-            "action_type": action_type,
-            "timestamp": pd.Timestamp.now().isoformat() if 'pd' in globals() else "unknown",
-            "details": details or {}
-        }
-        
-        st.session_state.action_log.append(log_entry)
-        
-        # 로그가 너무 길어지면 오래된 항목 제거
-        if len(st.session_state.action_log) > 100:
-            st.session_state.action_log = st.session_state.action_log[-50:]
+        """사용자 액션 로깅 (프로세스 공유 이벤트 로그 대기열에 넣고 바로 반환)"""
+        get_event_logger().log(action_type, st.session_state.get("token"), details)
             
     @staticmethod
     def get_session_summary() -> Dict[str, Any]:
         """세션 요약 정보 반환"""
+        quiz = _current_quiz()
+        if quiz is None:
+            quiz = QuizSession(getattr(st.session_state, "mode", "general"))
+        extra_count = sum(1 for item in quiz.items() if item[3])
         return {
             "mode": getattr(st.session_state, "mode", "unknown"),
-            "base_questions_count": len(getattr(st.session_state, "base", [])),
-            "extra_questions_count": len(getattr(st.session_state, "extra", [])),
-            "answers_count": len(getattr(st.session_state, "answers", {})),
+            "base_questions_count": len(quiz) - extra_count,
+            "extra_questions_count": extra_count,
+            "answers_count": quiz.answered_count,
             "base_done": getattr(st.session_state, "base_done", False),
             "result_ready": getattr(st.session_state, "result_ready", False)
         }
\ No newline at end of file
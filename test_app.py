@@ -188,22 +188,23 @@ class TestQuestionManager(unittest.TestCase):
         
         # 각 축별로 사용된 질문 확인
         for axis in self.config.AXES:
-            self.assertIn(axis, result["used_prompts"])
-            self.assertEqual(len(result["used_prompts"][axis]), 2)
+            self.assertIn(axis, result["used"])
+            self.assertEqual(bin(result["used"][axis]).count("1"), 2)
             
     def test_generate_additional_questions(self):
         """추가 질문 생성 테스트"""
         filtered_data = self.manager.filter_by_audience(self.test_data, "general")
-        used_prompts = {"EI": {"테스트 질문 1"}, "SN": set(), "TF": set(), "JP": set()}
+        used = {"EI": 1 << 0, "SN": 0, "TF": 0, "JP": 0}  # "테스트 질문 1" 사용
         
         additional = self.manager.generate_additional_questions(
-            filtered_data, "EI", used_prompts, count=1
+            filtered_data, "EI", used, count=1
         )
         
         # 1개 질문이 생성되어야 함
         self.assertEqual(len(additional), 1)
         self.assertEqual(additional[0]["axis"], "EI")
         self.assertTrue(additional[0]["is_extra"])
+        self.assertEqual(additional[0]["prompt"], "테스트 질문 2")
 
 
 class TestAppConfig(unittest.TestCase):
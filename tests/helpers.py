@@ -0,0 +1,49 @@
+# tests/helpers.py
+"""
+테스트 공용 질문 데이터·은행·세션 생성 도우미
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+from src.config import AppConfig
+from src.question_bank import QuestionBank
+from src.session import QuizSession
+
+
+def make_data(size: int = 20,
+              endorse_by_index: Optional[Sequence[Optional[List[float]]]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """축마다 size개 문항인 질문 데이터 (A/B는 AppConfig.POLES 순서의 두 극)
+    
+    endorse_by_index를 주면 문항 수는 그 길이가 되고, None이 아닌 값은 문항의 endorse로 들어간다.
+    """
+    if endorse_by_index is None:
+        endorse_by_index = [None] * size
+    data = {}
+    for axis in AppConfig.AXES:
+        a, b = AppConfig.POLES[axis]
+        data[axis] = []
+        for i, endorse in enumerate(endorse_by_index):
+            question = {"prompt": f"{axis} 질문 {i}", "A": {"label": f"{a} 선택", "value": a},
+                        "B": {"label": f"{b} 선택", "value": b}}
+            if endorse:
+                question["endorse"] = endorse
+            data[axis].append(question)
+    return data
+
+
+def make_bank(size: int = 20, version: str = "v1") -> QuestionBank:
+    return QuestionBank(make_data(size), version=version)
+
+
+def make_quiz(answer: int = 0) -> QuizSession:
+    """축마다 기본 문항 두 개(qid 0, 1)를 낸 세션, 첫 문항만 answer로 응답"""
+    quiz = QuizSession("general", "v1")
+    for axis in AppConfig.AXES:
+        quiz.add_item(axis, 0)
+        quiz.add_item(axis, 1)
+    quiz.set_answer(0, answer)
+    return quiz
+
+
+def make_state(answer: int = 0) -> Dict[str, Any]:
+    """저장소에 넣는 세션 상태 딕셔너리"""
+    return {"mode": "general", "quiz": make_quiz(answer).to_dict(), "base_done": False}
@@ -0,0 +1,82 @@
+# tests/test_adaptive.py
+"""
+적응형 문항 선택 테스트
+"""
+
+import random
+import unittest
+from src.adaptive import AdaptiveSelector
+from src.question_manager import QuestionManager
+from helpers import make_data
+
+
+class TestAdaptiveSelector(unittest.TestCase):
+    
+    def setUp(self):
+        self.manager = QuestionManager()
+        self.selector = AdaptiveSelector(confidence=0.9, rng=random.Random(3))
+        
+    def test_picks_most_informative_item(self):
+        """같은 축에서 변별력이 가장 큰 문항을 먼저 선택"""
+        bank = make_data(endorse_by_index=[None, [0.95, 0.05], [0.6, 0.4]])
+        state = self.selector.new_state()
+        used = {axis: 0 for axis in self.manager.config.AXES}
+        
+        question = self.manager.generate_adaptive_question(bank, state, used, self.selector)
+        
+        self.assertEqual(question["axis"], "EI")
+        self.assertEqual(question["prompt"], "EI 질문 1")
+        self.assertEqual(question["id"], "adaptive_EI_1")
+        self.assertEqual(used["EI"], 0b010)
+        
+    def test_stops_when_confident(self):
+        """모든 축이 신뢰도 기준에 도달하면 None"""
+        bank = make_data(endorse_by_index=[[0.95, 0.05], [0.95, 0.05]])
+        state = self.selector.new_state()
+        used = {axis: 0 for axis in self.manager.config.AXES}
+        asked = []
+        while True:
+            question = self.manager.generate_adaptive_question(bank, state, used, self.selector)
+            if question is None:
+                break
+            asked.append(question["axis"])
+            self.selector.update(state, question["axis"], question, question["B"]["value"])
+            
+        # 변별력 0.95 문항은 한 번 답으로 신뢰도 0.95 → 축당 1문항
+        self.assertEqual(sorted(asked), ["EI", "JP", "SN", "TF"])
+        self.assertTrue(self.selector.is_done(state))
+        self.assertLess(self.selector.probability(state, "EI"), 0.1)
+        
+    def test_conflicting_answers_ask_more(self):
+        """상반된 답이면 최대 문항 수 또는 문항 소진까지 계속 질문"""
+        bank = make_data(10)
+        state = self.selector.new_state()
+        used = {axis: 0 for axis in self.manager.config.AXES}
+        per_axis = {axis: 0 for axis in self.manager.config.AXES}
+        flip = {axis: 0 for axis in self.manager.config.AXES}
+        while True:
+            question = self.manager.generate_adaptive_question(bank, state, used, self.selector)
+            if question is None:
+                break
+            axis = question["axis"]
+            choice = "A" if flip[axis] % 2 == 0 else "B"
+            flip[axis] += 1
+            per_axis[axis] += 1
+            self.selector.update(state, axis, question, question[choice]["value"])
+            
+        max_questions = self.manager.config.MAX_QUESTIONS_PER_AXIS
+        self.assertEqual(per_axis, {axis: max_questions for axis in self.manager.config.AXES})
+        self.assertAlmostEqual(self.selector.probability(state, "TF"), 0.5)
+        
+    def test_exhausted_pool(self):
+        """남은 문항이 없는 축은 건너뜀"""
+        bank = make_data(1)
+        state = self.selector.new_state()
+        used = {axis: 0 for axis in self.manager.config.AXES}
+        used["EI"] = 0b1
+        question = self.manager.generate_adaptive_question(bank, state, used, self.selector)
+        self.assertNotEqual(question["axis"], "EI")
+
+
+if __name__ == '__main__':
+    unittest.main()
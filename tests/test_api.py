@@ -0,0 +1,190 @@
+# tests/test_api.py
+"""
+퀴즈·채점 HTTP API 테스트
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.api import QuizAPI
+from src.asgi_server import serve
+from src.question_bank import QuestionBank
+from src.resume_token import encode_resume_token
+from src.session import QuizSession
+from helpers import make_bank, make_data
+
+
+def call(app, method, path, payload=None, raw=None):
+    """ASGI 앱을 직접 호출해 (상태, JSON 본문) 반환"""
+    body = raw if raw is not None else b"" if payload is None else json.dumps(payload).encode("utf-8")
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+    
+    async def receive():
+        return messages.pop(0)
+    
+    async def send(message):
+        sent.append(message)
+    
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    asyncio.run(app(scope, receive, send))
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+class TestQuizAPI(unittest.TestCase):
+    
+    def setUp(self):
+        bank = make_bank(10)
+        self.app = QuizAPI(lambda audience: bank)
+    
+    def answer_all(self, token, questions, choose):
+        answers = [{"position": q["position"], "choice": choose(q)} for q in questions]
+        status, reply = call(self.app, "POST", "/quiz/answers", {"token": token, "answers": answers})
+        self.assertEqual(status, 200)
+        return reply
+    
+    def test_new_quiz_is_deterministic(self):
+        status, first = call(self.app, "POST", "/quiz", {"audience": "senior", "seed": 9})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(first["questions"]), 8)
+        self.assertEqual(first["bank_version"], "v1")
+        _, second = call(self.app, "POST", "/quiz", {"audience": "senior", "seed": 9})
+        self.assertEqual(first, second)
+    
+    def test_quiz_without_ties(self):
+        _, quiz = call(self.app, "POST", "/quiz", {"seed": 1})
+        reply = self.answer_all(quiz["token"], quiz["questions"], lambda q: "A")
+        self.assertTrue(reply["complete"])
+        self.assertEqual(reply["questions"], [])
+        self.assertEqual(reply["result"]["type"], "ESTJ")
+        self.assertEqual(reply["result"]["strength"]["EI"], "강함")
+    
+    def test_tied_axes_get_one_extra_each(self):
+        _, quiz = call(self.app, "POST", "/quiz", {"seed": 2})
+        seen = {}
+        
+        def alternate(question):
+            seen[question["axis"]] = seen.get(question["axis"], 0) + 1
+            return "AB"[seen[question["axis"]] % 2]
+        
+        reply = self.answer_all(quiz["token"], quiz["questions"], alternate)
+        self.assertFalse(reply["complete"])
+        self.assertEqual(reply["remaining"], 4)
+        self.assertEqual(sorted(q["axis"] for q in reply["questions"]), ["EI", "JP", "SN", "TF"])
+        self.assertTrue(all(q["is_extra"] for q in reply["questions"]))
+        
+        final = self.answer_all(reply["token"], reply["questions"], lambda q: "B")
+        self.assertTrue(final["complete"])
+        self.assertEqual(final["questions"], [])  # 축당 추가 문항은 한 번만
+        self.assertEqual(final["result"]["display"], "INFP")
+    
+    def test_replica_with_different_mtime(self):
+        """다른 노드(같은 내용, 다른 수정 시각)가 발급한 토큰으로 이어 답하고 동점 해소 문항을 받음"""
+        raw = json.dumps(make_data(10), ensure_ascii=False).encode("utf-8")
+        apps = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i, mtime_ns in enumerate([10**18, 2 * 10**18]):
+                path = os.path.join(tmp_dir, f"replica{i}.json")
+                with open(path, "wb") as f:
+                    f.write(raw)
+                os.utime(path, ns=(mtime_ns, mtime_ns))
+                bank = QuestionBank.from_file(path)
+                apps.append(QuizAPI(lambda audience, bank=bank: bank))
+        
+        _, quiz = call(apps[0], "POST", "/quiz", {"seed": 2})
+        answers = [{"position": q["position"], "choice": "AB"[q["position"] % 2]} for q in quiz["questions"]]
+        replies = [call(app, "POST", "/quiz/answers", {"token": quiz["token"], "answers": answers})
+                   for app in apps]
+        self.assertEqual([status for status, _ in replies], [200, 200])
+        self.assertEqual(replies[0][1], replies[1][1])
+    
+    def test_score_and_batch(self):
+        answers = [{"axis": "EI", "value": "I"}, {"axis": "EI", "value": "I"}, {"axis": "TF", "value": "F"}]
+        status, single = call(self.app, "POST", "/score", {"answers": answers})
+        self.assertEqual(status, 200)
+        self.assertEqual(single["type"], "ISFJ")
+        status, batch = call(self.app, "POST", "/score/batch", {"sessions": [answers, []]})
+        self.assertEqual(status, 200)
+        self.assertEqual([r["type"] for r in batch["results"]], ["ISFJ", "ESTJ"])
+        self.assertEqual(batch["results"][0]["totals"]["EI"], single["totals"]["EI"])
+    
+    def test_errors(self):
+        self.assertEqual(call(self.app, "GET", "/nope")[0], 404)
+        self.assertEqual(call(self.app, "GET", "/score")[0], 405)
+        self.assertEqual(call(self.app, "POST", "/score", raw=b"{")[0], 400)
+        self.assertEqual(call(self.app, "POST", "/score", {"answers": [{"axis": "XY"}]})[0], 400)
+        self.assertEqual(call(self.app, "POST", "/quiz", {"audience": "kids"})[0], 400)
+        self.assertEqual(call(self.app, "POST", "/quiz/answers", {"token": "garbage"})[0], 400)
+        _, quiz = call(self.app, "POST", "/quiz", {"seed": 3})
+        bad = {"token": quiz["token"], "answers": [{"position": 8, "choice": "A"}]}
+        self.assertEqual(call(self.app, "POST", "/quiz/answers", bad)[0], 400)
+        
+        forged = QuizSession("general", "v1")
+        forged.add_item("EI", 200)
+        status, _ = call(self.app, "POST", "/quiz/answers", {"token": encode_resume_token(forged), "answers": []})
+        self.assertEqual(status, 400)
+    
+    def test_answer_value_must_be_a_pole(self):
+        """value가 없거나 축의 극이 아니면 400 (조용히 틀린 결과를 내지 않음)"""
+        for answer in [{"axis": "EI"}, {"axis": "EI", "value": "X"}, {"axis": "EI", "value": "S"}]:
+            self.assertEqual(call(self.app, "POST", "/score", {"answers": [answer]})[0], 400)
+            status, reply = call(self.app, "POST", "/score/batch", {"sessions": [[], [answer]]})
+            self.assertEqual(status, 400)
+            self.assertIn("value", reply["error"])
+    
+    def test_unexpected_error_is_json_500(self):
+        def broken_bank(audience):
+            raise RuntimeError("boom")
+        
+        with self.assertLogs("src.api", level="ERROR"):
+            status, reply = call(QuizAPI(broken_bank), "GET", "/health")
+        self.assertEqual(status, 500)
+        self.assertIn("error", reply)
+
+
+class TestAsgiServer(unittest.TestCase):
+    
+    def test_server_loads_without_ui_stack(self):
+        """api_server는 Streamlit(UI 모듈)을 불러오지 않음"""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = "import sys, api_server; print('streamlit' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True,
+                                text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+    
+    def test_keep_alive_round_trips(self):
+        bank = make_bank(10)
+        app = QuizAPI(lambda audience: bank)
+        
+        async def scenario():
+            stop, ready = asyncio.Event(), asyncio.Future()
+            task = asyncio.ensure_future(serve(app, "127.0.0.1", 0, ready.set_result, stop))
+            port = (await ready).sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            statuses = []
+            for path, body in [("/health", b""), ("/score", b'{"answers": []}'), ("/missing", b"")]:
+                method = "GET" if not body else "POST"
+                writer.write(f"{method} {path} HTTP/1.1\r\ncontent-length: {len(body)}\r\n\r\n".encode() + body)
+                statuses.append(int((await reader.readline()).split()[1]))
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line == b"\r\n":
+                        break
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":")[1])
+                await reader.readexactly(length)
+            writer.close()
+            stop.set()
+            await task
+            return statuses
+        
+        self.assertEqual(asyncio.run(scenario()), [200, 200, 404])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests/test_bank_shards.py
+"""
+샤드 질문 은행 테스트
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from src.bank_shards import ShardedQuestionBank, write_shards
+from src.question_bank import QuestionBank
+
+
+class TestShardedQuestionBank(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data = {
+            axis: [
+                {
+                    "audience": audience,
+                    "prompt": f"{axis} {audience or '공통'} 질문 {i}",
+                    "A": {"label": "선택지 A", "value": axis[0]},
+                    "B": {"label": "선택지 B", "value": axis[1]}
+                }
+                for audience in ["general", None, "senior", "both"]
+                for i in range(2)
+            ]
+            for axis in ["EI", "SN", "TF", "JP"]
+        }
+        write_shards(self.data, self.tmp_dir.name, "ko")
+        self.manifest = os.path.join(self.tmp_dir.name, "manifest.json")
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_pools_match_monolithic_bank(self):
+        """샤드에서 만든 풀이 단일 은행의 풀과 같은 문항을 담는지 테스트"""
+        shards = ShardedQuestionBank(self.manifest)
+        monolithic = QuestionBank(self.data)
+        
+        for audience in ["general", "senior"]:
+            bank = shards.bank_for(audience, "ko")
+            for axis in ["EI", "SN", "TF", "JP"]:
+                self.assertEqual(
+                    sorted(q["prompt"] for q in bank.questions(audience, axis)),
+                    sorted(q["prompt"] for q in monolithic.questions(audience, axis))
+                )
+    
+    def test_version_is_content_hash(self):
+        """같은 내용이면 다시 만들어도(다른 디렉터리여도) 같은 버전, 문항이 바뀌면 다른 버전"""
+        version = ShardedQuestionBank(self.manifest).version
+        with tempfile.TemporaryDirectory() as other_dir:
+            self.assertEqual(write_shards(self.data, other_dir, "ko")["version"], version)
+            self.assertEqual(write_shards(self.data, self.tmp_dir.name, "ko")["version"], version)
+            
+            self.data["TF"][0]["prompt"] = "바뀐 질문"
+            changed = write_shards(self.data, other_dir, "ko")["version"]
+            self.assertNotEqual(changed, version)
+            with open(os.path.join(other_dir, "manifest.json"), "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["version"], changed)
+    
+    def test_lazy_load_and_lru(self):
+        """요청된 대상만 로드하고 캐시 크기를 넘으면 오래된 것부터 밀어내는지 테스트"""
+        write_shards(self.data, self.tmp_dir.name, "en")
+        shards = ShardedQuestionBank(self.manifest, cache_size=2)
+        self.assertEqual(shards.cached_keys(), [])
+        
+        general = shards.bank_for("general", "ko")
+        self.assertIs(shards.bank_for("general", "ko"), general)
+        shards.bank_for("senior", "ko")
+        shards.bank_for("general", "ko")
+        shards.bank_for("general", "en")
+        
+        self.assertEqual(shards.cached_keys(), [("general", "ko"), ("general", "en")])
+        self.assertEqual((shards.load_count, shards.evict_count), (3, 1))
+    
+    def test_missing_locale(self):
+        """매니페스트에 없는 로케일은 KeyError"""
+        shards = ShardedQuestionBank(self.manifest)
+        
+        with self.assertRaises(KeyError):
+            shards.bank_for("general", "ja")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# tests/test_bank_validator.py
+"""
+스트리밍 질문 은행 검증기 테스트
+"""
+
+import io
+import json
+import unittest
+from src.bank_validator import StreamingBankValidator
+from src.question_bank import QuestionBank
+
+
+class TestStreamingBankValidator(unittest.TestCase):
+
+    def setUp(self):
+        # 작은 조각 크기로 문항이 조각 경계에 걸치는 경우까지 확인
+        self.validator = StreamingBankValidator(chunk_size=16)
+        self.data = {
+            axis: [
+                {
+                    "audience": audience,
+                    "prompt": f"{axis} {audience} 질문 {i}",
+                    "A": {"label": "선택지 A", "value": axis[0]},
+                    "B": {"label": "선택지 B", "value": axis[1]}
+                }
+                for audience in ["general", "senior"]
+                for i in range(2)
+            ]
+            for axis in ["EI", "SN", "TF", "JP"]
+        }
+    
+    def _validate(self, data):
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        return self.validator.validate_stream(io.StringIO(text))
+    
+    def _codes(self, report):
+        return [error["code"] for error in report["errors"]]
+    
+    def test_valid_bank(self):
+        """유효한 은행은 오류 없이 대상별 문항 수를 집계하는지 테스트"""
+        report = self._validate(self.data)
+        
+        self.assertTrue(report["ok"])
+        self.assertEqual(report["questions"], 16)
+        self.assertEqual(report["counts"]["senior"]["JP"], 2)
+    
+    def test_errors_with_line_numbers(self):
+        """중복·극 값·대상 오류를 줄 번호와 함께 한 번에 보고하는지 테스트"""
+        self.data["EI"][1]["prompt"] = self.data["EI"][0]["prompt"]
+        self.data["SN"][0]["B"]["value"] = "I"
+        self.data["TF"][0]["audience"] = "child"
+        
+        report = self._validate(self.data)
+        
+        self.assertFalse(report["ok"])
+        # 잘못된 문항은 집계에서 빠지므로 최소 문항 수 오류가 뒤따름
+        self.assertEqual(self._codes(report)[:3], ["duplicate_prompt", "invalid_value", "invalid_audience"])
+        duplicate = report["errors"][0]
+        self.assertEqual((duplicate["axis"], duplicate["index"]), ("EI", 2))
+        # indent=2 기준: 1 "{", 2 "EI": [, 3 첫 문항 "{", 문항당 12줄
+        self.assertEqual(duplicate["line"], 15)
+    
+    def test_audience_rule_matches_bank(self):
+        """검증기가 받아들이는 태그는 은행이 미리 인덱싱하는 대상과 같은 규칙을 따름"""
+        self.data["EI"][0]["audience"] = "both"
+        self.assertTrue(self._validate(self.data)["ok"])
+        self.assertEqual(set(QuestionBank(self.data)._pools), set(self.validator.config.AUDIENCES))
+        
+        self.data["EI"][0]["audience"] = "child"
+        self.assertIn("invalid_audience", self._codes(self._validate(self.data)))
+        self.assertNotIn("child", QuestionBank(self.data)._pools)
+    
+    def test_minimum_count_per_audience(self):
+        """대상별 최소 문항 수 미달을 보고하는지 테스트"""
+        self.data["JP"] = [q for q in self.data["JP"] if q["audience"] == "general"]
+        
+        report = self._validate(self.data)
+        
+        self.assertEqual(self._codes(report), ["insufficient_questions"])
+        self.assertIn("'senior'", report["errors"][0]["message"])
+    
+    def test_syntax_error(self):
+        """문법 오류 위치를 보고하는지 테스트"""
+        report = self.validator.validate_stream(io.StringIO('{\n  "EI": [\n    {"prompt": }\n  ]\n}'))
+        
+        self.assertEqual(self._codes(report), ["syntax"])
+        self.assertEqual(report["errors"][0]["line"], 3)
+    
+    def test_validate_bytes(self):
+        """이미 읽은 바이트도 스트림과 같은 리포트, 잘못된 UTF-8은 io_error"""
+        raw = json.dumps(self.data, ensure_ascii=False).encode("utf-8")
+        self.assertEqual(self.validator.validate_bytes(raw), self._validate(self.data))
+        self.assertEqual(self._codes(self.validator.validate_bytes(b"{\xff}")), ["io_error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# tests/test_event_log.py
+"""
+이벤트 로그 테스트
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from src.event_log import EventLogger
+
+
+class TestEventLogger(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "events.jsonl")
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    
+    def read(self, path=None):
+        with open(path or self.path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+    
+    def test_batched_write(self):
+        events = EventLogger(self.path, flush_interval=60)
+        for i in range(5):
+            self.assertTrue(events.log("answer", "tok", (i, "E")))
+        self.assertFalse(os.path.exists(self.path))  # 기록 스레드가 모으는 동안 요청 경로는 쓰지 않음
+        events.close()
+        
+        records = self.read()
+        self.assertEqual([r["details"] for r in records], [[i, "E"] for i in range(5)])
+        self.assertEqual(records[0]["event"], "answer")
+        self.assertEqual(records[0]["session"], "tok")
+        stamps = [r["ts"] for r in records]
+        self.assertEqual(stamps, sorted(stamps))
+        self.assertEqual(events.stats()["written"], 5)
+        self.assertEqual(events.stats()["flushes"], 1)
+    
+    def test_full_queue_drops_without_blocking(self):
+        events = EventLogger(self.path, flush_interval=60, max_queue=3)
+        results = [events.log("click") for _ in range(5)]
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertEqual(events.stats()["dropped"], 2)
+        self.assertEqual(events.stats()["pending"], 3)
+        events.flush()
+        self.assertTrue(events.log("click"))  # 비우면 다시 받음
+        events.close()
+        self.assertEqual(len(self.read()), 4)
+        self.assertFalse(events.log("after-close"))
+    
+    def test_rotation(self):
+        events = EventLogger(self.path, flush_interval=60, max_bytes=200, backups=2)
+        for i in range(6):
+            events.log("click", "tok", "x" * 60)
+            events.flush()
+        events.close()
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertTrue(os.path.exists(self.path + ".2"))
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        self.assertGreater(events.stats()["rotations"], 2)
+        self.assertLessEqual(os.path.getsize(self.path), 200)
+    
+    def test_unserializable_details(self):
+        events = EventLogger(self.path, flush_interval=60)
+        events.log("submit", None, {"when": object})
+        events.close()
+        self.assertIn("class", self.read()[0]["details"]["when"])
+    
+    def test_write_failure_counted(self):
+        events = EventLogger(os.path.join(self.tmpdir, "missing", "events.jsonl"), flush_interval=60)
+        events.log("click")
+        events.flush()
+        self.assertEqual(events.stats()["failed"], 1)
+        self.assertIsNotNone(events.stats()["last_error"])
+        events.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
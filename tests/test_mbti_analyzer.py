@@ -3,8 +3,9 @@
 MBTI 분석기 테스트
 """
 
+import random
 import unittest
-from src.mbti_analyzer import MBTIAnalyzer
+from src.mbti_analyzer import MBTIAnalyzer, OUTCOME_TABLES
 
 
 class TestMBTIAnalyzer(unittest.TestCase):
@@ -82,6 +83,88 @@ import os
 from src.question_manager import QuestionManager
 
 
+class TestOutcomeTable(unittest.TestCase):
+    
+    def setUp(self):
+        self.analyzer = MBTIAnalyzer()
+        
+    def test_table_matches_compute_mbti(self):
+        """모든 축·경로에서 표 결과가 compute_mbti 기반 계산과 일치"""
+        config = self.analyzer.config
+        for axis in config.AXES:
+            table = OUTCOME_TABLES[axis]
+            self.assertEqual(len(table), 1 << config.MAX_QUESTIONS_PER_AXIS)
+            for mask, outcome in enumerate(table):
+                values = [config.POLES[axis][(mask >> i) & 1] for i in range(outcome.used)]
+                model = self.analyzer.compute_mbti([{"axis": axis, "value": v} for v in values])
+                self.assertEqual(self.analyzer.axis_path_mask(axis, values), mask & ((1 << outcome.used) - 1))
+                self.assertEqual(outcome.diff, model["diff"][axis])
+                self.assertEqual(outcome.strength, self.analyzer.get_axis_preference_strength(axis, model))
+                self.assertEqual(outcome.unresolved, outcome.used == 6 and model["diff"][axis] == 0)
+                if outcome.used in (2, 4):
+                    self.assertNotEqual(outcome.diff, 0)
+                    
+    def test_decode_session(self):
+        """네 축 마스크로 전체 세션 결과 복원"""
+        # EI: E,E / SN: S,N,N,N / TF: T,F,F,T,T,F(미해결) / JP: P,P
+        masks = [0b00, 0b1110, 0b100110, 0b11]
+        answers = [
+            {"axis": "EI", "value": "E"}, {"axis": "EI", "value": "E"},
+            {"axis": "SN", "value": "S"}, {"axis": "SN", "value": "N"},
+            {"axis": "SN", "value": "N"}, {"axis": "SN", "value": "N"},
+            {"axis": "TF", "value": "T"}, {"axis": "TF", "value": "F"},
+            {"axis": "TF", "value": "F"}, {"axis": "TF", "value": "T"},
+            {"axis": "TF", "value": "T"}, {"axis": "TF", "value": "F"},
+            {"axis": "JP", "value": "P"}, {"axis": "JP", "value": "P"},
+        ]
+        model = self.analyzer.compute_mbti(answers)
+        result = self.analyzer.decode_session(masks)
+        
+        for key in ["type", "count", "totals", "diff"]:
+            self.assertEqual(result[key], model[key])
+        self.assertEqual(result["unresolved"], ["TF"])
+        self.assertEqual(result["display"], "EN(T/F)P")
+        self.assertEqual(result["display"],
+                         self.analyzer.format_type_with_unresolved(model, self.analyzer.get_unresolved_axes(model)))
+        self.assertEqual(result["strength"], {"EI": "강함", "SN": "보통", "TF": "동점", "JP": "강함"})
+
+
+class TestBatchScoring(unittest.TestCase):
+    
+    def setUp(self):
+        self.analyzer = MBTIAnalyzer()
+        
+    def test_batch_matches_compute_mbti(self):
+        """길이가 다른 세션 묶음의 결과가 세션별 compute_mbti와 일치"""
+        config = self.analyzer.config
+        rnd = random.Random(11)
+        sessions = [[]]
+        for _ in range(300):
+            answers = []
+            for _ in range(rnd.randrange(1, 16)):
+                axis = rnd.choice(config.AXES)
+                answers.append({"axis": axis, "value": rnd.choice(config.POLES[axis])})
+            sessions.append(answers)
+            
+        result = self.analyzer.compute_mbti_batch(self.analyzer.pack_answers(sessions))
+        for i, answers in enumerate(sessions):
+            model = self.analyzer.compute_mbti(answers)
+            self.assertEqual(result["type"][i], model["type"])
+            self.assertEqual(result["count"][i].tolist(), [model["count"][p] for p in result["poles"]])
+            self.assertEqual(result["totals"][i].tolist(), [model["totals"][a] for a in config.AXES])
+            self.assertEqual(result["diff"][i].tolist(), [model["diff"][a] for a in config.AXES])
+            self.assertEqual(result["strength"][i].tolist(),
+                             [self.analyzer.get_axis_preference_strength(a, model) for a in config.AXES])
+            
+    def test_batch_unknown_value(self):
+        """알 수 없는 극 값은 문항 수에만 반영"""
+        packed = self.analyzer.pack_answers([[{"axis": "EI", "value": "X"}, {"axis": "EI", "value": "I"}]])
+        result = self.analyzer.compute_mbti_batch(packed)
+        self.assertEqual(result["type"][0], "ISTJ")
+        self.assertEqual(result["totals"][0].tolist(), [2, 0, 0, 0])
+        self.assertEqual(result["strength"][0].tolist(), ["보통", "측정 불가", "측정 불가", "측정 불가"])
+
+
 class TestQuestionManager(unittest.TestCase):
     
     def setUp(self):
@@ -159,8 +242,9 @@ class TestQuestionManager(unittest.TestCase):
             
             self.assertEqual(len(result["questions"]), 4)  # 각 축당 2개
             self.assertEqual(len(result["ids"]), 4)
-            self.assertIn("EI", result["used_prompts"])
-            self.assertIn("SN", result["used_prompts"])
+            self.assertIn("EI", result["used"])
+            self.assertIn("SN", result["used"])
+            self.assertEqual(bin(result["used"]["EI"]).count("1"), 2)
             
         finally:
             # 원래 설정 복원
@@ -0,0 +1,247 @@
+# tests/test_question_bank.py
+"""
+질문 은행 테스트
+"""
+
+import unittest
+import tempfile
+import json
+import os
+from unittest import mock
+from src.question_bank import (QuestionBank, BankWatcher, content_version, get_shared_bank,
+                               iter_qids, mask_from_qids)
+from src.bank_format import CompiledQuestionBank, compile_bank_file, write_compiled_bank
+from src.question_manager import QuestionManager
+from helpers import make_data
+
+
+class TestQuestionBank(unittest.TestCase):
+
+    def setUp(self):
+        self.test_data = {
+            "EI": [
+                {
+                    "audience": "general",
+                    "prompt": "테스트 질문 1",
+                    "A": {"label": "선택지 A", "value": "E"},
+                    "B": {"label": "선택지 B", "value": "I"}
+                },
+                {
+                    "audience": "senior",
+                    "prompt": "시니어 질문 1",
+                    "A": {"label": "선택지 A", "value": "E"},
+                    "B": {"label": "선택지 B", "value": "I"}
+                },
+                {
+                    "audience": "both",
+                    "prompt": "공통 질문 1",
+                    "A": {"label": "선택지 A", "value": "E"},
+                    "B": {"label": "선택지 B", "value": "I"}
+                }
+            ],
+            "SN": [
+                {
+                    "prompt": "audience 없는 질문",
+                    "A": {"label": "선택지 A", "value": "S"},
+                    "B": {"label": "선택지 B", "value": "N"}
+                }
+            ]
+        }
+        self.bank = QuestionBank(self.test_data)
+    
+    def test_pool_matches_filter(self):
+        """미리 인덱싱된 풀이 기존 필터 결과와 같은지 테스트"""
+        manager = QuestionManager()
+        
+        for audience in ["general", "senior"]:
+            expected = manager.filter_by_audience(self.test_data, audience)
+            pool = self.bank.pool(audience)
+            for axis in manager.config.AXES:
+                self.assertEqual(
+                    [q["prompt"] for q in pool[axis]],
+                    [q["prompt"] for q in expected[axis]]
+                )
+    
+    def test_filter_uses_shared_index(self):
+        """QuestionBank를 넘기면 같은 인덱스 객체를 반환하는지 테스트"""
+        manager = QuestionManager()
+        filtered = manager.filter_by_audience(self.bank, "general")
+        
+        self.assertIs(filtered["EI"], self.bank.questions("general", "EI"))
+    
+    def test_bank_is_read_only(self):
+        """질문 데이터가 수정 불가능한지 테스트"""
+        question = self.bank["EI"][0]
+        
+        with self.assertRaises(TypeError):
+            question["prompt"] = "변경"
+        with self.assertRaises(TypeError):
+            question["A"]["value"] = "I"
+        
+        # 원본 데이터 변경이 은행에 영향을 주지 않아야 함
+        self.test_data["EI"][0]["prompt"] = "원본 변경"
+        self.assertEqual(self.bank["EI"][0]["prompt"], "테스트 질문 1")
+    
+    def test_unknown_audience(self):
+        """설정에 없는 대상도 태그 없는/both 문항으로 풀이 구성되는지 테스트"""
+        pool = self.bank.pool("child")
+        
+        self.assertEqual([q["prompt"] for q in pool["EI"]], ["공통 질문 1"])
+        self.assertEqual(len(pool["SN"]), 1)
+
+    
+    def test_pool_qid_mask(self):
+        """풀 비트마스크와 qid 조회가 일치하는지 테스트"""
+        pool = self.bank.questions("senior", "EI")
+        
+        # EI: 0=general, 1=senior, 2=both → senior 풀은 qid 1, 2
+        self.assertEqual(sorted(iter_qids(pool.mask)), [1, 2])
+        self.assertEqual(pool.by_qid(2)["prompt"], "공통 질문 1")
+        self.assertEqual(mask_from_qids([0, 9, 3]), (1 << 0) | (1 << 3) | (1 << 9))
+        
+    def test_additional_questions_skip_used(self):
+        """사용 비트가 켜진 문항은 추가 질문으로 다시 나오지 않는지 테스트"""
+        manager = QuestionManager()
+        pool = self.bank.pool("senior")
+        used = {axis: 0 for axis in manager.config.AXES}
+        used["EI"] = 1 << 1
+        
+        additional = manager.generate_additional_questions(pool, "EI", used, count=1)
+        
+        self.assertEqual([q["prompt"] for q in additional], ["공통 질문 1"])
+        self.assertEqual(used["EI"], (1 << 1) | (1 << 2))
+        self.assertEqual(manager.generate_additional_questions(pool, "EI", used), [])
+        
+    def test_compiled_bank_round_trip(self):
+        """컴파일된 은행이 JSON 은행과 같은 풀을 돌려주는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "bank.qbank")
+            write_compiled_bank(self.test_data, path)
+            compiled = QuestionBank.from_file(path)
+            
+            self.assertIsInstance(compiled, CompiledQuestionBank)
+            for audience in ["general", "senior", "child"]:
+                for axis in compiled.config.AXES:
+                    self.assertEqual(
+                        [self._plain(q) for q in compiled.questions(audience, axis)],
+                        [self._plain(q) for q in self.bank.questions(audience, axis)]
+                    )
+            compiled.close()
+            
+    def test_compile_rejects_invalid_pole(self):
+        """축과 맞지 않는 극 값은 컴파일 단계에서 거부되는지 테스트"""
+        self.test_data["SN"][0]["A"]["value"] = "E"
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                write_compiled_bank(self.test_data, os.path.join(tmp_dir, "bank.qbank"))
+                
+    def test_compile_bank_file_validates_and_stores_version(self):
+        """원본을 검증한 뒤에만 기록하고, 헤더의 버전은 같은 원본을 JSON으로 연 은행과 같음"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source, output = os.path.join(tmp_dir, "bank.json"), os.path.join(tmp_dir, "bank.qbank")
+            with open(source, "w", encoding="utf-8") as f:
+                json.dump(make_data(5), f, ensure_ascii=False)
+            size, version = compile_bank_file(source, output)
+            
+            self.assertEqual(size, os.path.getsize(output))
+            self.assertEqual(version, QuestionBank.from_file(source).version)
+            with mock.patch("src.bank_format.content_version") as hashed:
+                compiled = QuestionBank.from_file(output)
+            hashed.assert_not_called()
+            self.assertEqual(compiled.version, version)
+            compiled.close()
+            
+            data = make_data(5)
+            data["SN"][0]["prompt"] = ""
+            with open(source, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.remove(output)
+            with self.assertRaises(ValueError):
+                compile_bank_file(source, output)
+            self.assertFalse(os.path.exists(output))
+            
+    @staticmethod
+    def _plain(question):
+        return {k: dict(v) if k in ("A", "B") else v for k, v in question.items()}
+
+
+class TestBankWatcher(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "bank.json")
+        self._write(["첫 질문", "둘째 질문"])
+        
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        
+    def _write(self, prompts, mtime_ns=None):
+        data = {
+            axis: [
+                {
+                    "prompt": f"{axis} {prompt}",
+                    "A": {"label": "선택지 A", "value": axis[0]},
+                    "B": {"label": "선택지 B", "value": axis[1]}
+                }
+                for prompt in prompts
+            ]
+            for axis in ["EI", "SN", "TF", "JP"]
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+            
+    def test_reload_swaps_bank(self):
+        """파일 변경 시 새 은행으로 교체되고 기존 참조는 유지되는지 테스트"""
+        old_bank = get_shared_bank(self.path)
+        watcher = BankWatcher(os.path.abspath(self.path), interval=60)
+        
+        self._write(["새 질문 1", "새 질문 2", "새 질문 3"], mtime_ns=10**18)
+        self.assertTrue(watcher.check_once())
+        
+        new_bank = get_shared_bank(self.path)
+        self.assertIsNot(new_bank, old_bank)
+        self.assertEqual(len(new_bank["EI"]), 3)
+        # 진행 중인 세션이 쥐고 있던 은행은 그대로
+        self.assertEqual(len(old_bank["EI"]), 2)
+        
+        # 변경이 없으면 다시 로드하지 않음
+        self.assertFalse(watcher.check_once())
+        
+    def test_edit_before_watch_starts(self):
+        """공유 은행 로드와 감시 시작 사이에 바뀐 파일도 첫 확인에서 교체, 내용이 같으면 유지"""
+        old_bank = get_shared_bank(self.path)
+        unchanged = BankWatcher(os.path.abspath(self.path), interval=60)
+        self.assertFalse(unchanged.check_once())
+        self.assertIs(get_shared_bank(self.path), old_bank)
+        
+        self._write(["바뀐 질문 1", "바뀐 질문 2", "바뀐 질문 3"])
+        watcher = BankWatcher(os.path.abspath(self.path), interval=60)
+        self.assertTrue(watcher.check_once())
+        self.assertEqual(len(get_shared_bank(self.path)["EI"]), 3)
+        
+    def test_validated_load_reads_file_once(self):
+        """검증·파싱·버전이 모두 한 번 읽은 같은 바이트에서 나오는지 테스트"""
+        real_open = open
+        with mock.patch("builtins.open", side_effect=real_open) as opened:
+            bank = QuestionBank.from_file(self.path, validate=True)
+        self.assertEqual(opened.call_count, 1)
+        with real_open(self.path, "rb") as f:
+            self.assertEqual(bank.version, content_version(f.read()))
+            
+    def test_invalid_bank_is_ignored(self):
+        """검증에 실패한 파일은 무시하고 기존 은행을 유지하는지 테스트"""
+        old_bank = get_shared_bank(self.path)
+        watcher = BankWatcher(os.path.abspath(self.path), interval=60)
+        
+        # 축당 1문항 → 기본 2문항 요건 미달
+        self._write(["하나뿐인 질문"], mtime_ns=2 * 10**18)
+        self.assertFalse(watcher.check_once())
+        self.assertIs(get_shared_bank(self.path), old_bank)
+        self.assertIsNotNone(watcher.last_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
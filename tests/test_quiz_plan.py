@@ -0,0 +1,94 @@
+# tests/test_quiz_plan.py
+"""
+결정적 퀴즈 계획 테스트
+"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from src.question_bank import QuestionBank
+from src.question_manager import QuestionManager
+from src.quiz_plan import add_tiebreakers, build_quiz_plan, next_reserve, start_quiz
+from helpers import make_bank, make_data
+
+
+class TestQuizPlan(unittest.TestCase):
+    
+    def setUp(self):
+        self.bank = make_bank()
+        self.pools = self.bank.pool("general")
+    
+    def test_same_seed_same_plan(self):
+        """같은 시드·은행 버전이면 전역 random 상태와 무관하게 같은 계획"""
+        random.seed(1)
+        first = build_quiz_plan(self.pools, 42, "v1")
+        random.seed(2)
+        second = build_quiz_plan(make_bank().pool("general"), 42, "v1")
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, build_quiz_plan(self.pools, 43, "v1"))
+        self.assertNotEqual(first.base, build_quiz_plan(self.pools, 42, "v2").base)
+    
+    def test_same_bytes_different_mtime(self):
+        """같은 내용의 은행 파일이면 수정 시각이 달라도 같은 계획과 같은 동점 해소 문항"""
+        raw = json.dumps(make_data(), ensure_ascii=False).encode("utf-8")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            banks = []
+            for i, mtime_ns in enumerate([10**18, 2 * 10**18]):
+                path = os.path.join(tmp_dir, f"replica{i}.json")
+                with open(path, "wb") as f:
+                    f.write(raw)
+                os.utime(path, ns=(mtime_ns, mtime_ns))
+                banks.append(QuestionBank.from_file(path))
+        
+        self.assertEqual(banks[0].version, banks[1].version)
+        plans = [build_quiz_plan(bank.pool("general"), 42, bank.version) for bank in banks]
+        self.assertEqual(plans[0], plans[1])
+        
+        added = []
+        for plan in plans:
+            quiz = start_quiz(plan, "general")
+            ei_answers = iter([0, 1])  # EI 축만 1:1 동점
+            for position in range(len(quiz)):
+                quiz.set_answer(position, next(ei_answers) if quiz.item(position)[0] == "EI" else 0)
+            self.assertEqual(len(add_tiebreakers(plan, quiz)), 1)
+            added.append(list(quiz.items()))
+        self.assertEqual(added[0], added[1])
+    
+    def test_plan_shape(self):
+        plan = build_quiz_plan(self.pools, 7, "v1")
+        self.assertEqual(len(plan.base), 8)
+        for axis in ["EI", "SN", "TF", "JP"]:
+            qids = [qid for item_axis, qid in plan.base if item_axis == axis] + list(plan.reserve[axis])
+            self.assertEqual(len(qids), 6)  # 기본 2 + 예비 4 (MAX_QUESTIONS_PER_AXIS)
+            self.assertEqual(len(set(qids)), 6)
+    
+    def test_start_quiz_and_reserve(self):
+        plan = build_quiz_plan(self.pools, 7, "v1")
+        quiz = start_quiz(plan, "general")
+        self.assertEqual(quiz.seed, 7)
+        self.assertEqual(quiz.bank_version, "v1")
+        self.assertEqual([(axis, qid) for _, axis, qid, _ in quiz.items()], list(plan.base))
+        
+        for expected in plan.reserve["SN"]:
+            qid = next_reserve(plan, quiz, "SN")
+            self.assertEqual(qid, expected)
+            quiz.add_item("SN", qid, is_extra=True)
+        self.assertIsNone(next_reserve(plan, quiz, "SN"))
+    
+    def test_small_pool(self):
+        plan = build_quiz_plan(make_bank(size=3).pool("general"), 1, "v1")
+        self.assertEqual(len(plan.reserve["EI"]), 1)
+        with self.assertRaises(ValueError):
+            build_quiz_plan(make_bank(size=1).pool("general"), 1, "v1")
+    
+    def test_question_manager_uses_own_rng(self):
+        """QuestionManager에 같은 시드의 rng를 넘기면 같은 문항"""
+        first = QuestionManager(random.Random(5)).generate_base_questions(self.pools)
+        second = QuestionManager(random.Random(5)).generate_base_questions(self.pools)
+        self.assertEqual([q["qid"] for q in first["questions"]], [q["qid"] for q in second["questions"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/test_rescoring.py
+"""
+결과 재채점 테스트
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from src.mbti_analyzer import MBTIAnalyzer
+from src.rescoring import rescore_chunk, rescore_file
+from src.utils import DataUtils
+
+
+def make_record(answers, **extra):
+    model = MBTIAnalyzer().compute_mbti(answers)
+    record = DataUtils.export_results_to_dict(model, answers)
+    record.update(extra)
+    return record
+
+
+class TestRescoring(unittest.TestCase):
+    
+    def setUp(self):
+        self.answers = [
+            {"axis": "EI", "value": "I", "label": "혼자", "prompt": "주말에"},
+            {"axis": "EI", "value": "I", "label": "혼자", "prompt": "퇴근 후"},
+            {"axis": "SN", "value": "N", "label": "상상", "prompt": "여행"},
+        ]
+        self.tmp = tempfile.TemporaryDirectory()
+        
+    def tearDown(self):
+        self.tmp.cleanup()
+        
+    def test_rescore_chunk(self):
+        """재채점 결과·추가 필드 유지·오류 줄 번호"""
+        stale = make_record(self.answers, session="s1")
+        stale["mbti_type"] = "ESTJ"
+        lines = [json.dumps(stale) + "\n", "\n", "{oops\n", json.dumps({"answers": 3}) + "\n"]
+        
+        result = rescore_chunk(10, lines)
+        
+        self.assertEqual(result["records"], 1)
+        self.assertEqual(result["changed"], 1)
+        self.assertEqual([line for line, _ in result["errors"]], [12, 13])
+        record = json.loads(result["output"])
+        self.assertEqual(record["mbti_type"], "INTJ")
+        self.assertEqual(record["session"], "s1")
+        self.assertEqual(record["axis_totals"]["EI"], 2)
+        
+    def test_rescore_file_keeps_order(self):
+        """여러 조각·워커 수와 무관하게 입력 순서대로 기록"""
+        source = os.path.join(self.tmp.name, "results.jsonl")
+        output = os.path.join(self.tmp.name, "out.jsonl")
+        with open(source, "w", encoding="utf-8") as f:
+            for i in range(50):
+                f.write(json.dumps(make_record(self.answers[: 1 + i % 3], session=i), ensure_ascii=False) + "\n")
+                
+        for workers in [0, 2]:
+            stats = rescore_file(source, output, workers=workers, chunk_lines=7, max_inflight=2)
+            with open(output, "r", encoding="utf-8") as f:
+                sessions = [json.loads(line)["session"] for line in f]
+            self.assertEqual(sessions, list(range(50)))
+            self.assertEqual(stats["records"], 50)
+            self.assertEqual(stats["chunks"], 8)
+            self.assertEqual(stats["errors"], 0)
+            self.assertFalse(os.path.exists(output + ".tmp"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# tests/test_result_pages.py
+"""
+결과 페이지 캐시 테스트
+"""
+
+import unittest
+from unittest import mock
+from src.config import AppConfig
+from src.mbti_analyzer import MBTIAnalyzer
+from src.result_pages import (ResultPageCache, display_type, percent,
+                              reachable_axis_counts, render_result_markdown)
+from src.ui_components import UIComponents
+
+
+def make_counts(ei=(2, 0), sn=(0, 2), tf=(2, 1), jp=(1, 1)):
+    return {"EI": ei, "SN": sn, "TF": tf, "JP": jp}
+
+
+class TestResultPages(unittest.TestCase):
+    
+    def test_display_type_and_percent(self):
+        self.assertEqual(display_type(make_counts()), "ENT(JP)")
+        self.assertEqual(percent(2, 1), (67, 33))
+        self.assertEqual(percent(0, 0), (0, 0))
+    
+    def test_render_markdown(self):
+        markdown = render_result_markdown("ENT(JP)", make_counts(), "ko")
+        self.assertIn("<h2>ENT(JP)</h2>", markdown)
+        self.assertIn("- TF: T 67% / F 33%  (총 3문항)", markdown)
+        self.assertIn("MBTI 의미", markdown)
+        with self.assertRaises(ValueError):
+            render_result_markdown("ESTJ", make_counts(), "xx")
+    
+    def test_cache_reuses_page(self):
+        calls = []
+        
+        def render(type_text, counts, locale):
+            calls.append((type_text, locale))
+            return f"{type_text}:{locale}"
+        
+        pages = ResultPageCache(render)
+        first = pages.page_for(make_counts(), "ko")
+        self.assertIs(pages.page_for(make_counts(), "ko"), first)
+        self.assertEqual(first.display_type, "ENT(JP)")
+        pages.page_for(make_counts(), "en")
+        pages.get("ES T/F", make_counts(), "ko")  # 같은 응답 수라도 유형 표기가 다르면 별도 페이지
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(pages.stats(), {"pages": 3, "hits": 1, "misses": 3})
+    
+    def test_warm_covers_reachable_outcomes(self):
+        self.assertEqual(reachable_axis_counts(2), [(2, 0), (1, 1), (0, 2), (2, 1), (1, 2)])
+        pages = ResultPageCache()
+        self.assertEqual(pages.warm(), 5 ** 4)
+        self.assertEqual(pages.warm(), 0)
+        pages.page_for(make_counts(), "ko")
+        self.assertEqual(pages.stats()["misses"], 5 ** 4)
+    
+    def test_maxsize_evicts_least_recent(self):
+        pages = ResultPageCache(lambda type_text, counts, locale: type_text, maxsize=2)
+        pages.page_for(make_counts(ei=(2, 0)))
+        pages.page_for(make_counts(ei=(0, 2)))
+        pages.page_for(make_counts(ei=(2, 0)))
+        pages.page_for(make_counts(ei=(2, 1)))
+        self.assertEqual(len(pages), 2)
+        pages.page_for(make_counts(ei=(2, 0)))
+        self.assertEqual(pages.stats()["misses"], 3)
+    
+    def test_ui_components_show_unresolved_axes(self):
+        """UIComponents.render_results는 미해결 축을 "(E/I)"로 표시하고 상세 결과·팁·의미를 유지하며 페이지를 재사용"""
+        values = {"EI": "EI", "SN": "SS", "TF": "TFF", "JP": "JPJ"}
+        answers = [{"axis": axis, "value": value} for axis, picked in values.items() for value in picked]
+        model = MBTIAnalyzer().compute_mbti(answers)
+        with mock.patch("src.ui_components.st") as st:
+            UIComponents().render_results(model, ["EI"], [], AppConfig())
+            UIComponents().render_results(model, ["EI"], [], AppConfig())
+            UIComponents().render_results(model, [], [], AppConfig())
+        
+        unresolved, again, resolved = [call[0][0] for call in st.markdown.call_args_list]
+        self.assertIn(">(E/I)SFJ</h2>", unresolved)
+        self.assertIn("### 📊 상세 결과", unresolved)
+        self.assertIn("**EI축**: 동점 (50.0%)", unresolved)
+        self.assertIn("### 💡 일반적인 팁", unresolved)
+        self.assertIn("### 📚 MBTI 의미", unresolved)
+        self.assertIs(again, unresolved)
+        self.assertIn(">ESFJ</h2>", resolved)
+        st.subheader.assert_called_with("📝 응답 로그")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# tests/test_resume_token.py
+"""
+재개 토큰 인코딩/디코딩 테스트
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from src.bank_format import write_compiled_bank
+from src.question_bank import QuestionBank
+from src.quiz_plan import build_quiz_plan, next_reserve, start_quiz
+from src.resume_token import encode_resume_token, decode_resume_token
+from src.session import QuizSession
+from helpers import make_bank, make_data
+
+
+def make_quiz(mode: str = "general") -> QuizSession:
+    quiz = QuizSession(mode, "v1")
+    for axis, qids in [("EI", (3, 17)), ("SN", (0, 41)), ("TF", (8, 9)), ("JP", (12, 1))]:
+        for qid in qids:
+            quiz.add_item(axis, qid)
+    quiz.add_item("TF", 30, is_extra=True)
+    for position, pole in [(0, 1), (1, 0), (2, 1), (4, 0), (5, 1), (8, 1)]:
+        quiz.set_answer(position, pole)
+    return quiz
+
+
+class TestResumeToken(unittest.TestCase):
+    
+    def test_round_trip(self):
+        quiz = make_quiz("senior")
+        restored = decode_resume_token(encode_resume_token(quiz), lambda mode: make_bank(50))
+        self.assertEqual(restored.to_dict(), quiz.to_dict())
+        self.assertEqual(list(restored.items()), list(quiz.items()))
+        self.assertTrue(restored.has_extra("TF"))
+    
+    def test_compact(self):
+        """24문항이 모두 답해져도 URL 파라미터 하나에 수십 바이트"""
+        quiz = QuizSession("general", "v1")
+        for axis in ["EI", "SN", "TF", "JP"]:
+            for qid in range(6):
+                quiz.set_answer(quiz.add_item(axis, qid + 100), qid % 2)
+        self.assertLessEqual(len(encode_resume_token(quiz)), 64)
+        self.assertLessEqual(len(encode_resume_token(make_quiz())), 32)
+    
+    def test_empty_session(self):
+        quiz = QuizSession("general", "v1")
+        restored = decode_resume_token(encode_resume_token(quiz))
+        self.assertEqual(len(restored), 0)
+        self.assertEqual(restored.mode, "general")
+    
+    def test_bank_version_mismatch(self):
+        token = encode_resume_token(make_quiz())
+        with self.assertRaises(ValueError):
+            decode_resume_token(token, lambda mode: make_bank(50, "other-version"))
+    
+    def test_seeded_session_round_trip(self):
+        """시드 세션은 qid 없이 시드·추가 축·답변 비트만 싣고 계획으로 복원"""
+        bank = make_bank(50)
+        plan = build_quiz_plan(bank.pool("general"), 123456789, bank.version)
+        quiz = start_quiz(plan, "general")
+        for axis in ["TF", "EI", "TF"]:
+            quiz.add_item(axis, next_reserve(plan, quiz, axis), is_extra=True)
+        for position in range(0, len(quiz), 2):
+            quiz.set_answer(position, position % 3 % 2)
+        
+        token = encode_resume_token(quiz)
+        self.assertLessEqual(len(token), 24)
+        restored = decode_resume_token(token, lambda mode: bank)
+        self.assertEqual(restored.to_dict(), quiz.to_dict())
+        with self.assertRaises(ValueError):
+            decode_resume_token(token)  # 은행 없이는 계획을 만들 수 없음
+    
+    def test_replica_with_different_mtime(self):
+        """내용이 같은 은행 파일이면 수정 시각이 달라도 다른 복제본의 토큰을 받아들임"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = os.path.join(tmp_dir, "bank.json")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(make_data(50), f, ensure_ascii=False)
+            qbank_path = os.path.join(tmp_dir, "bank.qbank")
+            write_compiled_bank(make_data(50), qbank_path)
+            
+            for path in [json_path, qbank_path]:
+                copy_path = os.path.join(tmp_dir, "copy-" + os.path.basename(path))
+                shutil.copyfile(path, copy_path)
+                os.utime(path, ns=(10**18, 10**18))
+                os.utime(copy_path, ns=(2 * 10**18, 2 * 10**18))
+                
+                issuer, replica = QuestionBank.from_file(path), QuestionBank.from_file(copy_path)
+                self.assertEqual(issuer.version, replica.version)
+                plan = build_quiz_plan(issuer.pool("general"), 42, issuer.version)
+                quiz = start_quiz(plan, "general")
+                quiz.set_answer(0, 1)
+                
+                restored = decode_resume_token(encode_resume_token(quiz), lambda mode: replica)
+                self.assertEqual(restored.to_dict(), quiz.to_dict())
+                for bank in (issuer, replica):
+                    if hasattr(bank, "close"):
+                        bank.close()
+    
+    def test_corrupted_token(self):
+        token = encode_resume_token(make_quiz())
+        flipped = token[:5] + ("A" if token[5] != "A" else "B") + token[6:]
+        for bad in [flipped, token[:-3], "", "!!!", token + "x"]:
+            with self.assertRaises(ValueError):
+                decode_resume_token(bad)
+    
+    def test_forged_qid_rejected(self):
+        """체크섬이 맞아도 대상 풀에 없는 문항(범위 밖·다른 대상)은 거부"""
+        data = make_data(50)
+        data["EI"][5]["audience"] = "senior"
+        bank = QuestionBank(data, version="v1")
+        for qid in [200, 5]:
+            forged = QuizSession("general", "v1")
+            forged.add_item("EI", qid)
+            with self.assertRaises(ValueError):
+                decode_resume_token(encode_resume_token(forged), lambda mode: bank)
+        
+        senior = QuizSession("senior", "v1")
+        senior.add_item("EI", 5)
+        restored = decode_resume_token(encode_resume_token(senior), lambda mode: bank)
+        self.assertEqual(restored.item(0)[1], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+# tests/test_sampler.py
+"""
+문항 샘플러 테스트
+"""
+
+import random
+import unittest
+from src.question_bank import QuestionPool
+from src.sampler import LazyPermutation, QuestionSampler
+
+
+class TestLazyPermutation(unittest.TestCase):
+
+    def test_full_permutation(self):
+        """끝까지 꺼내면 0..n-1이 정확히 한 번씩 나오는지 테스트"""
+        perm = LazyPermutation(50, random.Random(7))
+        values = [perm.next() for _ in range(50)]
+        
+        self.assertEqual(sorted(values), list(range(50)))
+        self.assertIsNone(perm.next())
+    
+    def test_sparse_memory(self):
+        """큰 n에서도 꺼낸 개수만큼만 기록하는지 테스트"""
+        perm = LazyPermutation(10**9, random.Random(1))
+        for _ in range(10):
+            perm.next()
+        
+        self.assertLessEqual(len(perm._swaps), 10)
+        self.assertEqual(perm.remaining, 10**9 - 10)
+
+
+class TestQuestionSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = QuestionPool({"qid": i, "prompt": f"질문 {i}"} for i in range(20))
+    
+    def test_draw_skips_used_and_never_repeats(self):
+        """사용 비트가 켜진 문항을 건너뛰고 중복 없이 뽑는지 테스트"""
+        sampler = QuestionSampler(random.Random(3))
+        used = {"EI": (1 << 0) | (1 << 5)}
+        
+        first = sampler.draw(self.pool, "EI", used, 2)
+        rest = sampler.draw(self.pool, "EI", used, 100)
+        qids = [q["qid"] for q in first + rest]
+        
+        self.assertEqual(len(first), 2)
+        self.assertEqual(sorted(qids), [i for i in range(20) if i not in (0, 5)])
+        self.assertEqual(used["EI"], (1 << 20) - 1)
+        self.assertEqual(sampler.draw(self.pool, "EI", used, 1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
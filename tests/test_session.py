@@ -0,0 +1,162 @@
+# tests/test_session.py
+"""
+압축 세션 모델 테스트
+"""
+
+import random
+import unittest
+from src.mbti_analyzer import MBTIAnalyzer
+from src.session import QuizSession
+from helpers import make_bank
+
+
+class TestQuizSession(unittest.TestCase):
+    
+    def setUp(self):
+        self.bank = make_bank(5)
+        self.pools = self.bank.pool("general")
+        self.quiz = QuizSession("general", self.bank.version)
+        for axis in ["EI", "SN", "TF", "JP"]:
+            self.quiz.add_item(axis, 3)
+            self.quiz.add_item(axis, 1)
+            
+    def test_items_and_lookup(self):
+        """위치 → (축, qid) → 은행 질문 조회"""
+        self.assertEqual(len(self.quiz), 8)
+        self.assertEqual(self.quiz.item(2), ("SN", 3, False))
+        self.assertEqual(self.quiz.question(self.pools, 2)["prompt"], "SN 질문 3")
+        position = self.quiz.add_item("SN", 4, is_extra=True)
+        self.assertTrue(self.quiz.has_extra("SN"))
+        self.assertFalse(self.quiz.has_extra("EI"))
+        self.assertEqual(self.quiz.used_masks()["SN"], 0b11010)
+        self.assertEqual(self.quiz.item(position), ("SN", 4, True))
+        
+    def test_answers_and_model(self):
+        """답 기록·변경·삭제와 compute_mbti 호환 결과"""
+        self.assertTrue(self.quiz.set_answer(0, 0))
+        self.assertFalse(self.quiz.set_answer(0, 0))
+        self.quiz.set_answer(1, 1)
+        self.assertEqual(self.quiz.counts("EI"), (1, 1))
+        self.assertEqual(self.quiz.diff("EI"), 0)
+        self.quiz.set_answer(1, 0)
+        self.assertEqual(self.quiz.counts("EI"), (2, 0))
+        self.assertTrue(self.quiz.clear_answer(1))
+        self.assertFalse(self.quiz.clear_answer(1))
+        self.assertIsNone(self.quiz.answer(1))
+        self.assertFalse(self.quiz.is_complete())
+        
+        answers = []
+        for position in range(len(self.quiz)):
+            pole = position % 3 == 0
+            self.quiz.set_answer(position, int(pole))
+            axis = self.quiz.item(position)[0]
+            answers.append({"axis": axis, "value": self.bank.config.POLES[axis][int(pole)]})
+        self.assertTrue(self.quiz.is_complete())
+        self.assertEqual(self.quiz.answered_count, 8)
+        
+        analyzer = MBTIAnalyzer()
+        self.assertEqual(self.quiz.model(), analyzer.compute_mbti(answers))
+        
+    def test_model_uses_app_tiebreak_rule(self):
+        """동점 축에 추가 문항 하나(2+1 규칙): model()은 답한 3문항만 센다
+        
+        decode_session은 적응형 2/4/6 규칙의 표라서 앱 세션의 결과로 쓰지 않는다 (OUTCOME_TABLES 주석 참고).
+        """
+        for position, pole in enumerate([0, 1, 0, 0, 1, 1, 0, 0]):
+            self.quiz.set_answer(position, pole)
+        extra = self.quiz.add_item("EI", 4, is_extra=True)
+        self.quiz.set_answer(extra, 0)  # EI: E, I, E
+        
+        model = self.quiz.model()
+        self.assertEqual(model["type"], "ESFJ")
+        self.assertEqual((model["count"]["E"], model["count"]["I"], model["totals"]["EI"]), (2, 1, 3))
+        
+        # 적응형 표는 동점 뒤 두 문항을 보므로 답하지 않은 네 번째 비트까지 E로 셈
+        decoded = MBTIAnalyzer().decode_session(self.quiz.axis_masks())
+        self.assertEqual((decoded["count"]["E"], decoded["used"]["EI"]), (3, 4))
+        # 기본 문항에서 판정이 끝난 축은 두 결과가 같음
+        for axis, (pole_a, pole_b) in [("SN", ("S", "N")), ("TF", ("T", "F")), ("JP", ("J", "P"))]:
+            self.assertEqual((decoded["count"][pole_a], decoded["count"][pole_b]),
+                             (model["count"][pole_a], model["count"][pole_b]))
+        
+    def test_round_trip(self):
+        """to_dict/from_dict 복원"""
+        self.quiz.set_answer(3, 1)
+        self.quiz.add_item("JP", 0, is_extra=True)
+        restored = QuizSession.from_dict(self.quiz.to_dict())
+        self.assertEqual(list(restored.items()), list(self.quiz.items()))
+        self.assertEqual(restored.answer(3), 1)
+        self.assertEqual(restored.bank_version, "v1")
+        # 복원 후 추가한 문항도 축 내 순번이 이어짐
+        position = restored.add_item("JP", 2, is_extra=True)
+        restored.set_answer(position, 1)
+        self.assertEqual(restored.counts("JP"), (0, 1))
+        self.assertGreater(restored.nbytes(), 0)
+    
+    def test_sampler_created_only_when_used(self):
+        """샘플러(난수 상태 포함)는 시드 없는 추가 문항 추첨에서 처음 쓸 때 만들고 nbytes에 포함"""
+        quiz = QuizSession("general", "v1", seed=7)
+        before = quiz.nbytes()
+        self.assertLess(before, 1024)
+        quiz.sampler.draw(self.bank["EI"], "EI", quiz.used_masks(), 1)
+        self.assertGreater(quiz.nbytes() - before, 2500)
+
+
+
+class TestSessionCounters(unittest.TestCase):
+    """IncrementalScorer를 대신하는 QuizSession의 축별 비트필드 집계"""
+    
+    def setUp(self):
+        self.analyzer = MBTIAnalyzer()
+        self.poles = self.analyzer.config.POLES
+        self.quiz = QuizSession("general", "v1")
+        for qid in range(5):
+            for axis in self.analyzer.config.AXES:
+                self.quiz.add_item(axis, qid)
+    
+    def test_matches_compute_mbti(self):
+        """무작위 답변/변경/삭제 후에도 model()이 compute_mbti와 같은 결과"""
+        rnd = random.Random(7)
+        answers = {}
+        for step in range(500):
+            position = rnd.randrange(len(self.quiz))
+            if rnd.random() < 0.2:
+                answers.pop(position, None)
+                self.quiz.clear_answer(position)
+            else:
+                axis = self.quiz.item(position)[0]
+                pole = rnd.randrange(2)
+                answers[position] = {"axis": axis, "value": self.poles[axis][pole]}
+                self.quiz.set_answer(position, pole)
+            self.assertEqual(self.quiz.model(), self.analyzer.compute_mbti(list(answers.values())))
+            self.assertEqual(self.quiz.answered_count, len(answers))
+    
+    def test_change_answer(self):
+        """같은 문항의 답 변경은 이전 극을 빼고 새 극을 더함"""
+        self.assertTrue(self.quiz.set_answer(0, 0))
+        self.assertFalse(self.quiz.set_answer(0, 0))
+        self.assertTrue(self.quiz.set_answer(0, 1))
+        self.assertEqual(self.quiz.counts("EI"), (0, 1))
+        self.assertEqual(self.quiz.total("EI"), 1)
+        self.assertEqual(self.quiz.answered_count, 1)
+    
+    def test_clear_and_tie(self):
+        """삭제와 동점 판정"""
+        self.quiz.set_answer(0, 0)
+        self.quiz.set_answer(4, 1)
+        self.assertEqual(self.quiz.diff("EI"), 0)
+        self.assertTrue(self.quiz.clear_answer(4))
+        self.assertFalse(self.quiz.clear_answer(4))
+        self.assertEqual(self.quiz.diff("EI"), 1)
+    
+    def test_usable_as_model(self):
+        """model()은 MBTIAnalyzer 메서드에 그대로 전달 가능"""
+        self.quiz.set_answer(0, 0)
+        self.quiz.set_answer(4, 1)
+        model = self.quiz.model()
+        self.assertTrue(self.analyzer.needs_more_questions_after_base("EI", model))
+        self.assertEqual(self.analyzer.get_unresolved_axes(model), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
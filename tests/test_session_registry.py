@@ -0,0 +1,95 @@
+# tests/test_session_registry.py
+"""
+세션 레지스트리(TTL/메모리 예산 내보내기) 테스트
+"""
+
+import unittest
+from src.session_registry import SessionRegistry
+from src.session_store import MemorySessionStore
+from helpers import make_quiz
+
+
+class FakeClock:
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSessionRegistry(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = MemorySessionStore()
+        self.registry = SessionRegistry(self.store, ttl=60, max_bytes=10 ** 9, clock=self.clock)
+    
+    def test_touch_tracks_size_and_persists_changes(self):
+        quiz = make_quiz()
+        self.assertTrue(self.registry.touch("t1", quiz))
+        self.assertFalse(self.registry.touch("t1", quiz))  # 그대로면 저장 생략
+        self.assertEqual(self.registry.stats()["live_bytes"], quiz.nbytes())
+        quiz.set_answer(1, 1)
+        self.assertTrue(self.registry.touch("t1", quiz))
+        self.assertEqual(self.store.load("t1")["quiz"], quiz.to_dict())
+    
+    def test_idle_sessions_expire_and_revive(self):
+        """TTL이 지나면 메모리에서 해제되고 다음 요청 때 저장소에서 복원"""
+        idle, active = make_quiz(1), make_quiz(0)
+        self.registry.put("idle", idle)
+        idle_bytes = idle.nbytes()
+        self.clock.now = 30
+        self.registry.touch("active", active)
+        self.clock.now = 61
+        self.registry.touch("active", active)
+        
+        self.assertNotIn("idle", self.registry)
+        self.assertIn("active", self.registry)
+        stats = self.registry.stats()
+        self.assertEqual(stats["expired"], 1)
+        self.assertEqual(stats["reclaimed_bytes"], idle_bytes)
+        self.assertEqual(stats["live_sessions"], 1)
+        
+        revived = self.registry.get("idle")
+        self.assertIsNot(revived, idle)
+        self.assertEqual(revived.to_dict(), idle.to_dict())
+        self.assertEqual(self.registry.stats()["revived"], 1)
+    
+    def test_memory_budget_evicts_least_recent(self):
+        size = make_quiz().nbytes()
+        self.registry.max_bytes = size * 2
+        for token in ["a", "b", "c"]:
+            self.registry.touch(token, make_quiz())
+        self.assertEqual(len(self.registry), 2)
+        self.assertNotIn("a", self.registry)
+        self.assertEqual(self.registry.stats()["budget_evicted"], 1)
+        self.assertIsNotNone(self.store.load("a"))
+    
+    def test_budget_keeps_latest_session(self):
+        self.registry.max_bytes = 1
+        self.registry.touch("a", make_quiz())
+        self.registry.touch("b", make_quiz())
+        self.assertEqual(list(self.registry._entries), ["b"])
+    
+    def test_touch_reregisters_evicted_session(self):
+        """실행 도중 내보내진 세션은 끝날 때 다시 등록"""
+        quiz = make_quiz()
+        self.registry.touch("t1", quiz)
+        self.clock.now = 100
+        self.registry.sweep()
+        self.assertNotIn("t1", self.registry)
+        quiz.set_answer(1, 1)
+        self.registry.touch("t1", quiz)
+        self.assertIs(self.registry.get("t1"), quiz)
+        self.assertEqual(self.store.load("t1")["quiz"], quiz.to_dict())
+    
+    def test_drop_and_unknown_token(self):
+        self.registry.touch("t1", make_quiz())
+        self.registry.drop("t1")
+        self.assertIsNone(self.registry.get("t1"))
+        self.assertEqual(self.registry.stats()["live_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# tests/test_session_store.py
+"""
+세션 저장소 테스트
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from src.session import QuizSession
+from src.session_store import MemorySessionStore, SessionStore, SQLiteSessionStore, new_session_token
+from helpers import make_state
+
+
+class TestMemorySessionStore(unittest.TestCase):
+    
+    def test_round_trip_is_a_copy(self):
+        """저장 후 원본을 바꿔도 저장된 상태는 그대로"""
+        store = MemorySessionStore()
+        state = make_state()
+        store.save("t1", state)
+        state["mode"] = "senior"
+        self.assertEqual(store.load("t1")["mode"], "general")
+        self.assertIsNone(store.load("missing"))
+        store.delete("t1")
+        self.assertIsNone(store.load("t1"))
+    
+    def test_tokens_are_unique(self):
+        self.assertEqual(len({new_session_token() for _ in range(100)}), 100)
+
+
+class TestSQLiteSessionStore(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sessions.sqlite3")
+        # 긴 주기로 두고 flush()를 직접 호출해 기록 시점을 제어
+        self.store = SQLiteSessionStore(self.path, flush_interval=60)
+    
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+    
+    def test_pending_save_is_readable_before_flush(self):
+        self.store.save("t1", make_state(1))
+        self.assertEqual(self.store.flush_count, 0)
+        self.assertEqual(self.store.load("t1"), make_state(1))
+    
+    def test_saves_coalesce_per_token(self):
+        """같은 토큰의 연속 저장은 마지막 상태 하나만 기록"""
+        for answer in [0, 1, 0, 1]:
+            self.store.save("t1", make_state(answer))
+        self.store.save("t2", make_state(0))
+        self.store.flush()
+        self.assertEqual(self.store.flush_count, 1)
+        self.assertEqual(self.store.written_count, 2)
+        self.assertEqual(self.store.load("t1"), make_state(1))
+    
+    def test_survives_reopen(self):
+        """재시작(새 연결) 후에도 상태 복원"""
+        self.store.save("t1", make_state(1))
+        self.store.close()
+        self.store = SQLiteSessionStore(self.path, flush_interval=60)
+        restored = QuizSession.from_dict(self.store.load("t1")["quiz"])
+        self.assertEqual(restored.answer(0), 1)
+        self.assertEqual(len(restored), 8)
+    
+    def test_delete(self):
+        self.store.save("t1", make_state())
+        self.store.flush()
+        self.store.delete("t1")
+        self.assertIsNone(self.store.load("t1"))
+        self.store.flush()
+        self.assertIsNone(self.store.load("t1"))
+    
+    def test_background_flush(self):
+        store = SQLiteSessionStore(os.path.join(self.tmp.name, "bg.sqlite3"), flush_interval=0.01)
+        try:
+            store.save("t1", make_state())
+            deadline = time.time() + 5
+            while store.flush_count == 0 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(store.written_count, 1)
+        finally:
+            store.close()
+    
+    def test_purge_older_than(self):
+        self.store.save("t1", make_state())
+        self.assertEqual(self.store.purge_older_than(3600), 0)
+        self.assertEqual(self.store.purge_older_than(-1), 1)
+        self.assertIsNone(self.store.load("t1"))
+    
+    def test_background_purge(self):
+        """기록 스레드가 purge_interval마다 ttl보다 오래된 세션을 지움"""
+        store = SQLiteSessionStore(os.path.join(self.tmp.name, "purge.sqlite3"), flush_interval=60,
+                                   ttl=0.05, purge_interval=0.01)
+        try:
+            store.save("t1", make_state())
+            store.flush()
+            deadline = time.time() + 5
+            while store.purged_count == 0 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(store.purged_count, 1)
+            self.assertIsNone(store.load("t1"))
+        finally:
+            store.close()
+    
+    def test_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            SessionStore()
+
+
+if __name__ == "__main__":
+    unittest.main()
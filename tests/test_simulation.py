@@ -0,0 +1,108 @@
+# tests/test_simulation.py
+"""
+종료 규칙 / 응답자 시뮬레이션 테스트
+"""
+
+import unittest
+import numpy as np
+from src.mbti_analyzer import OUTCOME_TABLES
+from itertools import product
+from src.policy import StoppingPolicy, evaluate_population
+from src.simulation import simulate
+
+
+class TestStoppingPolicy(unittest.TestCase):
+    
+    def test_checkpoints(self):
+        """체크포인트 목록"""
+        self.assertEqual(StoppingPolicy().checkpoints(), [2, 4, 6])
+        self.assertEqual(StoppingPolicy(base=3, step=2, max_questions=8).checkpoints(), [3, 5, 7, 8])
+        with self.assertRaises(ValueError):
+            StoppingPolicy(max_questions=0)
+            
+    def test_decide_matches_outcome_table(self):
+        """기본 규칙의 벡터화 판정이 64개 경로 결과 표와 일치"""
+        policy = StoppingPolicy()
+        masks = np.arange(1 << policy.max_questions)
+        second = (masks[:, None] >> np.arange(policy.max_questions)) & 1
+        decision, used = policy.decide(np.cumsum(1 - second, axis=1, dtype=np.int8))
+        
+        for mask, outcome in enumerate(OUTCOME_TABLES["EI"]):
+            self.assertEqual(used[mask], outcome.used)
+            expected = 0 if outcome.unresolved else (1 if outcome.token == "E" else -1)
+            self.assertEqual(decision[mask], expected)
+            
+    def test_margin(self):
+        """margin 2면 1점 차이에서는 멈추지 않음"""
+        policy = StoppingPolicy(base=1, step=1, max_questions=3, margin=2)
+        # 첫 번째 극을 고른 누적 횟수: [1,1,2] → 3문항에서 2:1 판정
+        decision, used = policy.decide(np.array([[1, 1, 2], [1, 2, 3]], dtype=np.int8))
+        self.assertEqual(decision.tolist(), [1, 1])
+        self.assertEqual(used.tolist(), [3, 2])
+
+
+class TestPolicyEvaluation(unittest.TestCase):
+    
+    def enumerate_paths(self, policy, p_first):
+        """2^max_questions 경로 전수 열거 (비교 기준)"""
+        result = {"first": 0.0, "second": 0.0, "unresolved": 0.0, "expected_questions": 0.0}
+        for bits in product([1, 0], repeat=policy.max_questions):
+            prob = 1.0
+            for bit in bits:
+                prob *= p_first if bit else 1.0 - p_first
+            decision, used = policy.decide(np.cumsum([bits], axis=1, dtype=np.int8))
+            key = {1: "first", -1: "second", 0: "unresolved"}[int(decision[0])]
+            result[key] += prob
+            result["expected_questions"] += prob * int(used[0])
+        return result
+        
+    def test_dp_matches_enumeration(self):
+        """DP 결과가 64개(및 그 이상) 경로 열거와 일치"""
+        for policy in [StoppingPolicy(), StoppingPolicy(base=1, step=3, max_questions=8, margin=2)]:
+            for p_first in [0.5, 0.7, 0.93]:
+                expected = self.enumerate_paths(policy, p_first)
+                result = policy.evaluate(p_first)
+                for key, value in expected.items():
+                    self.assertAlmostEqual(result[key], value, places=12)
+                self.assertAlmostEqual(sum(result["stop_at"].values()), 1.0, places=12)
+                
+    def test_fair_coin_default_rule(self):
+        """p=0.5에서 기본 규칙: 2문항 종료 1/2, 미해결 1/8, 기대 3.5문항"""
+        result = StoppingPolicy().evaluate(0.5)
+        self.assertEqual(result["stop_at"], {2: 0.5, 4: 0.25, 6: 0.25})
+        self.assertAlmostEqual(result["unresolved"], 0.125)
+        self.assertAlmostEqual(result["expected_questions"], 3.5)
+        
+    def test_long_policy_and_population(self):
+        """축당 20문항 규칙도 계산되고, 모집단 값이 시뮬레이션과 근사"""
+        long_policy = StoppingPolicy(max_questions=20, margin=2).evaluate(0.6)
+        self.assertAlmostEqual(long_policy["first"] + long_policy["second"] + long_policy["unresolved"], 1.0)
+        
+        exact = evaluate_population(StoppingPolicy(), noise=1.0)
+        simulated = simulate(respondents=200000, noise=1.0, seed=3, workers=0)
+        self.assertAlmostEqual(simulated["axes"]["EI"]["accuracy"], exact["accuracy"], delta=0.01)
+        self.assertAlmostEqual(simulated["axes"]["EI"]["mean_questions"], exact["mean_questions"], delta=0.02)
+
+
+class TestSimulation(unittest.TestCase):
+    
+    def test_reproducible_across_workers(self):
+        """같은 seed·chunk_size면 워커 수와 무관하게 같은 결과"""
+        inline = simulate(respondents=5000, seed=7, workers=0, chunk_size=2000)
+        pooled = simulate(respondents=5000, seed=7, workers=2, chunk_size=2000)
+        self.assertEqual(inline["respondents"], 5000)
+        self.assertEqual(inline["axes"], pooled["axes"])
+        self.assertEqual(inline["accuracy"], pooled["accuracy"])
+        
+    def test_low_noise(self):
+        """잡음이 거의 없으면 2문항에서 거의 모두 정확히 판정"""
+        result = simulate(respondents=20000, noise=0.01, seed=1, workers=0)
+        for stats in result["axes"].values():
+            self.assertGreater(stats["accuracy"], 0.99)
+            self.assertLess(stats["mean_questions"], 2.05)
+        self.assertAlmostEqual(result["mean_questions"],
+                               sum(s["mean_questions"] for s in result["axes"].values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
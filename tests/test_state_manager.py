@@ -0,0 +1,63 @@
+# tests/test_state_manager.py
+"""
+StateManager 테스트 (퀴즈 상태는 세션 레지스트리 하나에만 보관)
+"""
+
+import types
+import unittest
+from unittest import mock
+from src.session_registry import SessionRegistry
+from src.session_store import MemorySessionStore
+from src.utils import LoggingUtils, StateManager
+
+
+class _SessionState(dict):
+    """st.session_state 대용 (속성·키 접근 모두 지원)"""
+    
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+    
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+class TestStateManager(unittest.TestCase):
+    
+    def setUp(self):
+        self.session_state = _SessionState(mode="senior")
+        self.registry = SessionRegistry(MemorySessionStore())
+        for patcher in [mock.patch("src.utils.st", types.SimpleNamespace(session_state=self.session_state)),
+                        mock.patch("src.utils.get_session_registry", lambda: self.registry)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.manager = StateManager()
+    
+    def test_quiz_lives_in_registry(self):
+        """빈 레지스트리·빈 세션도 그대로 사용 (len()이 0이어도 새로 만들지 않음)"""
+        quiz = self.manager.quiz
+        self.assertEqual(quiz.mode, "senior")
+        self.assertIs(self.registry.get(self.session_state.token), quiz)
+        self.assertIs(self.manager.quiz, quiz)
+        self.assertNotIn("quiz", self.session_state)
+    
+    def test_progress_and_cache_round_trip(self):
+        quiz = self.manager.quiz
+        quiz.set_answer(quiz.add_item("EI", 0), 1)
+        quiz.add_item("EI", 1, is_extra=True)
+        self.assertEqual(self.manager.get_current_progress()["total_answered"], 1)
+        self.assertEqual(self.manager.get_answers_by_axis("EI"), [{"axis": "EI", "value": "I"}])
+        
+        cached = self.manager.save_state_to_cache()
+        self.manager.reset_state()
+        self.assertEqual(len(self.manager.quiz), 0)
+        self.manager.load_state_from_cache(cached)
+        restored = self.registry.get(self.session_state.token)
+        self.assertEqual(restored.to_dict(), quiz.to_dict())
+        self.assertEqual(LoggingUtils.get_session_summary()["extra_questions_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()